@@ -0,0 +1,100 @@
+"""
+In-process TTL cache for read-heavy endpoints.
+
+Entries expire after their TTL. Expired entries are still served for a
+short grace window while a background task recomputes them. Writes call
+``invalidate_prefix`` so cached aggregates never outlive the data they
+were computed from.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Any, float]] = {}
+        self._refreshing: dict[str, asyncio.Task] = {}
+        # Bumped on every invalidation so in-flight computations cannot store stale results
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get_entry(self, key: str) -> tuple[Any, float] | None:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any, ttl: float, generation: int | None = None) -> None:
+        if generation is not None and generation != self._generation:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+
+    def invalidate(self, key: str) -> None:
+        self._generation += 1
+        self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        self._generation += 1
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def refresh_in_background(self, key: str, compute: Callable[[], Awaitable[Any]], ttl: float) -> None:
+        if key in self._refreshing:
+            return
+
+        async def _refresh() -> None:
+            generation = self._generation
+            try:
+                self.set(key, await compute(), ttl, generation)
+            except Exception as exc:
+                logger.warning(f"Background refresh failed for cache key {key}: {exc}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(_refresh())
+
+
+cache = TTLCache()
+
+
+def cached(ttl: float, key: Callable[..., str], grace: float | None = None):
+    """
+    Cache the result of an async function under ``key(*args, **kwargs)``.
+
+    Within ``grace`` seconds after expiry the stale value is returned and
+    recomputed in the background (defaults to ``ttl``).
+    """
+    stale_window = ttl if grace is None else grace
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            entry = cache.get_entry(cache_key)
+            if entry is not None:
+                value, expires_at = entry
+                now = time.monotonic()
+                if now < expires_at:
+                    return value
+                if now < expires_at + stale_window:
+                    cache.refresh_in_background(cache_key, lambda: func(*args, **kwargs), ttl)
+                    return value
+
+            generation = cache.generation
+            value = await func(*args, **kwargs)
+            cache.set(cache_key, value, ttl, generation)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -1,55 +1,181 @@
-from typing import Any
+import asyncio
+import re
+from typing import Any, AsyncIterator
 
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from backend.cache import cache
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db: str = "legal_metrology"
+    mongodb_max_pool_size: int = 50
+    mongodb_min_pool_size: int = 10
+    mongodb_max_idle_time_ms: int = 30000
 
 
 settings = Settings()
 
+REPORT_INDEXES = [
+    IndexModel([("risk_level", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel([("seller_id", ASCENDING), ("created_at", DESCENDING)]),
+    IndexModel([("compliance_score", ASCENDING)]),
+    IndexModel([("created_at", DESCENDING)]),
+]
+
+# Fields needed by report list views, dashboard stats and the PDF export
+REPORT_SUMMARY_FIELDS = [
+    "product_id",
+    "product_name",
+    "seller_id",
+    "risk_level",
+    "compliance_score",
+    "score",
+    "category",
+    "created_at",
+    "scraped_data.title",
+    "violations",
+]
+
+
+def _resolve_path(item: dict[str, Any], path: str) -> Any:
+    value: Any = item
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _matches(item: dict[str, Any], query: dict[str, Any]) -> bool:
+    """Evaluate the subset of Mongo query operators used by the API against a plain dict."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_matches(item, sub_query) for sub_query in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(_matches(item, sub_query) for sub_query in condition):
+                return False
+            continue
+
+        value = _resolve_path(item, key)
+        if not isinstance(condition, dict):
+            if value != condition:
+                return False
+            continue
+
+        for operator, operand in condition.items():
+            if operator == "$exists":
+                if (value is not None) != operand:
+                    return False
+            elif operator == "$options":
+                continue
+            elif value is None:
+                return False
+            elif operator == "$gte" and value < operand:
+                return False
+            elif operator == "$lte" and value > operand:
+                return False
+            elif operator == "$regex":
+                flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+                if not re.search(operand, str(value), flags):
+                    return False
+    return True
+
 
 class InMemoryCollection:
     def __init__(self) -> None:
         self._items: list[dict[str, Any]] = []
+        # product_id -> first inserted report, matching the old linear-scan semantics
+        self._by_pid: dict[str, dict[str, Any]] = {}
+
+    def _index(self, item: dict[str, Any]) -> None:
+        if (product_id := item.get("product_id")) is not None:
+            self._by_pid.setdefault(product_id, item)
 
     async def insert_one(self, item: dict[str, Any]) -> None:
         self._items.append(item)
+        self._index(item)
+
+    async def insert_many(self, items: list[dict[str, Any]]) -> None:
+        self._items.extend(items)
+        for item in items:
+            self._index(item)
 
     async def find_all(self) -> list[dict[str, Any]]:
         return self._items
 
     async def find_one(self, product_id: str) -> dict[str, Any] | None:
-        for item in self._items:
-            if item.get("product_id") == product_id:
-                return item
-        return None
+        return self._by_pid.get(product_id)
+
+    async def search(self, query: dict[str, Any], limit: int, offset: int) -> tuple[int, list[dict[str, Any]]]:
+        matched = [item for item in self._items if _matches(item, query)]
+        matched.sort(key=lambda item: item.get("created_at") or "", reverse=True)
+        return len(matched), matched[offset:offset + limit]
 
 
 class DatabaseClient:
     def __init__(self) -> None:
         self._fallback = InMemoryCollection()
-        self._collection = None
+        self._connected = False
+        # Motor clients are bound to the event loop they were created on, so keep one per loop
+        self._clients: dict[int, AsyncIOMotorClient] = {}
+
+    def _get_client(self) -> AsyncIOMotorClient:
+        loop_id = id(asyncio.get_running_loop())
+        client = self._clients.get(loop_id)
+        if client is None:
+            client = AsyncIOMotorClient(
+                settings.mongodb_url,
+                serverSelectionTimeoutMS=1500,
+                maxPoolSize=settings.mongodb_max_pool_size,
+                minPoolSize=settings.mongodb_min_pool_size,
+                maxIdleTimeMS=settings.mongodb_max_idle_time_ms,
+            )
+            self._clients[loop_id] = client
+        return client
+
+    @property
+    def _collection(self):
+        if not self._connected:
+            return None
+        return self._get_client()[settings.mongodb_db]["compliance_reports"]
 
     async def connect(self) -> None:
         try:
-            client = AsyncIOMotorClient(settings.mongodb_url, serverSelectionTimeoutMS=1500)
-            await client.server_info()
-            db = client[settings.mongodb_db]
-            self._collection = db["compliance_reports"]
+            await self._get_client().server_info()
+            self._connected = True
         except Exception:
-            self._collection = None
+            self._connected = False
+            return
+
+        try:
+            await self._collection.create_indexes(REPORT_INDEXES)
+        except Exception:
+            pass
 
     async def save_report(self, payload: dict[str, Any]) -> None:
         if self._collection is not None:
             await self._collection.insert_one(payload)
+        else:
+            await self._fallback.insert_one(payload)
+        cache.invalidate_prefix("analytics:")
+
+    async def save_many(self, payloads: list[dict[str, Any]]) -> None:
+        if not payloads:
             return
-        await self._fallback.insert_one(payload)
+        if self._collection is not None:
+            # insert_many stamps _id onto the documents; copy so callers can reuse the dicts in responses
+            await self._collection.insert_many([dict(payload) for payload in payloads], ordered=False)
+        else:
+            await self._fallback.insert_many(payloads)
+        cache.invalidate_prefix("analytics:")
 
     async def get_reports(self) -> list[dict[str, Any]]:
         if self._collection is not None:
@@ -57,6 +183,37 @@ class DatabaseClient:
             return await cursor.to_list(length=1000)
         return await self._fallback.find_all()
 
+    async def get_reports_summary(self, limit: int = 1000) -> list[dict[str, Any]]:
+        if self._collection is not None:
+            projection = {"_id": 0, **{field: 1 for field in REPORT_SUMMARY_FIELDS}}
+            cursor = self._collection.find({}, projection).batch_size(200).limit(limit)
+            return [doc async for doc in cursor]
+        return await self._fallback.find_all()
+
+    async def aggregate_reports(self, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]] | None:
+        """Run an aggregation pipeline in MongoDB; returns None when only the in-memory store is available."""
+        if self._collection is None:
+            return None
+        return await self._collection.aggregate(pipeline).to_list(length=None)
+
+    async def search_reports(
+        self, query: dict[str, Any], limit: int, offset: int
+    ) -> tuple[int, list[dict[str, Any]]]:
+        if self._collection is not None:
+            total = await self._collection.count_documents(query)
+            cursor = self._collection.find(query, {"_id": 0}).sort("created_at", DESCENDING).skip(offset).limit(limit)
+            return total, await cursor.to_list(length=limit)
+        return await self._fallback.search(query, limit, offset)
+
+    async def iter_reports(self, fields: list[str], batch_size: int = 1000) -> AsyncIterator[dict[str, Any]]:
+        if self._collection is not None:
+            projection = {"_id": 0, **{field: 1 for field in fields}}
+            async for doc in self._collection.find({}, projection).batch_size(batch_size):
+                yield doc
+            return
+        for item in list(await self._fallback.find_all()):
+            yield item
+
     async def get_product(self, product_id: str) -> dict[str, Any] | None:
         if self._collection is not None:
             return await self._collection.find_one({"product_id": product_id}, {"_id": 0})
@@ -1,10 +1,21 @@
+import asyncio
+import bisect
 import logging
+import os
+import subprocess
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Optional
 
+import aiohttp
+import anyio
+import orjson
+from cachetools import TTLCache
 from fastapi import FastAPI, File, Form, HTTPException, Query, UploadFile, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
 from backend.database import db_client
 from backend.models import BatchScanResponse, ProductInput, ScanResponse, URLAuditRequest, URLAuditResponse
@@ -20,6 +31,7 @@ from backend.services.category_audit_service import (
     CategoryAuditService,
     CategoryAnalyticsService,
     ProductCategory,
+    tag_inferred_category,
 )
 from backend.services.advanced_ocr_service import (
     AdvancedOCRService,
@@ -29,7 +41,11 @@ from backend.services.advanced_ocr_service import (
     get_advanced_ocr_service,
 )
 
-app = FastAPI(title="Legal Metrology Compliance Intelligence API", version="1.0.0")
+app = FastAPI(
+    title="Legal Metrology Compliance Intelligence API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -39,9 +55,11 @@ app.add_middleware(
         "http://localhost:5174",
         "http://127.0.0.1:5174",
     ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists (no wildcards) and cached preflights; the frontend sends no cookies
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 compliance_engine = ComplianceEngine()
@@ -54,40 +72,84 @@ validation_service = ValidationService()
 category_audit_service = CategoryAuditService(max_workers=5)
 advanced_ocr_service = get_advanced_ocr_service()
 
+# Category rules are loaded from static JSON, so their API views are built once
+product_categories = validation_service.get_available_categories()
+category_summaries = {
+    category_id: validation_service.get_category_summary(category_id)
+    for category_id in ValidationService.VALID_CATEGORIES
+}
+
+# Value -> enum lookups so category parsing is a dict hit rather than a try/except
+_AUDIT_CAT_MAP = {member.value: member for member in ProductCategory}
+_OCR_CAT_MAP = {member.value: member for member in OCRProductCategory}
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Background task storage for bulk audits
-bulk_audit_tasks: dict[str, dict] = {}
+# Background task storage for bulk audits. Running tasks are never evicted; once a task
+# finishes it moves to a cache that drops it after an hour or once the cap is reached.
+# TTLCache is not thread-safe, so guard access to both with the lock.
+running_bulk_audit_tasks: dict[str, dict] = {}
+finished_bulk_audit_tasks: TTLCache = TTLCache(maxsize=500, ttl=3600)
+bulk_audit_tasks_lock = threading.Lock()
+
+
+def finish_bulk_audit_task(task_id: str) -> None:
+    with bulk_audit_tasks_lock:
+        task = running_bulk_audit_tasks.pop(task_id, None)
+        if task is not None:
+            finished_bulk_audit_tasks[task_id] = task
+
+# Worker pool for batch scans; each scan is dominated by OCR/LLM calls that
+# release the GIL, so threads avoid pickling the engine into subprocesses.
+BATCH_SCAN_CHUNK_SIZE = 100
+scan_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="batch-scan")
+
+# OCR batches are read and recognised in sub-batches; with RapidOCR every crop of a
+# sub-batch goes through one recognition call
+OCR_BATCH_CHUNK_SIZE = 8
+
+# Image uploads are read in fixed-size chunks and rejected once they pass the cap
+UPLOAD_CHUNK_SIZE = 1 << 20
+MAX_IMAGE_UPLOAD_BYTES = 25 * UPLOAD_CHUNK_SIZE
+
+
+async def read_upload(upload: UploadFile, limit: int = MAX_IMAGE_UPLOAD_BYTES) -> bytes:
+    buffer = bytearray()
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        buffer.extend(chunk)
+        if len(buffer) > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=f"{upload.filename or 'Upload'} exceeds the {limit // UPLOAD_CHUNK_SIZE} MB limit",
+            )
+    return bytes(buffer)
 
+# Expected mandatory field counts per category for /audit/ocr confidence scoring
+_CATEGORY_FIELD_COUNT = {"food": 14, "electronics": 14, "cosmetics": 12}
+_BASE_FIELD_COUNT = 6
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    await db_client.connect()
+# Word-count breakpoints for the OCR text-length score; below the first one the score is word_count * 2
+_LENGTH_SCORE_BREAKPOINTS = (20, 50, 100)
+_LENGTH_SCORES = (0, 60, 80, 100)
 
 
-@app.get("/")
-async def root():
-    return {
-        "service": "Legal Metrology Compliance Intelligence API",
-        "status": "ok",
-        "docs": "/docs",
-    }
+def _ocr_length_score(word_count: int) -> int:
+    bucket = bisect.bisect_right(_LENGTH_SCORE_BREAKPOINTS, word_count)
+    return _LENGTH_SCORES[bucket] if bucket else word_count * 2
 
 
-@app.get("/diagnostic/ocr")
-async def diagnostic_ocr():
-    """Diagnostic endpoint to check OCR setup"""
-    import subprocess
-    
-    diagnostics = {
-        "tesseract_installed": False,
-        "tesseract_version": None,
-        "pytesseract_working": False,
-        "error": None,
-    }
-    
-    # Check if tesseract command exists
+# OCR toolchain probes fork a subprocess, so they run at startup and on a timer rather than per request
+OCR_HEALTH_REFRESH_SECONDS = 300
+
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+def _probe_tesseract() -> tuple[str | None, str | None]:
+    """Return (version, error) for the tesseract binary on PATH."""
     try:
         result = subprocess.run(
             ["tesseract", "--version"],
@@ -96,24 +158,90 @@ async def diagnostic_ocr():
             timeout=5,
         )
         if result.returncode == 0:
-            diagnostics["tesseract_installed"] = True
-            diagnostics["tesseract_version"] = result.stdout.split("\n")[0]
+            return result.stdout.split("\n")[0], None
+        return None, None
     except Exception as e:
-        diagnostics["error"] = f"Tesseract not found in PATH: {str(e)}"
-    
-    # Check if pytesseract can load
+        return None, f"Tesseract not found in PATH: {str(e)}"
+
+
+def _probe_pytesseract() -> str | None:
+    """Return an error message if pytesseract cannot run a trivial OCR call."""
     try:
         import pytesseract
         from PIL import Image
         
-        # Simple test
         img = Image.new("RGB", (100, 50), color="white")
-        text = pytesseract.image_to_string(img)
-        diagnostics["pytesseract_working"] = True
+        pytesseract.image_to_string(img)
+        return None
     except Exception as e:
-        diagnostics["error"] = f"pytesseract error: {str(e)}"
+        return f"pytesseract error: {str(e)}"
+
+
+def _probe_ocr_health() -> dict:
+    tesseract_version, tesseract_error = _probe_tesseract()
+    pytesseract_error = _probe_pytesseract()
     
-    return diagnostics
+    diagnostics = {
+        "tesseract_installed": tesseract_version is not None,
+        "tesseract_version": tesseract_version,
+        "pytesseract_working": pytesseract_error is None,
+        "error": pytesseract_error or tesseract_error,
+    }
+    health = {
+        "status": "healthy" if tesseract_error is None and cv2 is not None else "degraded",
+        "tesseract_available": tesseract_version is not None,
+        "tesseract_version": tesseract_version,
+        "opencv_available": cv2 is not None,
+        "opencv_version": cv2.__version__ if cv2 is not None else None,
+    }
+    return {"diagnostics": diagnostics, "health": health}
+
+
+async def _refresh_ocr_health_loop() -> None:
+    while True:
+        await asyncio.sleep(OCR_HEALTH_REFRESH_SECONDS)
+        try:
+            app.state.ocr_health = await asyncio.to_thread(_probe_ocr_health)
+        except Exception as e:
+            logger.warning(f"OCR health refresh failed: {e}")
+
+
+@app.on_event("startup")
+async def on_startup() -> None:
+    # Sync endpoints run on AnyIO's worker threads; the default of 40 is too low for OCR-heavy traffic
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
+    # Background tasks running in worker threads schedule database writes back onto this loop
+    app.state.loop = asyncio.get_running_loop()
+    app.state.ocr_health = await asyncio.to_thread(_probe_ocr_health)
+    app.state.ocr_health_task = asyncio.create_task(_refresh_ocr_health_loop())
+    # One pooled HTTP session for image URL fetches so keep-alive connections are reused
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=50),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+    await db_client.connect()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    app.state.ocr_health_task.cancel()
+    await app.state.http.close()
+    await advanced_ocr_service.aclose()
+
+
+@app.get("/")
+async def root():
+    return {
+        "service": "Legal Metrology Compliance Intelligence API",
+        "status": "ok",
+        "docs": "/docs",
+    }
+
+
+@app.get("/diagnostic/ocr")
+async def diagnostic_ocr():
+    """Diagnostic endpoint to check OCR setup (probed at startup, refreshed periodically)"""
+    return app.state.ocr_health["diagnostics"]
 
 
 @app.get("/favicon.ico", include_in_schema=False)
@@ -136,8 +264,8 @@ async def scan_product(
         packaging_text=packaging_text,
     )
 
-    image_bytes = await image.read() if image else None
-    result = compliance_engine.run_scan(payload, image_bytes=image_bytes)
+    image_bytes = await read_upload(image) if image else None
+    result = await compliance_engine.run_scan(payload, image_bytes)
     await reporting_service.save_result(result)
     return ScanResponse(status="success", result=result)
 
@@ -147,16 +275,23 @@ async def batch_scan(file: UploadFile = File(...)):
     if not file.filename.endswith(".csv"):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
 
-    raw = await file.read()
-    products = ingestion_service.parse_batch_csv(raw)
+    # Parse straight from the spooled upload file instead of copying the body into memory
+    products = await asyncio.to_thread(ingestion_service.parse_batch_csv_stream, file.file)
 
     results = []
-    for product in products:
-        result = compliance_engine.run_scan(product)
-        await reporting_service.save_result(result)
-        results.append(result)
+    # Scan in bounded chunks so a large CSV never has every result in flight at once
+    for start in range(0, len(products), BATCH_SCAN_CHUNK_SIZE):
+        chunk = products[start:start + BATCH_SCAN_CHUNK_SIZE]
+        chunk_results = await asyncio.gather(
+            *(compliance_engine.run_scan(product, executor=scan_executor) for product in chunk)
+        )
+        await reporting_service.save_many(chunk_results)
+        results.extend(chunk_results)
 
-    return BatchScanResponse(status="success", total=len(results), results=results)
+    # Serialize straight to JSON bytes in pydantic-core; returning a Response skips
+    # FastAPI's response_model re-validation and jsonable_encoder pass
+    response = BatchScanResponse(status="success", total=len(results), results=results)
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @app.get("/reports")
@@ -166,9 +301,8 @@ async def reports(risk_level: str | None = Query(default=None)):
 
 @app.get("/reports/export")
 async def export_reports_csv():
-    csv_content = await reporting_service.export_csv()
     return StreamingResponse(
-        BytesIO(csv_content.encode("utf-8")),
+        reporting_service.iter_csv_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=compliance_reports.csv"},
     )
@@ -179,13 +313,15 @@ async def audit_product_url(request: URLAuditRequest):
     try:
         # Pass category to audit service (auto-detects if not provided)
         category = request.category.value if request.category else None
-        result = url_audit_service.audit(
-            url=request.url, 
+        result = await asyncio.to_thread(
+            url_audit_service.audit,
+            url=request.url,
             seller_id=request.seller_id,
-            category=category
+            category=category,
         )
         await reporting_service.save_result(result)
-        return URLAuditResponse(status="success", result=result)
+        response = URLAuditResponse(status="success", result=result)
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"URL audit failed: {exc}") from exc
 
@@ -196,9 +332,9 @@ async def ocr_extract_image(
     image: UploadFile = File(...),
     category: str = Form(default=None)
 ):
+    image_bytes = await read_upload(image)
     try:
-        image_bytes = await image.read()
-        extracted_text = ocr_service.extract_text(image_bytes)
+        extracted_text = await asyncio.to_thread(ocr_service.extract_text, image_bytes)
         
         # Auto-detect category if not provided
         detected_category = category
@@ -229,25 +365,12 @@ async def ocr_extract_image(
             
             # Confidence factors:
             # 1. Text length (optimal is 100-1000 words)
-            if word_count >= 100:
-                length_score = 100
-            elif word_count >= 50:
-                length_score = 80
-            elif word_count >= 20:
-                length_score = 60
-            else:
-                length_score = max(0, word_count * 2)
+            length_score = _ocr_length_score(word_count)
             
             # 2. Count how many fields were successfully identified
             field_dict = identified_fields.model_dump() if identified_fields else {}
             found_fields = sum(1 for v in field_dict.values() if v)
-            total_fields = 6  # Base fields
-            if detected_category == "food":
-                total_fields = 14  # Food has more fields
-            elif detected_category == "electronics":
-                total_fields = 14
-            elif detected_category == "cosmetics":
-                total_fields = 12
+            total_fields = _CATEGORY_FIELD_COUNT.get(detected_category, _BASE_FIELD_COUNT)
             field_score = min(100, (found_fields / total_fields) * 100)
             
             # Combined confidence: weighted average
@@ -275,8 +398,7 @@ async def ocr_extract_image(
             }
         }
     except Exception as exc:
-        import logging
-        logging.error(f"OCR extraction error: {exc}", exc_info=True)
+        logger.error(f"OCR extraction error: {exc}", exc_info=True)
         raise HTTPException(status_code=400, detail=f"OCR extraction failed: {str(exc)}") from exc
 
 
@@ -285,14 +407,14 @@ async def list_product_categories():
     """Get list of available product categories with their rule counts"""
     return {
         "status": "success",
-        "categories": validation_service.get_available_categories()
+        "categories": product_categories
     }
 
 
 @app.get("/categories/{category_id}/rules")
 async def get_category_rules(category_id: str):
     """Get detailed rules for a specific category"""
-    summary = validation_service.get_category_summary(category_id)
+    summary = category_summaries.get(category_id) or validation_service.get_category_summary(category_id)
     return {
         "status": "success",
         "category": summary
@@ -319,9 +441,8 @@ async def get_audit_stats():
 
 @app.get("/audit/export/csv")
 async def export_audit_csv():
-    csv_content = await reporting_service.export_csv()
     return StreamingResponse(
-        BytesIO(csv_content.encode("utf-8")),
+        reporting_service.iter_csv_rows(),
         media_type="text/csv",
         headers={"Content-Disposition": "attachment; filename=audit_reports.csv"},
     )
@@ -520,18 +641,15 @@ async def audit_by_category(
     Start a category-based bulk audit.
     Searches for products in the category and audits them in parallel.
     """
-    import uuid
-    
     # Map string to enum
-    try:
-        category_enum = ProductCategory(category)
-    except ValueError:
+    category_enum = _AUDIT_CAT_MAP.get(category)
+    if category_enum is None:
         raise HTTPException(status_code=400, detail=f"Invalid category: {category}")
     
     task_id = str(uuid.uuid4())
     
     # Initialize task tracking
-    bulk_audit_tasks[task_id] = {
+    task = {
         "status": "running",
         "category": category,
         "total": 0,
@@ -540,47 +658,63 @@ async def audit_by_category(
         "results": [],
         "errors": []
     }
+    with bulk_audit_tasks_lock:
+        running_bulk_audit_tasks[task_id] = task
+    
+    def report_progress(progress) -> None:
+        # Counts only; results are serialized once when the audit finishes
+        task.update({
+            "total": progress.total,
+            "completed": progress.completed,
+            "failed": progress.failed,
+            "errors": list(progress.errors),
+        })
     
-    async def run_bulk_audit_async():
-        """Async background task for bulk audit"""
+    def run_bulk_audit():
+        """Background task for bulk audit, executed in a worker thread"""
         try:
             progress = category_audit_service.audit_by_category(
                 category=category_enum,
                 max_products=max_products,
                 seller_id=seller_id,
                 custom_keyword=custom_keyword,
-                marketplace=marketplace
+                marketplace=marketplace,
+                progress_callback=report_progress,
             )
             
+            serialized_results = [tag_inferred_category(r.model_dump(mode="json")) for r in progress.results]
+            
             # Update task with results
-            bulk_audit_tasks[task_id].update({
+            task.update({
                 "status": "completed",
                 "total": progress.total,
                 "completed": progress.completed,
                 "failed": progress.failed,
-                "results": [r.model_dump(mode="json") for r in progress.results],
+                "results": serialized_results,
                 "errors": progress.errors
             })
             
-            # Save results to database
-            for result in progress.results:
-                try:
-                    # Save result dict directly to database
-                    result_dict = result.model_dump(mode="json")
-                    await db_client.save_report(result_dict)
-                except Exception as e:
-                    logger.error(f"Error saving result: {str(e)}")
-                    bulk_audit_tasks[task_id]["errors"].append(f"Failed to save result: {str(e)}")
+            # Save results to database in a single bulk write on the main event loop
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    db_client.save_many(serialized_results), app.state.loop
+                )
+                future.result()
+            except Exception as e:
+                logger.error(f"Error saving results: {str(e)}")
+                task["errors"].append(f"Failed to save results: {str(e)}")
             
         except Exception as e:
             logger.error(f"Bulk audit failed: {str(e)}")
-            bulk_audit_tasks[task_id].update({
+            task.update({
                 "status": "failed",
                 "errors": [str(e)]
             })
+        finally:
+            finish_bulk_audit_task(task_id)
     
-    # Run async task in background
-    background_tasks.add_task(run_bulk_audit_async)
+    # Run blocking audit in the background threadpool
+    background_tasks.add_task(run_bulk_audit)
     
     return {
         "task_id": task_id,
@@ -593,10 +727,12 @@ async def audit_by_category(
 @app.get("/audit/category/status/{task_id}")
 async def get_bulk_audit_status(task_id: str):
     """Get the status of a bulk audit task"""
-    if task_id not in bulk_audit_tasks:
+    with bulk_audit_tasks_lock:
+        task = running_bulk_audit_tasks.get(task_id) or finished_bulk_audit_tasks.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
     
-    return bulk_audit_tasks[task_id]
+    return task
 
 
 @app.post("/audit/bulk")
@@ -614,21 +750,21 @@ async def bulk_audit_urls(
     if len(urls) > 50:
         raise HTTPException(status_code=400, detail="Maximum 50 URLs per request")
     
-    progress = category_audit_service.bulk_audit_urls(
+    progress = await category_audit_service.bulk_audit_urls_async(
         urls=urls,
-        seller_id=seller_id
+        seller_id=seller_id,
     )
     
-    # Save results to database
-    for result in progress.results:
-        await reporting_service.save_result(result)
+    # Serialize once and reuse the dicts for both the database write and the response
+    serialized_results = [tag_inferred_category(r.model_dump(mode="json")) for r in progress.results]
+    await db_client.save_many(serialized_results)
     
     return {
         "status": "completed",
         "total": progress.total,
         "completed": progress.completed,
         "failed": progress.failed,
-        "results": [r.model_dump(mode="json") for r in progress.results],
+        "results": serialized_results,
         "errors": progress.errors
     }
 
@@ -703,68 +839,23 @@ async def search_audit_reports(
     Advanced search and filtering for audit reports.
     Supports filtering by risk level, category, score range, date range, and seller.
     """
-    from datetime import datetime
-    
-    reports = await reporting_service.list_reports()
-    
-    # Apply filters
-    filtered = []
-    for report in reports:
-        # Risk level filter
-        if risk_level and report.get("risk_level") != risk_level:
-            continue
-        
-        # Score range filter
-        score = report.get("compliance_score", report.get("score", 0))
-        if min_score is not None and score < min_score:
-            continue
-        if max_score is not None and score > max_score:
-            continue
-        
-        # Seller ID filter
-        if seller_id and report.get("seller_id") != seller_id:
-            continue
-        
-        # Date range filter
-        created_at = report.get("created_at")
-        if created_at:
-            if isinstance(created_at, str):
-                try:
-                    created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
-            
-            if date_from:
-                from_date = datetime.fromisoformat(date_from)
-                if created_at < from_date:
-                    continue
-            
-            if date_to:
-                to_date = datetime.fromisoformat(date_to)
-                if created_at > to_date:
-                    continue
-        
-        # Category filter (infer from title)
-        if category:
-            title = (report.get("scraped_data", {}).get("title") or 
-                     report.get("product_name") or "").lower()
-            if category.lower() not in title:
-                continue
-        
-        filtered.append(report)
-    
-    # Sort by date (newest first)
-    filtered.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-    
-    # Pagination
-    total = len(filtered)
-    paginated = filtered[offset:offset + limit]
+    total, results = await reporting_service.search(
+        risk_level=risk_level,
+        category=category,
+        min_score=min_score,
+        max_score=max_score,
+        seller_id=seller_id,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        offset=offset,
+    )
     
     return {
         "total": total,
         "limit": limit,
         "offset": offset,
-        "results": paginated
+        "results": results
     }
 
 
@@ -804,21 +895,18 @@ async def process_ocr(
         )
     
     # Parse category
-    ocr_category = None
-    if category:
-        try:
-            ocr_category = OCRProductCategory(category.lower())
-        except ValueError:
-            pass  # Use None for unknown categories
+    ocr_category = _OCR_CAT_MAP.get(category.lower()) if category else None  # None for unknown categories
     
     # Process image
     if image:
-        image_bytes = await image.read()
-        result = advanced_ocr_service.process_image(image_bytes, ocr_category)
+        image_bytes = await read_upload(image)
+        result = await asyncio.to_thread(advanced_ocr_service.process_image, image_bytes, ocr_category)
     else:
-        result = await advanced_ocr_service.process_image_url(image_url, ocr_category)
+        result = await advanced_ocr_service.process_image_url(image_url, ocr_category, session=app.state.http)
     
-    return result
+    # combined_text and raw_text_regions make these payloads large; serialize in
+    # pydantic-core and skip the response_model re-validation pass
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @app.post("/ocr/process-url", response_model=OCRProcessingResult, tags=["OCR"])
@@ -848,15 +936,17 @@ async def process_ocr_url(request: OCRRequest):
     if request.image_url:
         result = await advanced_ocr_service.process_image_url(
             request.image_url, 
-            ocr_category
+            ocr_category,
+            session=app.state.http,
         )
     else:
-        result = advanced_ocr_service.process_image_path(
+        result = await asyncio.to_thread(
+            advanced_ocr_service.process_image_path,
             request.image_path,
-            ocr_category
+            ocr_category,
         )
     
-    return result
+    return Response(content=result.model_dump_json(), media_type="application/json")
 
 
 @app.post("/ocr/batch", tags=["OCR"])
@@ -875,26 +965,24 @@ async def process_ocr_batch(
         List of OCRProcessingResult for each image
     """
     # Parse category
-    ocr_category = None
-    if category:
-        try:
-            ocr_category = OCRProductCategory(category.lower())
-        except ValueError:
-            pass
+    ocr_category = _OCR_CAT_MAP.get(category.lower()) if category else None
     
     results = []
-    for image in images:
-        image_bytes = await image.read()
-        result = advanced_ocr_service.process_image(image_bytes, ocr_category)
-        results.append({
-            "filename": image.filename,
-            "result": result.model_dump()
-        })
+    for start in range(0, len(images), OCR_BATCH_CHUNK_SIZE):
+        chunk = images[start:start + OCR_BATCH_CHUNK_SIZE]
+        byte_list = await asyncio.gather(*(read_upload(image) for image in chunk))
+        chunk_results = await advanced_ocr_service.process_images_batch(byte_list, ocr_category)
+        # Each result is serialized once by pydantic-core and spliced into the
+        # envelope as a pre-encoded orjson fragment
+        results.extend(
+            {"filename": image.filename, "result": orjson.Fragment(result.model_dump_json())}
+            for image, result in zip(chunk, chunk_results)
+        )
     
-    return {
-        "total": len(results),
-        "results": results
-    }
+    return Response(
+        content=orjson.dumps({"total": len(results), "results": results}),
+        media_type="application/json",
+    )
 
 
 @app.get("/ocr/health", tags=["OCR"])
@@ -905,39 +993,31 @@ async def ocr_health_check():
     Returns:
         Health status including Tesseract availability
     """
-    import subprocess
-    
-    health = {
-        "status": "healthy",
-        "tesseract_available": False,
-        "tesseract_version": None,
-        "opencv_available": False,
-        "opencv_version": None,
-    }
-    
-    # Check Tesseract
-    try:
-        result = subprocess.run(
-            ["tesseract", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            health["tesseract_available"] = True
-            health["tesseract_version"] = result.stdout.split("\n")[0]
-    except Exception:
-        health["status"] = "degraded"
-    
-    # Check OpenCV
-    try:
-        import cv2
-        health["opencv_available"] = True
-        health["opencv_version"] = cv2.__version__
-    except ImportError:
-        health["status"] = "degraded"
-    
-    return health
+    return app.state.ocr_health["health"]
+
+
+SUPPORTED_OCR_FIELDS = {
+    "fields": [
+        {"name": "mrp", "description": "Maximum Retail Price (₹)", "category": "all"},
+        {"name": "net_quantity", "description": "Net weight/volume (g, kg, ml, L)", "category": "all"},
+        {"name": "manufacture_date", "description": "Date of manufacture/packing", "category": "all"},
+        {"name": "expiry_date", "description": "Expiry/Best before date", "category": "all"},
+        {"name": "country_of_origin", "description": "Country where product was made", "category": "all"},
+        {"name": "manufacturer", "description": "Manufacturer/Packer name and address", "category": "all"},
+        {"name": "importer", "description": "Importer details (for imported products)", "category": "all"},
+        {"name": "consumer_care", "description": "Consumer helpline/contact number", "category": "all"},
+        {"name": "batch_number", "description": "Batch/Lot number", "category": "all"},
+        {"name": "fssai_license", "description": "FSSAI License number (14 digits)", "category": "food"},
+        {"name": "bis_certification", "description": "BIS/ISI certification number", "category": "electronics"},
+    ],
+    "categories": ["food", "electronics", "cosmetics", "generic"],
+    "confidence_levels": [
+        {"level": "HIGH_CONFIDENCE", "threshold": "≥ 85%", "action": "Auto-approve"},
+        {"level": "MEDIUM_CONFIDENCE", "threshold": "70-84%", "action": "Review recommended"},
+        {"level": "LOW_CONFIDENCE", "threshold": "50-69%", "action": "Manual review required"},
+        {"level": "VERY_LOW_CONFIDENCE", "threshold": "< 50%", "action": "Re-capture image"},
+    ]
+}
 
 
 @app.get("/ocr/supported-fields", tags=["OCR"])
@@ -948,26 +1028,5 @@ async def get_supported_fields():
     Returns:
         List of supported fields with descriptions
     """
-    return {
-        "fields": [
-            {"name": "mrp", "description": "Maximum Retail Price (₹)", "category": "all"},
-            {"name": "net_quantity", "description": "Net weight/volume (g, kg, ml, L)", "category": "all"},
-            {"name": "manufacture_date", "description": "Date of manufacture/packing", "category": "all"},
-            {"name": "expiry_date", "description": "Expiry/Best before date", "category": "all"},
-            {"name": "country_of_origin", "description": "Country where product was made", "category": "all"},
-            {"name": "manufacturer", "description": "Manufacturer/Packer name and address", "category": "all"},
-            {"name": "importer", "description": "Importer details (for imported products)", "category": "all"},
-            {"name": "consumer_care", "description": "Consumer helpline/contact number", "category": "all"},
-            {"name": "batch_number", "description": "Batch/Lot number", "category": "all"},
-            {"name": "fssai_license", "description": "FSSAI License number (14 digits)", "category": "food"},
-            {"name": "bis_certification", "description": "BIS/ISI certification number", "category": "electronics"},
-        ],
-        "categories": ["food", "electronics", "cosmetics", "generic"],
-        "confidence_levels": [
-            {"level": "HIGH_CONFIDENCE", "threshold": "≥ 85%", "action": "Auto-approve"},
-            {"level": "MEDIUM_CONFIDENCE", "threshold": "70-84%", "action": "Review recommended"},
-            {"level": "LOW_CONFIDENCE", "threshold": "50-69%", "action": "Manual review required"},
-            {"level": "VERY_LOW_CONFIDENCE", "threshold": "< 50%", "action": "Re-capture image"},
-        ]
-    }
+    return SUPPORTED_OCR_FIELDS
 
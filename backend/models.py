@@ -1,8 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _DeferredModel(BaseModel):
+    # Build validators on first use instead of at import; most processes (e.g.
+    # OCR workers) touch only a few of these models
+    model_config = ConfigDict(defer_build=True)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class RiskLevel(str, Enum):
@@ -11,28 +21,28 @@ class RiskLevel(str, Enum):
     HIGH = "High Risk"
 
 
-class ProductInput(BaseModel):
+class ProductInput(_DeferredModel):
     seller_id: str = Field(..., description="Seller account identifier")
     product_name: str
     description: str | None = None
     packaging_text: str | None = None
 
 
-class ExtractedFields(BaseModel):
+class ExtractedFields(_DeferredModel):
     mrp: str | None = None
     quantity: str | None = None
     manufacturer: str | None = None
     country_of_origin: str | None = None
 
 
-class Violation(BaseModel):
+class Violation(_DeferredModel):
     code: str
     field: str
     message: str
     penalty: int
 
 
-class ComplianceResult(BaseModel):
+class ComplianceResult(_DeferredModel):
     product_id: str
     seller_id: str
     product_name: str
@@ -44,28 +54,28 @@ class ComplianceResult(BaseModel):
     risk_summary: str
     score: int = Field(ge=0, le=100)
     risk_level: RiskLevel
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
-class ScanResponse(BaseModel):
+class ScanResponse(_DeferredModel):
     status: str
     result: ComplianceResult
 
 
-class BatchScanResponse(BaseModel):
+class BatchScanResponse(_DeferredModel):
     status: str
     total: int
     results: list[ComplianceResult]
 
 
-class DashboardMetrics(BaseModel):
+class DashboardMetrics(_DeferredModel):
     total_scanned: int
     compliant_count: int
     compliance_rate: float
     risk_distribution: dict[str, int]
 
 
-class ProductRecord(BaseModel):
+class ProductRecord(_DeferredModel):
     id: str
     payload: dict[str, Any]
 
@@ -77,13 +87,13 @@ class ProductCategory(str, Enum):
     GENERIC = "generic"
 
 
-class URLAuditRequest(BaseModel):
+class URLAuditRequest(_DeferredModel):
     url: str
     seller_id: str = "seller-001"
     category: ProductCategory | None = None  # Optional, will auto-detect if not provided
 
 
-class ScrapedProductData(BaseModel):
+class ScrapedProductData(_DeferredModel):
     url: str
     title: str | None = None
     description: str | None = None
@@ -92,7 +102,7 @@ class ScrapedProductData(BaseModel):
     raw_text: str = ""
 
 
-class MandatoryDeclarations(BaseModel):
+class MandatoryDeclarations(_DeferredModel):
     # Universal fields
     manufacturer_or_importer: str | None = None
     manufacturer_address: str | None = None
@@ -132,7 +142,7 @@ class MandatoryDeclarations(BaseModel):
     cruelty_free: str | None = None
 
 
-class URLAuditResult(BaseModel):
+class URLAuditResult(_DeferredModel):
     product_id: str
     seller_id: str
     category: ProductCategory = ProductCategory.GENERIC
@@ -142,9 +152,9 @@ class URLAuditResult(BaseModel):
     ocr_text: str = ""
     identified_fields: MandatoryDeclarations
     violations: list[Violation]
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
 
-class URLAuditResponse(BaseModel):
+class URLAuditResponse(_DeferredModel):
     status: str
     result: URLAuditResult
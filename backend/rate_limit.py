@@ -0,0 +1,103 @@
+"""
+Per-host request pacing and rate-limit backoff for outbound scraping.
+
+Marketplace hosts throttle bursts with 429/503 responses. Requests to the
+same host are spaced at least ``min_interval`` apart across all threads,
+and throttled responses are retried with exponential backoff (honouring
+``Retry-After`` when the server sends one). Scraping sessions share a
+large keep-alive connection pool so concurrent audits reuse sockets.
+"""
+
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STATUSES = {429, 503}
+SESSION_POOL_SIZE = 50
+
+
+class HostRateLimiter:
+    def __init__(self, min_interval: float) -> None:
+        self.min_interval = min_interval
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        """Block until this thread's turn to hit the URL's host."""
+        host = urlsplit(url).netloc
+        # Reserve a slot under the lock, then sleep outside it so other hosts are not held up
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+rate_limiter = HostRateLimiter(min_interval=0.5)
+
+
+def pooled_session(pool_size: int = SESSION_POOL_SIZE) -> requests.Session:
+    """
+    Session whose connection pool fits every concurrent audit worker.
+
+    The default adapter keeps only 10 connections per host and discards the
+    rest, so bulk audits kept redoing TCP/TLS handshakes. Connection errors
+    and gateway failures are retried here. 429/503 are left to
+    ``get_with_backoff`` so they are not retried twice.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 504], raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def is_rate_limited(response: requests.Response) -> bool:
+    if response.status_code in RATE_LIMIT_STATUSES:
+        return True
+    if response.ok:
+        return False
+    body = response.text[:2000].lower()
+    return "rate limit" in body or "quota" in body
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else None
+
+
+def get_with_backoff(
+    session: requests.Session,
+    url: str,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    **kwargs,
+) -> requests.Response:
+    """
+    ``session.get`` paced by ``rate_limiter`` and retried while rate limited.
+
+    After ``max_retries`` retries the last (throttled) response is returned
+    so callers keep their existing status handling.
+    """
+    for attempt in range(max_retries + 1):
+        rate_limiter.acquire(url)
+        response = session.get(url, **kwargs)
+        if attempt == max_retries or not is_rate_limited(response):
+            return response
+        delay = min(max_delay, _retry_after(response) or base_delay * 2 ** attempt)
+        logger.warning(f"Rate limited by {urlsplit(url).netloc} (HTTP {response.status_code}), retrying in {delay:.1f}s")
+        time.sleep(delay)
+    return response
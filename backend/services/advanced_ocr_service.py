@@ -13,21 +13,58 @@ Features:
 """
 
 import re
+import asyncio
+import functools
+import hashlib
+import itertools
 import logging
+import mmap
 import os
 import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Iterator, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+import aiohttp
 import cv2
 import numpy as np
 import pytesseract
+from cachetools import LRUCache
 from PIL import Image
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:
+    from rapidocr_onnxruntime import RapidOCR
+except ImportError:  # optional in-process recognition engine
+    RapidOCR = None
+
+try:
+    import tesserocr
+except ImportError:  # optional in-process Tesseract binding
+    tesserocr = None
+
+try:
+    from turbojpeg import TJPF_BGR, TJPF_GRAY, TurboJPEG
+except ImportError:  # optional SIMD JPEG decoder
+    TurboJPEG = None
+
+try:
+    from numba import njit
+except ImportError:  # optional JIT for the small per-box loops
+    njit = None
+
+try:
+    import hyperscan
+except ImportError:  # optional SIMD multi-pattern scanner for field extraction
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -46,13 +83,50 @@ WINDOWS_TESSERACT_PATHS = [
 MIN_CONFIDENCE_THRESHOLD = 60
 LOW_CONFIDENCE_THRESHOLD = 65
 
+# Encoded image input: in-memory bytes, or a read-only map of an image file
+ImageBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Header parsing never needs more than this prefix of a mapped file
+HEADER_PROBE_BYTES = 256 * 1024
+
 # Image preprocessing constants
 TARGET_WIDTH = 1200  # Target width for consistent resolution
+DETECT_WIDTH = 900  # Detection works on a coarser copy; boxes are mapped back to full resolution
 MIN_CONTOUR_AREA = 100  # Minimum area for text region detection
 MAX_CONTOUR_AREA_RATIO = 0.8  # Max ratio of image area for a single contour
 MIN_ASPECT_RATIO = 0.1  # Minimum width/height ratio for text regions
 MAX_ASPECT_RATIO = 15.0  # Maximum width/height ratio for text regions
 
+# Tesseract runs as a subprocess per region, so region OCR parallelises across
+# threads (the GIL is released while waiting on the subprocess)
+REGION_OCR_WORKERS = min(8, os.cpu_count() or 1)
+_region_ocr_pool = ThreadPoolExecutor(max_workers=REGION_OCR_WORKERS, thread_name_prefix="region-ocr")
+
+# Tall pages are adaptive-thresholded in horizontal strips on their own pool
+# (region OCR threads also preprocess, so they must not wait on their own pool)
+THRESHOLD_STRIP_ROWS = 256
+_threshold_strip_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="ocr-strip")
+
+# Structuring elements are constants; build them once
+_KERNEL_NOISE = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))  # Noise removal / hole filling
+_KERNEL_GRADIENT = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))  # Stroke edges for detection
+_KERNEL_TEXT_LINE = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 3))  # Joins characters into lines
+
+
+class AdvancedOCRSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    # "tesseract" shells out to the tesseract binary per region; "rapidocr" runs
+    # an in-process ONNX recognizer over all regions in one batch
+    ocr_engine: str = "tesseract"
+    # Explicit binary path; skips probing PATH and the Windows install locations
+    tesseract_cmd: Optional[str] = None
+    # Run Tesseract once over the whole image (PSM 11) and assign words to the
+    # detected regions; False spawns one Tesseract per region instead
+    tesseract_single_pass: bool = True
+
+
+ocr_settings = AdvancedOCRSettings()
+
 
 class ConfidenceLevel(str, Enum):
     """Confidence level classification for OCR results"""
@@ -85,8 +159,14 @@ class TextRegion(BaseModel):
     region_index: int
 
 
-class ComplianceFields(BaseModel):
-    """Structured compliance fields extracted from product labels"""
+@dataclass(slots=True)
+class ComplianceFields:
+    """
+    Structured compliance fields extracted from product labels.
+    
+    Internal accumulator filled field by field during extraction and copied
+    into OCRProcessingResult, so it skips pydantic validation entirely.
+    """
     mrp: Optional[str] = None
     net_quantity: Optional[str] = None
     manufacture_date: Optional[str] = None
@@ -151,12 +231,232 @@ class OCRRequest(BaseModel):
         }
 
 
+# ============================================================================
+# Compliance Field Patterns
+# ============================================================================
+
+# Compiled once at import. re.ASCII keeps \s, \b and case folding on the fast
+# ASCII tables; literal ₹ in the patterns still matches. Runs that can never
+# give characters back (the next token is disjoint from the run's class) are
+# possessive, so noisy OCR text fails fast instead of backtracking.
+_FIELD_FLAGS = re.IGNORECASE | re.ASCII
+
+_COMPILED_PATTERNS: Dict[str, re.Pattern] = {
+    # MRP patterns - ₹, Rs., MRP with various formats
+    'mrp': re.compile(
+        r'(?:MRP|M\.R\.P\.?|Price|PRICE)[\s:₹.]*[₹Rs.]*\s*([0-9,]+(?:\.[0-9]{1,2})?)|'
+        r'[₹][\s]*([0-9,]+(?:\.[0-9]{1,2})?)|'
+        r'Rs\.?\s*([0-9,]+(?:\.[0-9]{1,2})?)',
+        _FIELD_FLAGS
+    ),
+    
+    # Net quantity - weight/volume units
+    'net_quantity': re.compile(
+        r'(?:Net\s*(?:Wt\.?|Weight|Qty\.?|Quantity|Contents?)|Contents?)[\s:]*+'
+        r'([0-9]+(?:\.[0-9]+)?\s*(?:g|gm|gms|kg|kgs|ml|mL|l|L|ltr|litre|liters?|oz|lb)s?)|'
+        r'([0-9]+(?:\.[0-9]+)?\s*(?:g|gm|gms|kg|kgs|ml|mL|l|L|ltr|litre|liters?))\b',
+        _FIELD_FLAGS
+    ),
+    
+    # Date patterns (manufacture/expiry)
+    'date': re.compile(
+        r'([0-9]{1,2}[\/\-\.][0-9]{1,2}[\/\-\.][0-9]{2,4})|'  # DD/MM/YYYY or MM/DD/YYYY
+        r'([0-9]{1,2}[\/\-][0-9]{2,4})|'  # MM/YYYY
+        r'([A-Za-z]{3,9}+[\s,]*+[0-9]{1,2}[,]?\s*[0-9]{2,4})|'  # Month DD, YYYY
+        r'([0-9]{1,2}+[\s\-]*+[A-Za-z]{3,9}+[\s,]*+[0-9]{2,4})',  # DD Month YYYY
+        _FIELD_FLAGS
+    ),
+    
+    # Manufacture date keywords
+    'mfg_date': re.compile(
+        r'(?:Mfg\.?|Mfd\.?|Manufacturing|Manufactured|Packed|Packing|Pkg\.?)[\s:]*+(?:Date)?[\s:]*+'
+        r'([0-9]{1,2}[\/\-\.][0-9]{1,2}[\/\-\.][0-9]{2,4}|'
+        r'[0-9]{1,2}[\/\-][0-9]{2,4}|'
+        r'[A-Za-z]{3,9}+[\s,]*+[0-9]{1,2}[,]?\s*[0-9]{2,4}|'
+        r'[0-9]{1,2}+[\s\-]*+[A-Za-z]{3,9}+[\s,]*+[0-9]{2,4})',
+        _FIELD_FLAGS
+    ),
+    
+    # Expiry date keywords
+    'exp_date': re.compile(
+        r'(?:Exp\.?|Expiry|Expires?|Best\s*Before|BB|Use\s*By|Use\s*Before)[\s:]*+(?:Date)?[\s:]*+'
+        r'([0-9]{1,2}[\/\-\.][0-9]{1,2}[\/\-\.][0-9]{2,4}|'
+        r'[0-9]{1,2}[\/\-][0-9]{2,4}|'
+        r'[A-Za-z]{3,9}+[\s,]*+[0-9]{1,2}[,]?\s*[0-9]{2,4}|'
+        r'[0-9]{1,2}+[\s\-]*+[A-Za-z]{3,9}+[\s,]*+[0-9]{2,4}|'
+        r'[0-9]+\s*(?:months?|days?|years?)\s*(?:from\s*(?:mfg|manufacturing|packing))?)',
+        _FIELD_FLAGS
+    ),
+    
+    # Country of origin
+    'country': re.compile(
+        r'(?:Country\s*of\s*Origin|Made\s*in|Product\s*of|Manufactured\s*in|Origin)[\s:]*+'
+        r'([A-Za-z]++(?:\s+[A-Za-z]++)?)',
+        _FIELD_FLAGS
+    ),
+    
+    # Manufacturer/Importer details
+    'manufacturer': re.compile(
+        r'(?:Mfg\.?\s*(?:by)?|Manufactured\s*by|Packed\s*by|Packer|Marketer|Marketed\s*by)[\s:]*+'
+        r'([A-Za-z0-9][A-Za-z0-9\s,\.&\-]++(?:Ltd\.?|Pvt\.?|Inc\.?|LLC|Co\.?|Corporation|Industries)?)',
+        _FIELD_FLAGS
+    ),
+    
+    'importer': re.compile(
+        r'(?:Imported\s*by|Importer)[\s:]*+'
+        r'([A-Za-z0-9][A-Za-z0-9\s,\.&\-]++(?:Ltd\.?|Pvt\.?|Inc\.?|LLC|Co\.?)?)',
+        _FIELD_FLAGS
+    ),
+    
+    # Consumer care / Contact
+    'consumer_care': re.compile(
+        r'(?:Consumer\s*Care|Customer\s*Care|Helpline|Contact|Toll\s*Free)[\s:]*'
+        r'([0-9\-\+\s\(\)]{8,20})|'
+        r'(?:1800[\-\s]*[0-9\-\s]{6,12})',
+        _FIELD_FLAGS
+    ),
+    
+    # Batch number
+    'batch': re.compile(
+        r'(?:Batch|Lot|B\.?\s*No\.?|L\.?\s*No\.?)[\s:]*+([A-Za-z0-9\-\/]{4,20})',
+        _FIELD_FLAGS
+    ),
+    
+    # FSSAI License (14 digits)
+    'fssai': re.compile(
+        r'(?:FSSAI|Lic\.?\s*No\.?|License\s*No\.?)[\s:]*+([0-9]{10,14})|'
+        r'\b([0-9]{14})\b',
+        _FIELD_FLAGS
+    ),
+    
+    # BIS Certification
+    'bis': re.compile(
+        r'(?:BIS|ISI|IS[\s:]*[0-9]+)[\s:]*+([A-Za-z0-9\-\/]+)|'
+        r'(?:R-[0-9]{7,})',
+        _FIELD_FLAGS
+    ),
+}
+
+
+# Fields located by the fused scan; 'date' is only a fallback and is searched separately
+_SCANNED_FIELDS = (
+    'mrp', 'net_quantity', 'mfg_date', 'exp_date', 'country', 'manufacturer',
+    'importer', 'consumer_care', 'batch', 'fssai', 'bis',
+)
+
+
+@functools.cache
+def category_field_names(category: Optional[ProductCategory]) -> Tuple[str, ...]:
+    """Fields worth scanning for a category; FSSAI/BIS only apply to food/electronics."""
+    return tuple(
+        name for name in _SCANNED_FIELDS
+        if (name != 'fssai' or category in (ProductCategory.FOOD, None))
+        and (name != 'bis' or category in (ProductCategory.ELECTRONICS, None))
+    )
+
+
+@functools.cache
+def _fused_field_scan(names: Tuple[str, ...]) -> re.Pattern:
+    """
+    Zero-width alternation that stops at every offset where one of the named
+    field patterns can start. Field patterns are then only tried at those
+    offsets, so a single pass yields each pattern's leftmost match, exactly as
+    .search would. Built on first use per field set and cached.
+    """
+    return re.compile(
+        '(?=' + '|'.join(f'(?:{_COMPILED_PATTERNS[name].pattern})' for name in names) + ')',
+        _FIELD_FLAGS
+    )
+
+
+# Possessive quantifiers are re-only syntax; Hyperscan never backtracks, so it
+# gets the plain greedy form (which matches the same text here)
+_POSSESSIVE_QUANTIFIER = re.compile(r'(?<!\\)([*+?}])\+')
+
+
+def _build_hyperscan_db():
+    """Compile the field patterns into one Hyperscan block-mode database, if available."""
+    if hyperscan is None:
+        return None
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[
+                _POSSESSIVE_QUANTIFIER.sub(r'\1', _COMPILED_PATTERNS[name].pattern).encode('utf-8')
+                for name in _SCANNED_FIELDS
+            ],
+            ids=list(range(len(_SCANNED_FIELDS))),
+            elements=len(_SCANNED_FIELDS),
+            flags=[flags] * len(_SCANNED_FIELDS),
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan compile failed, using re for field extraction: {e}")
+        return None
+
+
+_HYPERSCAN_DB = _build_hyperscan_db()
+# Hyperscan scratch space may not be shared between concurrent scans
+_hyperscan_local = threading.local()
+
+
+def _hyperscan_field_matches(text: str, names: Tuple[str, ...]) -> Dict[str, re.Match]:
+    scratch = getattr(_hyperscan_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+    
+    data = text.encode('utf-8')
+    starts: Dict[int, int] = {}
+    
+    def on_match(pattern_id, start, end, flags, context):
+        if start < starts.get(pattern_id, len(data) + 1):
+            starts[pattern_id] = start
+    
+    _HYPERSCAN_DB.scan(data, match_event_handler=on_match, scratch=scratch)
+    
+    found: Dict[str, re.Match] = {}
+    for pattern_id, start in starts.items():
+        name = _SCANNED_FIELDS[pattern_id]
+        if name not in names:
+            continue
+        pos = start if len(data) == len(text) else len(data[:start].decode('utf-8', 'ignore'))
+        # Hyperscan only supplies the start offset; re recovers the capture groups
+        pattern = _COMPILED_PATTERNS[name]
+        match = pattern.match(text, pos) or pattern.search(text, pos)
+        if match:
+            found[name] = match
+    return found
+
+
+def scan_field_matches(text: str, names: Tuple[str, ...]) -> Dict[str, re.Match]:
+    """Find the leftmost match of each named field pattern in one pass over text."""
+    if _HYPERSCAN_DB is not None:
+        return _hyperscan_field_matches(text, names)
+    
+    pending = list(names)
+    found: Dict[str, re.Match] = {}
+    
+    for candidate in _fused_field_scan(names).finditer(text):
+        pos = candidate.start()
+        for name in pending[:]:
+            match = _COMPILED_PATTERNS[name].match(text, pos)
+            if match:
+                found[name] = match
+                pending.remove(name)
+        if not pending:
+            break
+    
+    return found
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+@functools.cache
 def find_tesseract_path() -> Optional[str]:
-    """Auto-detect Tesseract installation path."""
+    """Auto-detect Tesseract installation path (probed once per process)."""
     tesseract_in_path = shutil.which("tesseract")
     if tesseract_in_path:
         return tesseract_in_path
@@ -168,7 +468,362 @@ def find_tesseract_path() -> Optional[str]:
     return None
 
 
-@dataclass
+_rapid_ocr = None
+
+
+def get_rapid_ocr():
+    """Get or create the process-wide RapidOCR engine (ONNX sessions are costly to build)."""
+    global _rapid_ocr
+    if _rapid_ocr is None:
+        _rapid_ocr = RapidOCR(intra_op_num_threads=os.cpu_count() or 1)
+    return _rapid_ocr
+
+
+def _group_rows(center_ys: np.ndarray, row_threshold: float) -> np.ndarray:
+    """
+    Assign row ids to boxes sorted by top edge.
+    
+    A box joins the current row while its centre is within ``row_threshold``
+    of the centre of the box that opened the row.
+    """
+    row_ids = np.empty(center_ys.shape[0], dtype=np.int64)
+    row = -1
+    current_y = 0
+    for i in range(center_ys.shape[0]):
+        if row < 0 or abs(center_ys[i] - current_y) >= row_threshold:
+            row += 1
+            current_y = center_ys[i]
+        row_ids[i] = row
+    return row_ids
+
+
+def _overlap_labels(rects: np.ndarray, overlap_thresh: float) -> np.ndarray:
+    """
+    Label each box (x1, y1, x2, y2 rows) with the lowest index in its cluster.
+    
+    Two boxes overlap when their intersection covers more than
+    ``overlap_thresh`` of the smaller box; clusters are the connected
+    components of that relation. Computed as a vectorised pairwise matrix.
+    """
+    areas = (rects[:, 2] - rects[:, 0]) * (rects[:, 3] - rects[:, 1])
+    count = len(rects)
+    
+    # Pairwise overlap, computed in row blocks to bound memory for large N
+    adjacency = np.zeros((count, count), dtype=bool)
+    for start in range(0, count, 512):
+        block = rects[start:start + 512]
+        inter_w = np.minimum(block[:, None, 2], rects[None, :, 2]) - np.maximum(block[:, None, 0], rects[None, :, 0])
+        inter_h = np.minimum(block[:, None, 3], rects[None, :, 3]) - np.maximum(block[:, None, 1], rects[None, :, 1])
+        intersection = np.clip(inter_w, 0, None) * np.clip(inter_h, 0, None)
+        min_area = np.maximum(np.minimum(areas[start:start + 512, None], areas[None, :]), 1)
+        adjacency[start:start + 512] = intersection / min_area > overlap_thresh
+    
+    # Connected components by min-label propagation over the adjacency matrix
+    labels = np.arange(count)
+    while True:
+        propagated = np.where(adjacency, labels[None, :], count).min(axis=1)
+        propagated = np.minimum(propagated, labels)
+        propagated = propagated[propagated]
+        if np.array_equal(propagated, labels):
+            return labels
+        labels = propagated
+
+
+def _overlap_labels_sweep(rects: np.ndarray, overlap_thresh: float) -> np.ndarray:
+    """
+    Same labels as ``_overlap_labels`` via union-find over a sweep in x order.
+    
+    Once a box starts right of another's right edge no later box can
+    intersect it, so the pair scan stops early. Only used when compiled.
+    """
+    count = rects.shape[0]
+    parent = np.arange(count)
+    order = np.argsort(rects[:, 0])
+    for a in range(count):
+        i = order[a]
+        area_i = (rects[i, 2] - rects[i, 0]) * (rects[i, 3] - rects[i, 1])
+        for b in range(a + 1, count):
+            j = order[b]
+            if rects[j, 0] >= rects[i, 2]:
+                break
+            inter_w = min(rects[i, 2], rects[j, 2]) - max(rects[i, 0], rects[j, 0])
+            inter_h = min(rects[i, 3], rects[j, 3]) - max(rects[i, 1], rects[j, 1])
+            if inter_w <= 0 or inter_h <= 0:
+                continue
+            area_j = (rects[j, 2] - rects[j, 0]) * (rects[j, 3] - rects[j, 1])
+            if inter_w * inter_h / max(min(area_i, area_j), 1) > overlap_thresh:
+                # Union by lowest index, with path halving
+                root_i = i
+                while parent[root_i] != root_i:
+                    parent[root_i] = parent[parent[root_i]]
+                    root_i = parent[root_i]
+                root_j = j
+                while parent[root_j] != root_j:
+                    parent[root_j] = parent[parent[root_j]]
+                    root_j = parent[root_j]
+                if root_i < root_j:
+                    parent[root_j] = root_i
+                elif root_j < root_i:
+                    parent[root_i] = root_j
+    
+    # Roots are component minima and always precede their members
+    for i in range(count):
+        parent[i] = parent[parent[i]]
+    return parent
+
+
+if njit is not None:
+    _group_rows = njit(cache=True)(_group_rows)
+    _overlap_labels = njit(cache=True)(_overlap_labels_sweep)
+
+
+_turbo_jpeg = None
+
+
+def _get_turbo_jpeg():
+    """Get or create the libjpeg-turbo handle; False once loading the library has failed."""
+    global _turbo_jpeg
+    if _turbo_jpeg is None:
+        try:
+            _turbo_jpeg = TurboJPEG()
+        except Exception as e:
+            logger.warning(f"libjpeg-turbo unavailable, decoding JPEGs with OpenCV: {e}")
+            _turbo_jpeg = False
+    return _turbo_jpeg
+
+
+def adaptive_threshold(gray: np.ndarray, block_size: int = 11, c: int = 2) -> np.ndarray:
+    """
+    Gaussian adaptive threshold of a uint8 image, split into strips when tall.
+    
+    Each strip is thresholded with ``block_size`` rows of context on either
+    side, which covers the Gaussian window, so the stitched result is
+    identical to one full-image call. Small images are thresholded in place.
+    """
+    height = gray.shape[0]
+    strips = min(os.cpu_count() or 1, height // THRESHOLD_STRIP_ROWS)
+    if strips <= 1:
+        return cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, c, dst=gray
+        )
+    
+    output = np.empty_like(gray)
+    bounds = np.linspace(0, height, strips + 1).astype(int).tolist()
+    
+    def threshold_strip(start: int, end: int) -> None:
+        lo, hi = max(0, start - block_size), min(height, end + block_size)
+        strip = cv2.adaptiveThreshold(
+            gray[lo:hi], 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, block_size, c
+        )
+        output[start:end] = strip[start - lo:end - lo]
+    
+    list(_threshold_strip_pool.map(threshold_strip, bounds[:-1], bounds[1:]))
+    return output
+
+
+def decode_image(image_data: ImageBuffer, grayscale: bool) -> Tuple[Optional[np.ndarray], Tuple[int, int]]:
+    """
+    Decode image bytes into a grayscale or BGR array.
+    
+    JPEGs go through libjpeg-turbo when PyTurboJPEG is installed, decoding at
+    half resolution when the image is over twice the target width (those
+    pixels would be downscaled away anyway). Other formats, or a failed
+    turbo decode, use cv2.imdecode, likewise at half resolution for wide images.
+    
+    Returns the array and the (width, height) of the source image, which is
+    larger than the array when it was decoded at half resolution.
+    """
+    if TurboJPEG is not None and image_data[:2] == b'\xff\xd8':
+        turbo = _get_turbo_jpeg()
+        if turbo:
+            try:
+                width, height, _, _ = turbo.decode_header(image_data)
+                image = turbo.decode(
+                    image_data,
+                    pixel_format=TJPF_GRAY if grayscale else TJPF_BGR,
+                    scaling_factor=(1, 2) if width > 2 * TARGET_WIDTH else None
+                )
+                # libjpeg-turbo ignores EXIF orientation; apply it as cv2.imdecode does
+                orientation = _exif_orientation(image_data)
+                if orientation in _EXIF_TRANSPOSED:
+                    width, height = height, width
+                return _apply_exif_orientation(image, orientation), (width, height)
+            except Exception as e:
+                logger.warning(f"TurboJPEG decode failed, falling back to OpenCV: {e}")
+    
+    nparr = np.frombuffer(image_data, np.uint8)
+    width, height = _image_size(image_data)
+    reduced = width > 2 * TARGET_WIDTH
+    if reduced:
+        # libjpeg skips the discarded DCT coefficients; other codecs decode then shrink
+        flags = cv2.IMREAD_REDUCED_GRAYSCALE_2 if grayscale else cv2.IMREAD_REDUCED_COLOR_2
+    else:
+        flags = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+    image = cv2.imdecode(nparr, flags)
+    if image is None:
+        return None, (0, 0)
+    if not reduced:
+        return image, (image.shape[1], image.shape[0])
+    # OpenCV applies EXIF rotation; the header reports the stored orientation
+    if (image.shape[1] > image.shape[0]) != (width > height):
+        width, height = height, width
+    return image, (width, height)
+
+
+# EXIF orientation tag -> operations that display the stored pixels upright
+_EXIF_ORIENTATION_OPS = {
+    2: lambda image: cv2.flip(image, 1),
+    3: lambda image: cv2.rotate(image, cv2.ROTATE_180),
+    4: lambda image: cv2.flip(image, 0),
+    5: lambda image: cv2.transpose(image),
+    6: lambda image: cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE),
+    7: lambda image: cv2.rotate(cv2.transpose(image), cv2.ROTATE_180),
+    8: lambda image: cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE),
+}
+# Orientations whose upright image swaps width and height
+_EXIF_TRANSPOSED = {5, 6, 7, 8}
+
+
+def _exif_orientation(image_data: ImageBuffer) -> int:
+    """EXIF orientation tag from the image header (PIL parses it lazily); 1 if absent."""
+    if not isinstance(image_data, bytes):
+        image_data = memoryview(image_data)[:HEADER_PROBE_BYTES]
+    try:
+        with Image.open(BytesIO(image_data)) as header:
+            return header.getexif().get(0x0112, 1)
+    except Exception:
+        return 1
+
+
+def _apply_exif_orientation(image: np.ndarray, orientation: int) -> np.ndarray:
+    op = _EXIF_ORIENTATION_OPS.get(orientation)
+    return op(image) if op else image
+
+
+def _image_size(image_data: ImageBuffer) -> Tuple[int, int]:
+    """Pixel (width, height) from the image header (PIL parses it lazily); (0, 0) if unknown."""
+    if not isinstance(image_data, bytes):
+        # BytesIO copies non-bytes buffers, so only hand it the header region
+        image_data = memoryview(image_data)[:HEADER_PROBE_BYTES]
+    try:
+        with Image.open(BytesIO(image_data)) as header:
+            return header.size
+    except Exception:
+        return 0, 0
+
+
+# Tesseract's API objects are not thread-safe, so each OCR thread keeps its own
+_tesserocr_local = threading.local()
+
+
+def _get_tesserocr_api():
+    api = getattr(_tesserocr_local, 'api', None)
+    if api is None:
+        api = _tesserocr_local.api = tesserocr.PyTessBaseAPI(lang='eng+hin')
+    return api
+
+
+def tesseract_image_to_data(image: np.ndarray, psm: int) -> Dict[str, list]:
+    """
+    Word-level OCR of a uint8 array in pytesseract's ``image_to_data`` dict layout.
+    
+    Uses a resident tesserocr API (language models loaded once per thread)
+    when installed, handing it the raw pixel buffer. Otherwise falls back to
+    pytesseract, which spawns the tesseract binary per call; the image is
+    written as uncompressed PNM so no PNG encode (or PIL copy) is paid.
+    """
+    image = np.ascontiguousarray(image)
+    
+    if tesserocr is None:
+        fd, path = tempfile.mkstemp(prefix='tess_', suffix='.pgm' if image.ndim == 2 else '.ppm')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(cv2.imencode('.pgm' if image.ndim == 2 else '.ppm', image)[1])
+            # A path is passed straight to the tesseract binary
+            return pytesseract.image_to_data(
+                path,
+                output_type=pytesseract.Output.DICT,
+                lang='eng+hin',
+                config=f'--psm {psm}'
+            )
+        finally:
+            os.unlink(path)
+    
+    height, width = image.shape[:2]
+    channels = 1 if image.ndim == 2 else image.shape[2]
+    api = _get_tesserocr_api()
+    api.SetPageSegMode(psm)
+    api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+    api.Recognize()
+    
+    data: Dict[str, list] = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+    iterator = api.GetIterator()
+    if iterator is None:
+        return data
+    
+    level = tesserocr.RIL.WORD
+    for word in tesserocr.iterate_level(iterator, level):
+        text = word.GetUTF8Text(level)
+        box = word.BoundingBox(level)
+        if text is None or box is None:
+            continue
+        x1, y1, x2, y2 = box
+        data['text'].append(text)
+        data['conf'].append(word.Confidence(level))
+        data['left'].append(x1)
+        data['top'].append(y1)
+        data['width'].append(x2 - x1)
+        data['height'].append(y2 - y1)
+    return data
+
+
+# Tesseract output is deterministic, so identical preprocessed crops (repeat
+# uploads, batch duplicates) reuse earlier results. Keys are content digests.
+OCR_RESULT_CACHE_SIZE = 512
+_ocr_result_cache: "OrderedDict[bytes, Dict[str, list]]" = OrderedDict()
+_ocr_result_cache_lock = threading.Lock()
+
+
+def cached_image_to_data(processed: np.ndarray, psm: int) -> Dict[str, list]:
+    """tesseract_image_to_data for a uint8 array, memoised in a bounded LRU."""
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{processed.shape}:{psm}".encode())
+    hasher.update(np.ascontiguousarray(processed).data)
+    key = hasher.digest()
+    
+    with _ocr_result_cache_lock:
+        cached = _ocr_result_cache.get(key)
+        if cached is not None:
+            _ocr_result_cache.move_to_end(key)
+            return cached
+    
+    ocr_data = tesseract_image_to_data(processed, psm)
+    
+    with _ocr_result_cache_lock:
+        _ocr_result_cache[key] = ocr_data
+        if len(_ocr_result_cache) > OCR_RESULT_CACHE_SIZE:
+            _ocr_result_cache.popitem(last=False)
+    return ocr_data
+
+
+RESULT_CACHE_SIZE = 1024
+
+
+def _result_cache_key(image_data: ImageBuffer, category: Optional[ProductCategory]) -> bytes:
+    hasher = hashlib.blake2b(image_data, digest_size=16)
+    hasher.update(category.value.encode() if category else b"")
+    return hasher.digest()
+
+
+def _decode_failure() -> OCRProcessingResult:
+    return OCRProcessingResult(
+        confidence_score=0.0,
+        confidence_level=ConfidenceLevel.VERY_LOW,
+        error="Failed to decode image"
+    )
+
+
+@dataclass(slots=True)
 class BoundingBox:
     """Represents a bounding box for a text region"""
     x: int
@@ -176,17 +831,72 @@ class BoundingBox:
     width: int
     height: int
     area: int = field(init=False)
+    center_x: int = field(init=False)
+    center_y: int = field(init=False)
     
     def __post_init__(self):
         self.area = self.width * self.height
+        self.center_x = self.x + self.width // 2
+        self.center_y = self.y + self.height // 2
+
+
+class BoxArray:
+    """
+    A batch of bounding boxes stored as one (N, 4) int64 array of x, y, width, height.
+    
+    Box maths (merging, sorting, word assignment) runs on the columns directly.
+    Iterating or indexing with an int yields ``BoundingBox`` objects for
+    per-region code.
+    """
+    __slots__ = ('xywh',)
+    
+    def __init__(self, xywh: np.ndarray):
+        self.xywh = np.asarray(xywh, dtype=np.int64).reshape(-1, 4)
+    
+    @classmethod
+    def from_boxes(cls, boxes: Iterable[BoundingBox]) -> 'BoxArray':
+        return cls([[b.x, b.y, b.width, b.height] for b in boxes])
+    
+    @classmethod
+    def from_corners(cls, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> 'BoxArray':
+        return cls(np.stack([x1, y1, x2 - x1, y2 - y1], axis=1))
     
     @property
-    def center_y(self) -> int:
-        return self.y + self.height // 2
+    def x(self) -> np.ndarray:
+        return self.xywh[:, 0]
+    
+    @property
+    def y(self) -> np.ndarray:
+        return self.xywh[:, 1]
+    
+    @property
+    def width(self) -> np.ndarray:
+        return self.xywh[:, 2]
+    
+    @property
+    def height(self) -> np.ndarray:
+        return self.xywh[:, 3]
     
     @property
-    def center_x(self) -> int:
-        return self.x + self.width // 2
+    def center_y(self) -> np.ndarray:
+        return self.y + self.height // 2
+    
+    def __len__(self) -> int:
+        return self.xywh.shape[0]
+    
+    def __getitem__(self, index: Union[int, slice, np.ndarray]) -> Union[BoundingBox, 'BoxArray']:
+        if isinstance(index, (int, np.integer)):
+            return BoundingBox(*self.xywh[index].tolist())
+        return BoxArray(self.xywh[index])
+    
+    def __iter__(self) -> Iterator[BoundingBox]:
+        for x, y, w, h in self.xywh.tolist():
+            yield BoundingBox(x=x, y=y, width=w, height=h)
+
+
+def _crop_regions(image: np.ndarray, bounding_boxes: BoxArray) -> List[np.ndarray]:
+    """Views of ``image`` for each box, in box order."""
+    return [image[y:y + h, x:x + w] for x, y, w, h in bounding_boxes.xywh.tolist()]
 
 
 # ============================================================================
@@ -207,11 +917,54 @@ class AdvancedOCRService:
     
     def __init__(self):
         self._configure_tesseract()
-        self._compile_regex_patterns()
+        self.patterns = _COMPILED_PATTERNS
+        self.use_rapid_ocr = ocr_settings.ocr_engine.lower() == "rapidocr"
+        if self.use_rapid_ocr and RapidOCR is None:
+            logger.warning("OCR_ENGINE=rapidocr but rapidocr_onnxruntime is not installed; using Tesseract")
+            self.use_rapid_ocr = False
+        # CLAHE and MSER keep scratch buffers between calls, so each worker thread
+        # builds its own once instead of per image
+        self._cv_local = threading.local()
+        # Keep-alive HTTP session for URL fetches without a caller-supplied session
+        self._session = None
+        # Finished results keyed by image content + category; listing images recur
+        # across category keywords and re-audits
+        self._result_cache: LRUCache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        self._result_cache_lock = threading.Lock()
+    
+    async def _get_session(self):
+        """Get or lazily create the pooled image-fetch session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100, limit_per_host=10, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+    
+    async def aclose(self):
+        """Close the pooled HTTP session (call on application shutdown)."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _get_clahe(self):
+        clahe = getattr(self._cv_local, 'clahe', None)
+        if clahe is None:
+            clahe = self._cv_local.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        return clahe
+    
+    def _get_mser(self):
+        mser = getattr(self._cv_local, 'mser', None)
+        if mser is None:
+            mser = self._cv_local.mser = cv2.MSER_create()
+            mser.setMinArea(60)
+        return mser
     
     def _configure_tesseract(self):
         """Configure Tesseract OCR path"""
-        tesseract_path = find_tesseract_path()
+        tesseract_path = ocr_settings.tesseract_cmd or find_tesseract_path()
         
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
@@ -219,104 +972,6 @@ class AdvancedOCRService:
         else:
             logger.warning("Tesseract OCR not found. OCR features will be disabled.")
     
-    def _compile_regex_patterns(self):
-        """Pre-compile regex patterns for field extraction"""
-        self.patterns = {
-            # MRP patterns - ₹, Rs., MRP with various formats
-            'mrp': re.compile(
-                r'(?:MRP|M\.R\.P\.?|Price|PRICE)[\s:₹.]*[₹Rs.]*\s*([0-9,]+(?:\.[0-9]{1,2})?)|'
-                r'[₹][\s]*([0-9,]+(?:\.[0-9]{1,2})?)|'
-                r'Rs\.?\s*([0-9,]+(?:\.[0-9]{1,2})?)',
-                re.IGNORECASE
-            ),
-            
-            # Net quantity - weight/volume units
-            'net_quantity': re.compile(
-                r'(?:Net\s*(?:Wt\.?|Weight|Qty\.?|Quantity|Contents?)|Contents?)[\s:]*'
-                r'([0-9]+(?:\.[0-9]+)?\s*(?:g|gm|gms|kg|kgs|ml|mL|l|L|ltr|litre|liters?|oz|lb)s?)|'
-                r'([0-9]+(?:\.[0-9]+)?\s*(?:g|gm|gms|kg|kgs|ml|mL|l|L|ltr|litre|liters?))\b',
-                re.IGNORECASE
-            ),
-            
-            # Date patterns (manufacture/expiry)
-            'date': re.compile(
-                r'([0-9]{1,2}[\/\-\.][0-9]{1,2}[\/\-\.][0-9]{2,4})|'  # DD/MM/YYYY or MM/DD/YYYY
-                r'([0-9]{1,2}[\/\-][0-9]{2,4})|'  # MM/YYYY
-                r'([A-Za-z]{3,9}[\s,]*[0-9]{1,2}[,]?\s*[0-9]{2,4})|'  # Month DD, YYYY
-                r'([0-9]{1,2}[\s\-]*[A-Za-z]{3,9}[\s,]*[0-9]{2,4})',  # DD Month YYYY
-                re.IGNORECASE
-            ),
-            
-            # Manufacture date keywords
-            'mfg_date': re.compile(
-                r'(?:Mfg\.?|Mfd\.?|Manufacturing|Manufactured|Packed|Packing|Pkg\.?)[\s:]*(?:Date)?[\s:]*'
-                r'([0-9]{1,2}[\/\-\.][0-9]{1,2}[\/\-\.][0-9]{2,4}|'
-                r'[0-9]{1,2}[\/\-][0-9]{2,4}|'
-                r'[A-Za-z]{3,9}[\s,]*[0-9]{1,2}[,]?\s*[0-9]{2,4}|'
-                r'[0-9]{1,2}[\s\-]*[A-Za-z]{3,9}[\s,]*[0-9]{2,4})',
-                re.IGNORECASE
-            ),
-            
-            # Expiry date keywords
-            'exp_date': re.compile(
-                r'(?:Exp\.?|Expiry|Expires?|Best\s*Before|BB|Use\s*By|Use\s*Before)[\s:]*(?:Date)?[\s:]*'
-                r'([0-9]{1,2}[\/\-\.][0-9]{1,2}[\/\-\.][0-9]{2,4}|'
-                r'[0-9]{1,2}[\/\-][0-9]{2,4}|'
-                r'[A-Za-z]{3,9}[\s,]*[0-9]{1,2}[,]?\s*[0-9]{2,4}|'
-                r'[0-9]{1,2}[\s\-]*[A-Za-z]{3,9}[\s,]*[0-9]{2,4}|'
-                r'[0-9]+\s*(?:months?|days?|years?)\s*(?:from\s*(?:mfg|manufacturing|packing))?)',
-                re.IGNORECASE
-            ),
-            
-            # Country of origin
-            'country': re.compile(
-                r'(?:Country\s*of\s*Origin|Made\s*in|Product\s*of|Manufactured\s*in|Origin)[\s:]*'
-                r'([A-Za-z]+(?:\s+[A-Za-z]+)?)',
-                re.IGNORECASE
-            ),
-            
-            # Manufacturer/Importer details
-            'manufacturer': re.compile(
-                r'(?:Mfg\.?\s*(?:by)?|Manufactured\s*by|Packed\s*by|Packer|Marketer|Marketed\s*by)[\s:]*'
-                r'([A-Za-z0-9][A-Za-z0-9\s,\.&\-]+(?:Ltd\.?|Pvt\.?|Inc\.?|LLC|Co\.?|Corporation|Industries)?)',
-                re.IGNORECASE
-            ),
-            
-            'importer': re.compile(
-                r'(?:Imported\s*by|Importer)[\s:]*'
-                r'([A-Za-z0-9][A-Za-z0-9\s,\.&\-]+(?:Ltd\.?|Pvt\.?|Inc\.?|LLC|Co\.?)?)',
-                re.IGNORECASE
-            ),
-            
-            # Consumer care / Contact
-            'consumer_care': re.compile(
-                r'(?:Consumer\s*Care|Customer\s*Care|Helpline|Contact|Toll\s*Free)[\s:]*'
-                r'([0-9\-\+\s\(\)]{8,20})|'
-                r'(?:1800[\-\s]*[0-9\-\s]{6,12})',
-                re.IGNORECASE
-            ),
-            
-            # Batch number
-            'batch': re.compile(
-                r'(?:Batch|Lot|B\.?\s*No\.?|L\.?\s*No\.?)[\s:]*([A-Za-z0-9\-\/]{4,20})',
-                re.IGNORECASE
-            ),
-            
-            # FSSAI License (14 digits)
-            'fssai': re.compile(
-                r'(?:FSSAI|Lic\.?\s*No\.?|License\s*No\.?)[\s:]*([0-9]{10,14})|'
-                r'\b([0-9]{14})\b',
-                re.IGNORECASE
-            ),
-            
-            # BIS Certification
-            'bis': re.compile(
-                r'(?:BIS|ISI|IS[\s:]*[0-9]+)[\s:]*([A-Za-z0-9\-\/]+)|'
-                r'(?:R-[0-9]{7,})',
-                re.IGNORECASE
-            ),
-        }
-    
     # ========================================================================
     # Image Preprocessing Pipeline
     # ========================================================================
@@ -341,51 +996,44 @@ class AdvancedOCRService:
         # Step 1: Resize for consistent resolution
         image = self._resize_image(image)
         
-        # Step 2: Convert to grayscale
+        # Steps 2-3: Convert to grayscale and blur to reduce noise. The remaining
+        # stages run in place on this one buffer; a grayscale input may be a view
+        # into the caller's image, so it is never written to.
         if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            buffer = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            cv2.GaussianBlur(buffer, (3, 3), 0, dst=buffer)
         else:
-            gray = image
-        
-        # Step 3: Apply Gaussian blur to reduce noise
-        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+            buffer = cv2.GaussianBlur(image, (3, 3), 0)
         
         # Step 4: Apply adaptive thresholding
         # Using Gaussian method for better handling of varying illumination
-        thresh = cv2.adaptiveThreshold(
-            blurred,
-            255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY,
-            11,  # Block size
-            2    # Constant subtracted from mean
+        buffer = adaptive_threshold(
+            buffer,
+            block_size=11,
+            c=2,  # Constant subtracted from mean
         )
         
         # Step 5: Morphological operations to clean up the image
-        # Create a small kernel for noise removal
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2, 2))
-        
         # Opening removes small noise
-        cleaned = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel, iterations=1)
+        cv2.morphologyEx(buffer, cv2.MORPH_OPEN, _KERNEL_NOISE, dst=buffer, iterations=1)
         
         # Closing fills small holes in text
-        cleaned = cv2.morphologyEx(cleaned, cv2.MORPH_CLOSE, kernel, iterations=1)
+        cv2.morphologyEx(buffer, cv2.MORPH_CLOSE, _KERNEL_NOISE, dst=buffer, iterations=1)
         
-        return cleaned
+        return buffer
     
-    def _resize_image(self, image: np.ndarray) -> np.ndarray:
-        """Resize image to target width while maintaining aspect ratio"""
+    def _resize_image(self, image: np.ndarray, target_width: int = TARGET_WIDTH) -> np.ndarray:
+        """
+        Downscale images wider than the target width, keeping aspect ratio.
+        
+        Smaller images pass through untouched: upscaling adds no information
+        and every later stage is linear in pixel count.
+        """
         height, width = image.shape[:2]
         
-        if width < TARGET_WIDTH:
-            scale = TARGET_WIDTH / width
-            new_width = TARGET_WIDTH
-            new_height = int(height * scale)
-            image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
-        elif width > TARGET_WIDTH * 2:
-            # Downscale very large images
-            scale = TARGET_WIDTH / width
-            new_width = TARGET_WIDTH
+        if width > target_width:
+            scale = target_width / width
+            new_width = target_width
             new_height = int(height * scale)
             image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
         
@@ -396,8 +1044,8 @@ class AdvancedOCRService:
         Preprocess image specifically for bounding box detection.
         Uses different parameters optimized for edge/contour detection.
         """
-        # Resize first
-        image = self._resize_image(image)
+        # Resize first; the bilateral filter dominates and scales with pixel count
+        image = self._resize_image(image, DETECT_WIDTH)
         
         # Convert to grayscale
         if len(image.shape) == 3:
@@ -409,8 +1057,7 @@ class AdvancedOCRService:
         bilateral = cv2.bilateralFilter(gray, 9, 75, 75)
         
         # Apply CLAHE (Contrast Limited Adaptive Histogram Equalization)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(bilateral)
+        enhanced = self._get_clahe().apply(bilateral)
         
         return enhanced
     
@@ -418,13 +1065,13 @@ class AdvancedOCRService:
     # Bounding Box Detection
     # ========================================================================
     
-    def detect_text_regions(self, image: np.ndarray) -> List[BoundingBox]:
+    def detect_text_regions(self, image: np.ndarray) -> BoxArray:
         """
         Detect text regions using contour-based detection.
         
         Method:
         1. Preprocess image for detection
-        2. Apply Canny edge detection
+        2. Extract stroke edges (morphological gradient + Otsu)
         3. Find contours
         4. Filter contours by area and aspect ratio
         5. Sort bounding boxes top-to-bottom, left-to-right
@@ -433,50 +1080,57 @@ class AdvancedOCRService:
             image: Input image as numpy array
             
         Returns:
-            List of BoundingBox objects sorted for reading order
+            BoxArray sorted for reading order
         """
         # Get image dimensions
         height, width = image.shape[:2]
-        image_area = height * width
         
-        # Preprocess for detection
+        # Preprocess for detection (may downscale); contours are filtered in the
+        # processed image's coordinates and mapped back before padding
         processed = self.preprocess_for_detection(image)
+        image_area = processed.shape[0] * processed.shape[1]
+        scale = width / processed.shape[1]
+        # MIN_CONTOUR_AREA is calibrated at TARGET_WIDTH; shrink it with the detection copy
+        min_area = MIN_CONTOUR_AREA * (processed.shape[1] / min(width, TARGET_WIDTH)) ** 2
         
-        # Apply Canny edge detection
-        edges = cv2.Canny(processed, 50, 150)
+        # Edge map from the morphological gradient, binarised with Otsu. Gradient
+        # edges are a few pixels thick, so one dilation joins characters into lines
+        edges = cv2.morphologyEx(processed, cv2.MORPH_GRADIENT, _KERNEL_GRADIENT)
+        cv2.threshold(edges, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=edges)
         
         # Dilate edges to connect nearby text
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 3))
-        dilated = cv2.dilate(edges, kernel, iterations=2)
+        dilated = cv2.dilate(edges, _KERNEL_TEXT_LINE, dst=edges, iterations=1)
         
         # Find contours
         contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
-        bounding_boxes: List[BoundingBox] = []
-        
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            area = w * h
-            
-            # Filter by area
-            if area < MIN_CONTOUR_AREA:
-                continue
-            if area > image_area * MAX_CONTOUR_AREA_RATIO:
-                continue
-            
-            # Filter by aspect ratio (text regions are typically wider than tall)
-            aspect_ratio = w / h if h > 0 else 0
-            if aspect_ratio < MIN_ASPECT_RATIO or aspect_ratio > MAX_ASPECT_RATIO:
-                continue
+        bounding_boxes = BoxArray(np.empty((0, 4), dtype=np.int64))
+        
+        if contours:
+            # Filter all contour rects at once (N x 4 array of x, y, w, h)
+            rects = np.array([cv2.boundingRect(contour) for contour in contours], dtype=np.int64)
+            w, h = rects[:, 2], rects[:, 3]
+            areas = w * h
+            # Text regions are typically wider than tall; zero-height rects fail the area check
+            aspect_ratios = w / np.maximum(h, 1)
+            keep = (
+                (areas >= min_area)
+                & (areas <= image_area * MAX_CONTOUR_AREA_RATIO)
+                & (aspect_ratios >= MIN_ASPECT_RATIO)
+                & (aspect_ratios <= MAX_ASPECT_RATIO)
+            )
+            rects = rects[keep]
+            if scale != 1:
+                rects = np.rint(rects * scale).astype(np.int64)
             
-            # Add padding around detected region
+            # Add padding around detected regions
             padding = 5
-            x = max(0, x - padding)
-            y = max(0, y - padding)
-            w = min(width - x, w + 2 * padding)
-            h = min(height - y, h + 2 * padding)
+            xs = np.maximum(0, rects[:, 0] - padding)
+            ys = np.maximum(0, rects[:, 1] - padding)
+            ws = np.minimum(width - xs, rects[:, 2] + 2 * padding)
+            hs = np.minimum(height - ys, rects[:, 3] + 2 * padding)
             
-            bounding_boxes.append(BoundingBox(x=x, y=y, width=w, height=h))
+            bounding_boxes = BoxArray(np.stack([xs, ys, ws, hs], axis=1))
         
         # If no boxes detected, try alternative method
         if not bounding_boxes:
@@ -488,7 +1142,7 @@ class AdvancedOCRService:
         logger.info(f"Detected {len(bounding_boxes)} text regions")
         return bounding_boxes
     
-    def _detect_text_regions_mser(self, image: np.ndarray) -> List[BoundingBox]:
+    def _detect_text_regions_mser(self, image: np.ndarray) -> BoxArray:
         """
         Alternative text detection using MSER (Maximally Stable Extremal Regions).
         Used as fallback when contour detection fails.
@@ -501,120 +1155,66 @@ class AdvancedOCRService:
         else:
             gray = image
         
-        # Create MSER detector
-        mser = cv2.MSER_create()
-        mser.setMinArea(60)
+        # Reuse this thread's MSER detector; only the max area depends on the image
+        mser = self._get_mser()
         mser.setMaxArea(int(width * height * 0.3))
         
         # Detect regions
         regions, _ = mser.detectRegions(gray)
         
-        bounding_boxes: List[BoundingBox] = []
+        rects = np.array([cv2.boundingRect(region) for region in regions], dtype=np.int64).reshape(-1, 4)
         
-        for region in regions:
-            x, y, w, h = cv2.boundingRect(region)
-            
-            # Filter small/large regions
-            area = w * h
-            if area < MIN_CONTOUR_AREA or area > width * height * MAX_CONTOUR_AREA_RATIO:
-                continue
-            
-            bounding_boxes.append(BoundingBox(x=x, y=y, width=w, height=h))
+        # Filter small/large regions
+        areas = rects[:, 2] * rects[:, 3]
+        bounding_boxes = BoxArray(rects[
+            (areas >= MIN_CONTOUR_AREA) & (areas <= width * height * MAX_CONTOUR_AREA_RATIO)
+        ])
         
         # Merge overlapping boxes
         bounding_boxes = self._merge_overlapping_boxes(bounding_boxes)
         
         return bounding_boxes
     
-    def _merge_overlapping_boxes(self, boxes: List[BoundingBox], overlap_thresh: float = 0.5) -> List[BoundingBox]:
-        """Merge overlapping bounding boxes to reduce fragmentation"""
+    def _merge_overlapping_boxes(self, boxes: BoxArray, overlap_thresh: float = 0.5) -> BoxArray:
+        """
+        Merge overlapping bounding boxes to reduce fragmentation.
+        
+        Two boxes overlap when their intersection covers more than
+        ``overlap_thresh`` of the smaller box. Each connected cluster of
+        overlapping boxes is replaced by its union.
+        """
         if not boxes:
             return boxes
         
-        # Convert to numpy array for NMS-like processing
-        rects = np.array([[b.x, b.y, b.x + b.width, b.y + b.height] for b in boxes])
-        
-        merged = []
-        used = set()
-        
-        for i, box in enumerate(boxes):
-            if i in used:
-                continue
-            
-            # Find overlapping boxes
-            current_rect = [box.x, box.y, box.x + box.width, box.y + box.height]
-            
-            for j, other_box in enumerate(boxes):
-                if j <= i or j in used:
-                    continue
-                
-                other_rect = [other_box.x, other_box.y, 
-                             other_box.x + other_box.width, other_box.y + other_box.height]
-                
-                # Calculate intersection
-                x1 = max(current_rect[0], other_rect[0])
-                y1 = max(current_rect[1], other_rect[1])
-                x2 = min(current_rect[2], other_rect[2])
-                y2 = min(current_rect[3], other_rect[3])
-                
-                if x1 < x2 and y1 < y2:
-                    intersection = (x2 - x1) * (y2 - y1)
-                    area1 = (current_rect[2] - current_rect[0]) * (current_rect[3] - current_rect[1])
-                    area2 = (other_rect[2] - other_rect[0]) * (other_rect[3] - other_rect[1])
-                    min_area = min(area1, area2)
-                    
-                    if intersection / min_area > overlap_thresh:
-                        # Merge boxes
-                        current_rect[0] = min(current_rect[0], other_rect[0])
-                        current_rect[1] = min(current_rect[1], other_rect[1])
-                        current_rect[2] = max(current_rect[2], other_rect[2])
-                        current_rect[3] = max(current_rect[3], other_rect[3])
-                        used.add(j)
-            
-            merged.append(BoundingBox(
-                x=current_rect[0],
-                y=current_rect[1],
-                width=current_rect[2] - current_rect[0],
-                height=current_rect[3] - current_rect[1]
-            ))
-            used.add(i)
-        
-        return merged
+        # (N, 4) array of x1, y1, x2, y2
+        rects = np.concatenate([boxes.xywh[:, :2], boxes.xywh[:, :2] + boxes.xywh[:, 2:]], axis=1)
+        labels = _overlap_labels(rects, overlap_thresh)
+        
+        # Union box per component, reduced over all components at once
+        roots, component = np.unique(labels, return_inverse=True)
+        x1 = np.full(len(roots), np.iinfo(np.int64).max)
+        y1 = np.full(len(roots), np.iinfo(np.int64).max)
+        x2 = np.full(len(roots), np.iinfo(np.int64).min)
+        y2 = np.full(len(roots), np.iinfo(np.int64).min)
+        np.minimum.at(x1, component, rects[:, 0])
+        np.minimum.at(y1, component, rects[:, 1])
+        np.maximum.at(x2, component, rects[:, 2])
+        np.maximum.at(y2, component, rects[:, 3])
+        
+        return BoxArray.from_corners(x1, y1, x2, y2)
     
-    def _sort_bounding_boxes(self, boxes: List[BoundingBox]) -> List[BoundingBox]:
+    def _sort_bounding_boxes(self, boxes: BoxArray) -> BoxArray:
         """Sort bounding boxes in reading order (top-to-bottom, left-to-right)"""
-        if not boxes:
+        if not len(boxes):
             return boxes
         
-        # Calculate average height for row grouping
-        avg_height = sum(b.height for b in boxes) / len(boxes)
-        row_threshold = avg_height * 0.5
-        
-        # Group boxes into rows
-        sorted_boxes = sorted(boxes, key=lambda b: b.y)
-        rows: List[List[BoundingBox]] = []
-        current_row: List[BoundingBox] = []
-        current_y = sorted_boxes[0].y if sorted_boxes else 0
-        
-        for box in sorted_boxes:
-            if abs(box.center_y - current_y) < row_threshold and current_row:
-                current_row.append(box)
-            else:
-                if current_row:
-                    rows.append(current_row)
-                current_row = [box]
-                current_y = box.center_y
-        
-        if current_row:
-            rows.append(current_row)
+        # Group boxes into rows (threshold: half the average height), scanning top to bottom
+        by_y = np.argsort(boxes.y, kind='stable')
+        row_ids = _group_rows(boxes.center_y[by_y], float(boxes.height.mean()) * 0.5)
         
         # Sort each row left-to-right
-        result = []
-        for row in rows:
-            row.sort(key=lambda b: b.x)
-            result.extend(row)
-        
-        return result
+        order = by_y[np.lexsort((boxes.x[by_y], row_ids))]
+        return boxes[order]
     
     # ========================================================================
     # Region-wise OCR
@@ -641,17 +1241,9 @@ class AdvancedOCRService:
         # Preprocess the cropped region
         processed = self.preprocess_image(cropped)
         
-        # Convert to PIL for pytesseract
-        pil_image = Image.fromarray(processed)
-        
         try:
             # Get detailed OCR data
-            ocr_data = pytesseract.image_to_data(
-                pil_image, 
-                output_type=pytesseract.Output.DICT,
-                lang='eng+hin',
-                config='--psm 6'  # Assume uniform block of text
-            )
+            ocr_data = cached_image_to_data(processed, psm=6)  # Assume uniform block of text
         except Exception as e:
             logger.warning(f"OCR failed for region: {e}")
             return "", 0.0, []
@@ -684,38 +1276,139 @@ class AdvancedOCRService:
         
         return extracted_text, avg_confidence, words
     
+    def recognize_regions_batched(
+        self, 
+        image: np.ndarray, 
+        bounding_boxes: BoxArray
+    ) -> List[Tuple[str, float]]:
+        """
+        Recognise all regions with one in-process RapidOCR call.
+        
+        The CRNN recogniser is trained on natural images, so crops are passed
+        without binarisation.
+        
+        Returns:
+            List of (text, confidence 0-100) in bounding box order
+        """
+        return self.recognize_crops_batched(_crop_regions(image, bounding_boxes))
+    
+    def recognize_crops_batched(self, crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+        """Recognise crops (possibly from several images) in one RapidOCR call."""
+        try:
+            rec_results, _ = get_rapid_ocr().text_rec(crops)
+        except Exception as e:
+            logger.warning(f"Batched OCR failed: {e}")
+            return [("", 0.0)] * len(crops)
+        
+        results = []
+        for text, score in rec_results:
+            confidence = float(score) * 100.0
+            if not text.strip() or confidence < MIN_CONFIDENCE_THRESHOLD:
+                results.append(("", 0.0))
+            else:
+                results.append((text.strip(), confidence))
+        return results
+    
+    def recognize_regions_single_pass(
+        self, 
+        image: np.ndarray, 
+        bounding_boxes: BoxArray
+    ) -> List[Tuple[str, float]]:
+        """
+        Recognise the whole image with one Tesseract call and bucket the words.
+        
+        Sparse-text mode (PSM 11) finds words anywhere on the label; each word
+        is assigned to every region containing its centre.
+        
+        Returns:
+            List of (text, confidence 0-100) in bounding box order
+        """
+        processed = self.preprocess_image(image)
+        # preprocess_image may downscale; map word boxes back to image coordinates
+        scale = image.shape[1] / processed.shape[1]
+        
+        try:
+            ocr_data = cached_image_to_data(processed, psm=11)  # Sparse text
+        except Exception as e:
+            logger.warning(f"Full-image OCR failed: {e}")
+            return [("", 0.0)] * len(bounding_boxes)
+        
+        words = [text.strip() for text in ocr_data['text']]
+        confidences = np.asarray(ocr_data['conf'], dtype=np.float64)
+        valid = np.array([bool(word) for word in words]) & (confidences >= MIN_CONFIDENCE_THRESHOLD)
+        centers_x = (np.asarray(ocr_data['left']) + np.asarray(ocr_data['width']) / 2) * scale
+        centers_y = (np.asarray(ocr_data['top']) + np.asarray(ocr_data['height']) / 2) * scale
+        
+        # (boxes x words) membership of each valid word centre in each box
+        x, y = bounding_boxes.x[:, None], bounding_boxes.y[:, None]
+        inside = (
+            valid[None, :]
+            & (centers_x[None, :] >= x) & (centers_x[None, :] < x + bounding_boxes.width[:, None])
+            & (centers_y[None, :] >= y) & (centers_y[None, :] < y + bounding_boxes.height[:, None])
+        )
+        
+        results = []
+        for row in inside:
+            members = np.flatnonzero(row)
+            if members.size:
+                results.append((' '.join(words[i] for i in members), float(confidences[members].mean())))
+            else:
+                results.append(("", 0.0))
+        return results
+    
     def perform_region_wise_ocr(
         self, 
         image: np.ndarray, 
-        bounding_boxes: List[BoundingBox]
-    ) -> Tuple[List[TextRegion], float]:
+        bounding_boxes: BoxArray
+    ) -> Tuple[List[TextRegion], float, str]:
         """
         Perform OCR on all detected regions.
         
         Args:
             image: Full image as numpy array
-            bounding_boxes: List of detected text regions
+            bounding_boxes: Detected text regions
             
         Returns:
-            Tuple of (list of TextRegion results, overall confidence)
+            Tuple of (list of TextRegion results, overall confidence, combined text)
         """
+        if self.use_rapid_ocr:
+            recognized = self.recognize_regions_batched(image, bounding_boxes)
+        elif ocr_settings.tesseract_single_pass:
+            recognized = self.recognize_regions_single_pass(image, bounding_boxes)
+        else:
+            # Regions only read the shared image, so their OCR calls can overlap
+            recognized = list(_region_ocr_pool.map(
+                lambda bbox: self.extract_text_from_region(image, bbox)[:2],
+                bounding_boxes
+            ))
+        
+        return self._assemble_regions(bounding_boxes, recognized)
+    
+    def _assemble_regions(
+        self,
+        bounding_boxes: BoxArray,
+        recognized: List[Tuple[str, float]]
+    ) -> Tuple[List[TextRegion], float, str]:
+        """Turn per-box (text, confidence) results into TextRegions, overall confidence and combined text."""
         regions: List[TextRegion] = []
         all_confidences: List[float] = []
+        texts: List[str] = []
         
-        for idx, bbox in enumerate(bounding_boxes):
-            text, confidence, _ = self.extract_text_from_region(image, bbox)
+        for idx, ((x, y, w, h), (text, confidence)) in enumerate(zip(bounding_boxes.xywh.tolist(), recognized)):
             
             if text:  # Only include regions with extracted text
-                regions.append(TextRegion(
-                    x=bbox.x,
-                    y=bbox.y,
-                    width=bbox.width,
-                    height=bbox.height,
+                # Trusted internal values; skip validation
+                regions.append(TextRegion.model_construct(
+                    x=x,
+                    y=y,
+                    width=w,
+                    height=h,
                     text=text,
                     confidence=confidence / 100.0,  # Normalize to 0-1
                     region_index=idx
                 ))
                 all_confidences.append(confidence)
+                texts.append(text)
         
         # Calculate overall confidence
         overall_confidence = (
@@ -724,7 +1417,7 @@ class AdvancedOCRService:
         )
         
         logger.info(f"Extracted text from {len(regions)} regions, overall confidence: {overall_confidence:.2f}")
-        return regions, overall_confidence
+        return regions, overall_confidence, ' '.join(texts)
     
     # ========================================================================
     # Structured Field Extraction
@@ -764,87 +1457,92 @@ class AdvancedOCRService:
         # Combine all text for global pattern matching
         full_text = combined_text or ' '.join(r.text for r in text_regions)
         
+        # Locate every relevant field in a single pass
+        matches = scan_field_matches(full_text, category_field_names(category))
+        
+        # Alternatives in the field patterns each capture their own group, so the
+        # one group that took part in a match is match.lastindex
+        
         # Extract MRP
-        mrp_match = self.patterns['mrp'].search(full_text)
+        mrp_match = matches.get('mrp')
         if mrp_match:
-            # Get the first non-None group
-            mrp_value = next((g for g in mrp_match.groups() if g), None)
+            mrp_value = mrp_match.group(mrp_match.lastindex)
             if mrp_value:
                 fields.mrp = f"₹{mrp_value.replace(',', '')}"
         
         # Extract Net Quantity
-        qty_match = self.patterns['net_quantity'].search(full_text)
+        qty_match = matches.get('net_quantity')
         if qty_match:
-            qty_value = next((g for g in qty_match.groups() if g), None)
+            qty_value = qty_match.group(qty_match.lastindex)
             if qty_value:
                 fields.net_quantity = qty_value
         
         # Extract Manufacture Date
-        mfg_match = self.patterns['mfg_date'].search(full_text)
+        mfg_match = matches.get('mfg_date')
         if mfg_match:
             fields.manufacture_date = mfg_match.group(1)
         
         # Extract Expiry Date
-        exp_match = self.patterns['exp_date'].search(full_text)
+        exp_match = matches.get('exp_date')
         if exp_match:
             fields.expiry_date = exp_match.group(1)
         
         # If no specific dates found, try generic date extraction
         if not fields.manufacture_date and not fields.expiry_date:
-            date_matches = self.patterns['date'].findall(full_text)
+            # Only the first two dates are used, so stop scanning once they are found
+            date_matches = [m.group(m.lastindex) for m in itertools.islice(self.patterns['date'].finditer(full_text), 2)]
             if len(date_matches) >= 2:
                 # Assume first date is manufacture, second is expiry
-                fields.manufacture_date = next((d for d in date_matches[0] if d), None)
-                fields.expiry_date = next((d for d in date_matches[1] if d), None)
+                fields.manufacture_date = date_matches[0]
+                fields.expiry_date = date_matches[1]
             elif len(date_matches) == 1:
                 # Single date - likely expiry for food products
-                date_val = next((d for d in date_matches[0] if d), None)
+                date_val = date_matches[0]
                 if category == ProductCategory.FOOD:
                     fields.expiry_date = date_val
                 else:
                     fields.manufacture_date = date_val
         
         # Extract Country of Origin
-        country_match = self.patterns['country'].search(full_text)
+        country_match = matches.get('country')
         if country_match:
             fields.country_of_origin = country_match.group(1).strip()
         
         # Extract Manufacturer
-        mfr_match = self.patterns['manufacturer'].search(full_text)
+        mfr_match = matches.get('manufacturer')
         if mfr_match:
             fields.manufacturer = mfr_match.group(1).strip()
         
         # Extract Importer
-        imp_match = self.patterns['importer'].search(full_text)
+        imp_match = matches.get('importer')
         if imp_match:
             fields.importer = imp_match.group(1).strip()
         
         # Extract Consumer Care
-        care_match = self.patterns['consumer_care'].search(full_text)
+        care_match = matches.get('consumer_care')
         if care_match:
-            contact = next((g for g in care_match.groups() if g), None)
+            # The toll-free branch has no capture group
+            contact = care_match.group(care_match.lastindex) if care_match.lastindex else None
             if contact:
                 fields.consumer_care = contact.strip()
         
         # Extract Batch Number
-        batch_match = self.patterns['batch'].search(full_text)
+        batch_match = matches.get('batch')
         if batch_match:
             fields.batch_number = batch_match.group(1)
         
-        # Extract FSSAI License (primarily for food)
-        if category == ProductCategory.FOOD or category is None:
-            fssai_match = self.patterns['fssai'].search(full_text)
-            if fssai_match:
-                fssai_val = next((g for g in fssai_match.groups() if g), None)
-                if fssai_val and len(fssai_val) >= 10:
-                    fields.fssai_license = fssai_val
-        
-        # Extract BIS Certification (primarily for electronics)
-        if category == ProductCategory.ELECTRONICS or category is None:
-            bis_match = self.patterns['bis'].search(full_text)
-            if bis_match:
-                bis_val = bis_match.group(1) if bis_match.lastindex else bis_match.group(0)
-                fields.bis_certification = bis_val
+        # Extract FSSAI License / BIS Certification. category_field_names only
+        # scans for these on food / electronics (or unknown) products
+        fssai_match = matches.get('fssai')
+        if fssai_match:
+            fssai_val = fssai_match.group(fssai_match.lastindex)
+            if fssai_val and len(fssai_val) >= 10:
+                fields.fssai_license = fssai_val
+        
+        bis_match = matches.get('bis')
+        if bis_match:
+            bis_val = bis_match.group(1) if bis_match.lastindex else bis_match.group(0)
+            fields.bis_certification = bis_val
         
         logger.info(f"Extracted fields: MRP={fields.mrp}, Qty={fields.net_quantity}, "
                    f"Mfg={fields.manufacture_date}, Exp={fields.expiry_date}")
@@ -871,11 +1569,13 @@ class AdvancedOCRService:
         if not text_regions:
             return 0.0, ConfidenceLevel.VERY_LOW, [], 0
         
-        region_confidences = [r.confidence for r in text_regions]
-        overall_confidence = sum(region_confidences) / len(region_confidences)
+        # One float64 array serves the mean, the low-confidence count and the output list
+        confidences = np.fromiter((r.confidence for r in text_regions), dtype=np.float64, count=len(text_regions))
+        overall_confidence = float(confidences.mean())
         
         # Count low confidence regions
-        low_conf_count = sum(1 for c in region_confidences if c < LOW_CONFIDENCE_THRESHOLD / 100.0)
+        low_conf_count = int(np.count_nonzero(confidences < LOW_CONFIDENCE_THRESHOLD / 100.0))
+        region_confidences = confidences.tolist()
         
         # Determine confidence level
         if overall_confidence >= 0.85:
@@ -895,7 +1595,7 @@ class AdvancedOCRService:
     
     def process_image(
         self, 
-        image_data: bytes,
+        image_data: ImageBuffer,
         category: Optional[ProductCategory] = None
     ) -> OCRProcessingResult:
         """
@@ -909,86 +1609,38 @@ class AdvancedOCRService:
         5. Calculate confidence metrics
         
         Args:
-            image_data: Raw image bytes
+            image_data: Raw image bytes (any buffer, e.g. a memory-mapped file)
             category: Optional product category
             
         Returns:
             OCRProcessingResult with all extracted data
         """
-        import time
         start_time = time.time()
         
+        cache_key = _result_cache_key(image_data, category)
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(update={'processing_time_ms': 0.0})
+        
         try:
-            # Load image
-            nparr = np.frombuffer(image_data, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # Step 1: Load image and detect text regions
+            image, bounding_boxes, source_size = self._load_and_detect(image_data)
             
             if image is None:
-                return OCRProcessingResult(
-                    confidence_score=0.0,
-                    confidence_level=ConfidenceLevel.VERY_LOW,
-                    error="Failed to decode image"
-                )
+                return _decode_failure()
             
             height, width = image.shape[:2]
             
-            # Step 1: Detect text regions
-            bounding_boxes = self.detect_text_regions(image)
-            
-            # If no regions detected, fall back to full-image OCR
-            if not bounding_boxes:
-                logger.warning("No text regions detected, using full-image OCR")
-                bounding_boxes = [BoundingBox(x=0, y=0, width=width, height=height)]
-            
-            # Step 2: Perform region-wise OCR
-            text_regions, overall_conf = self.perform_region_wise_ocr(image, bounding_boxes)
-            
-            # Step 3: Combine all text
-            combined_text = ' '.join(r.text for r in text_regions)
-            
-            # Step 4: Extract compliance fields
-            fields = self.extract_compliance_fields(text_regions, combined_text, category)
+            # Step 2-3: Perform region-wise OCR and combine all text
+            text_regions, overall_conf, combined_text = self.perform_region_wise_ocr(image, bounding_boxes)
             
-            # Step 5: Calculate confidence metrics
-            confidence, level, region_confs, low_conf_count = self.calculate_confidence_metrics(text_regions)
+            # The pixels are no longer needed; free them before field extraction
+            total_regions = len(bounding_boxes)
+            del image, bounding_boxes
             
-            # Determine if review is needed
-            needs_review = level in [ConfidenceLevel.LOW, ConfidenceLevel.VERY_LOW]
-            
-            processing_time = (time.time() - start_time) * 1000  # Convert to ms
-            
-            return OCRProcessingResult(
-                # Structured fields
-                mrp=fields.mrp,
-                net_quantity=fields.net_quantity,
-                manufacture_date=fields.manufacture_date,
-                expiry_date=fields.expiry_date,
-                country_of_origin=fields.country_of_origin,
-                manufacturer=fields.manufacturer,
-                importer=fields.importer,
-                consumer_care=fields.consumer_care,
-                batch_number=fields.batch_number,
-                fssai_license=fields.fssai_license,
-                bis_certification=fields.bis_certification,
-                
-                # Confidence metrics
-                confidence_score=round(confidence, 4),
-                confidence_level=level,
-                region_confidences=region_confs,
-                
-                # Raw data
-                raw_text_regions=text_regions,
-                combined_text=combined_text,
-                
-                # Metadata
-                total_regions_detected=len(bounding_boxes),
-                regions_processed=len(text_regions),
-                low_confidence_regions=low_conf_count,
-                processing_time_ms=round(processing_time, 2),
-                image_dimensions=(width, height),
-                
-                # Flags
-                needs_review=needs_review
+            result = self._build_result(
+                text_regions, combined_text, total_regions, (width, height), source_size, category, start_time
             )
             
         except Exception as e:
@@ -998,11 +1650,190 @@ class AdvancedOCRService:
                 confidence_level=ConfidenceLevel.VERY_LOW,
                 error=str(e)
             )
+        
+        # Low-confidence results are left uncached so a retry can do better
+        if not result.needs_review:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = result
+        return result
+    
+    def _load_and_detect(
+        self,
+        image_data: ImageBuffer
+    ) -> Tuple[Optional[np.ndarray], Optional[BoxArray], Tuple[int, int]]:
+        """
+        Decode image bytes and detect text regions; (None, None, (0, 0)) if undecodable.
+        
+        Boxes are in the decoded array's coordinates; the source image size is
+        returned alongside so results can be mapped back to it.
+        """
+        # Detection and Tesseract only use luma, so decode straight to one
+        # grayscale buffer shared by every stage; RapidOCR wants colour crops
+        image, source_size = decode_image(image_data, grayscale=not self.use_rapid_ocr)
+        if image is None:
+            return None, None, (0, 0)
+        
+        bounding_boxes = self.detect_text_regions(image)
+        
+        # If no regions detected, fall back to full-image OCR
+        if not bounding_boxes:
+            logger.warning("No text regions detected, using full-image OCR")
+            height, width = image.shape[:2]
+            bounding_boxes = BoxArray([[0, 0, width, height]])
+        
+        return image, bounding_boxes, source_size
+    
+    def _build_result(
+        self,
+        text_regions: List[TextRegion],
+        combined_text: str,
+        total_regions: int,
+        decoded_size: Tuple[int, int],
+        source_size: Tuple[int, int],
+        category: Optional[ProductCategory],
+        start_time: float
+    ) -> OCRProcessingResult:
+        """Field extraction and confidence scoring over recognised regions."""
+        
+        # Wide images are decoded at reduced size; report regions and
+        # dimensions in the uploaded image's pixels
+        if source_size != decoded_size:
+            scale_x = source_size[0] / decoded_size[0]
+            scale_y = source_size[1] / decoded_size[1]
+            for region in text_regions:
+                region.x = round(region.x * scale_x)
+                region.y = round(region.y * scale_y)
+                region.width = round(region.width * scale_x)
+                region.height = round(region.height * scale_y)
+        
+        # Step 4: Extract compliance fields
+        fields = self.extract_compliance_fields(text_regions, combined_text, category)
+        
+        # Step 5: Calculate confidence metrics
+        confidence, level, region_confs, low_conf_count = self.calculate_confidence_metrics(text_regions)
+        
+        # Determine if review is needed
+        needs_review = level in [ConfidenceLevel.LOW, ConfidenceLevel.VERY_LOW]
+        
+        processing_time = (time.time() - start_time) * 1000  # Convert to ms
+        
+        # Every value below is produced by this pipeline, so skip re-validation
+        return OCRProcessingResult.model_construct(
+            # Structured fields
+            mrp=fields.mrp,
+            net_quantity=fields.net_quantity,
+            manufacture_date=fields.manufacture_date,
+            expiry_date=fields.expiry_date,
+            country_of_origin=fields.country_of_origin,
+            manufacturer=fields.manufacturer,
+            importer=fields.importer,
+            consumer_care=fields.consumer_care,
+            batch_number=fields.batch_number,
+            fssai_license=fields.fssai_license,
+            bis_certification=fields.bis_certification,
+            
+            # Confidence metrics
+            confidence_score=round(confidence, 4),
+            confidence_level=level,
+            region_confidences=region_confs,
+            
+            # Raw data
+            raw_text_regions=text_regions,
+            combined_text=combined_text,
+            
+            # Metadata
+            total_regions_detected=total_regions,
+            regions_processed=len(text_regions),
+            low_confidence_regions=low_conf_count,
+            processing_time_ms=round(processing_time, 2),
+            image_dimensions=source_size,
+            
+            # Flags
+            needs_review=needs_review
+        )
+    
+    async def process_images_batch(
+        self,
+        images: List[bytes],
+        category: Optional[ProductCategory] = None
+    ) -> List[OCRProcessingResult]:
+        """
+        Process several images together, returning results in input order.
+        
+        Decoding and detection run concurrently in worker threads. With
+        RapidOCR the crops of every image go through a single recognition
+        call, so the ONNX session runs one large batch instead of one per
+        image; Tesseract recognition runs per image, also concurrently.
+        """
+        start_time = time.time()
+        
+        # Images already recognised (by this or a single-image call) are served from the result cache
+        keys = [_result_cache_key(data, category) for data in images]
+        with self._result_cache_lock:
+            cached = [self._result_cache.get(key) for key in keys]
+        results: List[Optional[OCRProcessingResult]] = [
+            hit.model_copy(update={'processing_time_ms': 0.0}) if hit is not None else None
+            for hit in cached
+        ]
+        pending = [i for i, hit in enumerate(cached) if hit is None]
+        
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(self._load_and_detect, images[i]) for i in pending),
+            return_exceptions=True
+        )
+        detected = dict(zip(pending, loaded))
+        
+        ok = [
+            i for i, item in detected.items()
+            if not isinstance(item, BaseException) and item[0] is not None
+        ]
+        
+        if self.use_rapid_ocr:
+            crops = [crop for i in ok for crop in _crop_regions(*detected[i][:2])]
+            flat = await asyncio.to_thread(self.recognize_crops_batched, crops) if crops else []
+            recognized, offset = {}, 0
+            for i in ok:
+                count = len(detected[i][1])
+                recognized[i] = self._assemble_regions(detected[i][1], flat[offset:offset + count])
+                offset += count
+        else:
+            per_image = await asyncio.gather(
+                *(asyncio.to_thread(self.perform_region_wise_ocr, *detected[i][:2]) for i in ok),
+                return_exceptions=True
+            )
+            recognized = dict(zip(ok, per_image))
+        
+        for i, item in detected.items():
+            outcome = recognized.get(i, item)
+            if isinstance(outcome, BaseException):
+                logger.error(f"OCR processing failed: {outcome}")
+                results[i] = OCRProcessingResult(
+                    confidence_score=0.0,
+                    confidence_level=ConfidenceLevel.VERY_LOW,
+                    error=str(outcome)
+                )
+            elif i not in recognized:
+                results[i] = _decode_failure()
+            else:
+                image, bounding_boxes, source_size = item
+                height, width = image.shape[:2]
+                text_regions, _, combined_text = outcome
+                result = self._build_result(
+                    text_regions, combined_text, len(bounding_boxes), (width, height), source_size,
+                    category, start_time
+                )
+                # Low-confidence results are left uncached so a retry can do better
+                if not result.needs_review:
+                    with self._result_cache_lock:
+                        self._result_cache[keys[i]] = result
+                results[i] = result
+        return results
     
     async def process_image_url(
         self, 
         image_url: str,
-        category: Optional[ProductCategory] = None
+        category: Optional[ProductCategory] = None,
+        session: Optional[aiohttp.ClientSession] = None
     ) -> OCRProcessingResult:
         """
         Process an image from URL.
@@ -1010,28 +1841,31 @@ class AdvancedOCRService:
         Args:
             image_url: URL of the image to process
             category: Optional product category
+            session: Shared HTTP session to reuse pooled keep-alive connections;
+                the service's own pooled session is used when omitted
             
         Returns:
             OCRProcessingResult
         """
-        import aiohttp
-        
         try:
-            async with aiohttp.ClientSession() as session:
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    "Accept": "image/*,*/*;q=0.8",
-                }
-                async with session.get(image_url, headers=headers, timeout=30) as response:
-                    if response.status != 200:
-                        return OCRProcessingResult(
-                            confidence_score=0.0,
-                            confidence_level=ConfidenceLevel.VERY_LOW,
-                            error=f"Failed to fetch image: HTTP {response.status}"
-                        )
+            if session is None:
+                session = await self._get_session()
+            headers = {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "image/*,*/*;q=0.8",
+            }
+            async with session.get(image_url, headers=headers, timeout=30) as response:
+                if response.status != 200:
+                    return OCRProcessingResult(
+                        confidence_score=0.0,
+                        confidence_level=ConfidenceLevel.VERY_LOW,
+                        error=f"Failed to fetch image: HTTP {response.status}"
+                    )
+                
+                image_data = await response.read()
                     
-                    image_data = await response.read()
-                    return self.process_image(image_data, category)
+            # OCR is CPU-bound; keep it off the event loop
+            return await asyncio.to_thread(self.process_image, image_data, category)
                     
         except Exception as e:
             logger.error(f"Failed to fetch image from URL: {e}")
@@ -1058,8 +1892,12 @@ class AdvancedOCRService:
         """
         try:
             with open(image_path, 'rb') as f:
-                image_data = f.read()
-            return self.process_image(image_data, category)
+                if os.fstat(f.fileno()).st_size == 0:
+                    return self.process_image(b'', category)
+                # Map the file instead of reading it: pages fault in as the
+                # decoder touches them and stay reclaimable page cache
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+                    return self.process_image(image_data, category)
         except FileNotFoundError:
             return OCRProcessingResult(
                 confidence_score=0.0,
@@ -1088,3 +1926,4 @@ def get_advanced_ocr_service() -> AdvancedOCRService:
     if _advanced_ocr_service is None:
         _advanced_ocr_service = AdvancedOCRService()
     return _advanced_ocr_service
+
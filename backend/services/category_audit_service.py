@@ -5,21 +5,53 @@ Supports regulator-driven category audits across e-commerce platforms.
 
 import asyncio
 import logging
+import os
+import re
+import threading
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterator
 from urllib.parse import quote_plus, urljoin
 
-import requests
+import pandas as pd
 from bs4 import BeautifulSoup
+from cachetools import TTLCache
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional C HTML parser for large search result pages
+    HTMLParser = None
+
+try:
+    import diskcache
+except ImportError:  # optional on-disk cache shared across workers and restarts
+    diskcache = None
+
+from backend.cache import cached
 from backend.models import RiskLevel, URLAuditResult
+from backend.rate_limit import get_with_backoff, pooled_session
 from backend.services.url_audit_service import URLAuditService
 
 logger = logging.getLogger(__name__)
 
+# Marketplace search results are stable for minutes, so repeated category
+# audits reuse them instead of re-fetching and re-parsing each results page
+SEARCH_CACHE_TTL = 600
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_DIR = "backend/.search_cache"
+
+# URL audits (scrape + OCR) run on one process-wide pool. asyncio.run gives
+# every sync bulk_audit_urls call a fresh loop, and with it a fresh default
+# executor whose threads were spawned and joined per call
+_audit_pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 5), thread_name_prefix="url-audit")
+
+# Progress callbacks fire at most this often, however fast audits complete
+PROGRESS_INTERVAL = 0.1
+
 
 class ProductCategory(str, Enum):
     """Predefined product categories for Legal Metrology compliance"""
@@ -45,6 +77,16 @@ CATEGORY_KEYWORDS = {
 }
 
 
+def iter_link_hrefs(html: str) -> Iterator[str]:
+    """Yield the href of every <a> in document order."""
+    if HTMLParser is not None:
+        for node in HTMLParser(html).css("a[href]"):
+            yield node.attributes.get("href") or ""
+        return
+    for link in BeautifulSoup(html, "html.parser").find_all("a", href=True):
+        yield link.get("href", "")
+
+
 @dataclass
 class BulkAuditProgress:
     """Progress tracking for bulk audits"""
@@ -56,6 +98,24 @@ class BulkAuditProgress:
     errors: list[str]
 
 
+async def _report_progress(
+    progress: BulkAuditProgress,
+    callback: Callable[[BulkAuditProgress], None],
+    done: asyncio.Event,
+) -> None:
+    """Invoke callback every PROGRESS_INTERVAL while progress changes, and once more when done."""
+    reported = 0
+    while not done.is_set():
+        try:
+            await asyncio.wait_for(done.wait(), PROGRESS_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        finished = progress.completed + progress.failed
+        if finished != reported:
+            reported = finished
+            callback(progress)
+
+
 class CategoryAuditService:
     """
     Service for category-based bulk product auditing.
@@ -65,11 +125,28 @@ class CategoryAuditService:
     def __init__(self, max_workers: int = 5) -> None:
         self.url_audit_service = URLAuditService()
         self.max_workers = max_workers
-        self.session = requests.Session()
+        self.session = pooled_session()
         self.session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             "Accept-Language": "en-US,en;q=0.9",
         })
+        # diskcache is process-safe; the in-memory fallback is guarded by a lock
+        if diskcache is not None:
+            self._search_cache = diskcache.Cache(SEARCH_CACHE_DIR)
+        else:
+            self._search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        self._search_cache_lock = threading.Lock()
+
+    def _get_cached_search(self, key: tuple) -> list[str] | None:
+        with self._search_cache_lock:
+            return self._search_cache.get(key)
+
+    def _set_cached_search(self, key: tuple, urls: list[str]) -> None:
+        with self._search_cache_lock:
+            if diskcache is not None:
+                self._search_cache.set(key, urls, expire=SEARCH_CACHE_TTL)
+            else:
+                self._search_cache[key] = urls
 
     def get_category_keywords(self, category: ProductCategory) -> list[str]:
         """Get search keywords for a category"""
@@ -85,7 +162,13 @@ class CategoryAuditService:
         Search for product URLs based on a query.
         Returns list of product page URLs to audit.
         """
-        product_urls = []
+        cache_key = (marketplace.lower(), query, max_results)
+        cached_urls = self._get_cached_search(cache_key)
+        if cached_urls is not None:
+            return list(cached_urls)
+        
+        product_urls: list[str] = []
+        seen: set[str] = set()
         
         try:
             # Build search URL based on marketplace
@@ -97,28 +180,27 @@ class CategoryAuditService:
                 # Generic search
                 search_url = f"https://www.google.com/search?q={quote_plus(query)}+buy+online"
             
-            response = self.session.get(search_url, timeout=15)
-            soup = BeautifulSoup(response.text, "html.parser")
+            response = get_with_backoff(self.session, search_url, timeout=15)
             
             # Extract product URLs based on marketplace
             if "amazon" in marketplace.lower():
                 # Amazon product links
-                for link in soup.find_all("a", href=True):
-                    href = link.get("href", "")
+                for href in iter_link_hrefs(response.text):
                     if "/dp/" in href or "/gp/product/" in href:
                         full_url = urljoin("https://www.amazon.in", href.split("?")[0])
-                        if full_url not in product_urls:
+                        if full_url not in seen:
+                            seen.add(full_url)
                             product_urls.append(full_url)
                             if len(product_urls) >= max_results:
                                 break
             
             elif "flipkart" in marketplace.lower():
                 # Flipkart product links
-                for link in soup.find_all("a", href=True):
-                    href = link.get("href", "")
+                for href in iter_link_hrefs(response.text):
                     if "/p/" in href:
                         full_url = urljoin("https://www.flipkart.com", href)
-                        if full_url not in product_urls:
+                        if full_url not in seen:
+                            seen.add(full_url)
                             product_urls.append(full_url)
                             if len(product_urls) >= max_results:
                                 break
@@ -127,7 +209,11 @@ class CategoryAuditService:
             
         except Exception as e:
             logger.error(f"Error searching for products: {e}")
+            return product_urls[:max_results]
         
+        # Empty or failed searches are not cached so the next audit retries them
+        if product_urls:
+            self._set_cached_search(cache_key, product_urls[:max_results])
         return product_urls[:max_results]
 
     def audit_single_url(self, url: str, seller_id: str) -> tuple[URLAuditResult | None, str | None]:
@@ -148,7 +234,20 @@ class CategoryAuditService:
         progress_callback: Callable[[BulkAuditProgress], None] | None = None
     ) -> BulkAuditProgress:
         """
-        Audit multiple URLs in parallel using ThreadPoolExecutor.
+        Audit multiple URLs in parallel (blocking wrapper around bulk_audit_urls_async).
+        Must not be called from a running event loop.
+        """
+        return asyncio.run(self.bulk_audit_urls_async(urls, seller_id, progress_callback))
+
+    async def bulk_audit_urls_async(
+        self,
+        urls: list[str],
+        seller_id: str = "regulator-audit",
+        progress_callback: Callable[[BulkAuditProgress], None] | None = None
+    ) -> BulkAuditProgress:
+        """
+        Audit multiple URLs concurrently, at most max_workers at a time.
+        Each audit is blocking (scrape + OCR), so it runs on the shared audit pool.
         """
         progress = BulkAuditProgress(
             total=len(urls),
@@ -163,30 +262,38 @@ class CategoryAuditService:
             progress.in_progress = False
             return progress
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_url = {
-                executor.submit(self.audit_single_url, url, seller_id): url
-                for url in urls
-            }
-            
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def audit(url: str) -> tuple[URLAuditResult | None, str | None]:
+            async with semaphore:
                 try:
-                    result, error = future.result()
-                    if result:
-                        progress.results.append(result)
-                        progress.completed += 1
-                    else:
-                        progress.failed += 1
-                        if error:
-                            progress.errors.append(error)
+                    return await loop.run_in_executor(_audit_pool, self.audit_single_url, url, seller_id)
                 except Exception as e:
+                    return None, f"Unexpected error for {url}: {str(e)}"
+
+        # Progress updates are coalesced off the completion loop, so a slow
+        # callback (e.g. serializing all results so far) runs at a bounded rate
+        done = asyncio.Event()
+        reporter = (
+            asyncio.create_task(_report_progress(progress, progress_callback, done))
+            if progress_callback else None
+        )
+        
+        try:
+            for next_done in asyncio.as_completed([audit(url) for url in urls]):
+                result, error = await next_done
+                if result:
+                    progress.results.append(result)
+                    progress.completed += 1
+                else:
                     progress.failed += 1
-                    progress.errors.append(f"Unexpected error for {url}: {str(e)}")
-                
-                # Callback for progress updates
-                if progress_callback:
-                    progress_callback(progress)
+                    if error:
+                        progress.errors.append(error)
+        finally:
+            done.set()
+            if reporter:
+                await reporter
         
         progress.in_progress = False
         return progress
@@ -197,7 +304,8 @@ class CategoryAuditService:
         max_products: int = 20,
         seller_id: str = "regulator-audit",
         custom_keyword: str | None = None,
-        marketplace: str = "amazon.in"
+        marketplace: str = "amazon.in",
+        progress_callback: Callable[[BulkAuditProgress], None] | None = None
     ) -> BulkAuditProgress:
         """
         Audit products by category.
@@ -221,6 +329,7 @@ class CategoryAuditService:
         
         # Collect product URLs from all keywords
         all_urls: list[str] = []
+        seen: set[str] = set()
         products_per_keyword = max(2, max_products // len(keywords))
         
         for keyword in keywords:
@@ -230,7 +339,8 @@ class CategoryAuditService:
                 marketplace=marketplace
             )
             for url in urls:
-                if url not in all_urls:
+                if url not in seen:
+                    seen.add(url)
                     all_urls.append(url)
                     if len(all_urls) >= max_products:
                         break
@@ -240,7 +350,61 @@ class CategoryAuditService:
         logger.info(f"Starting bulk audit for category {category.value} with {len(all_urls)} products")
         
         # Audit all collected URLs
-        return self.bulk_audit_urls(urls=all_urls, seller_id=seller_id)
+        return self.bulk_audit_urls(urls=all_urls, seller_id=seller_id, progress_callback=progress_callback)
+
+
+# Keyword rules used to infer a report's category, checked in order
+CATEGORY_INFERENCE_RULES = [
+    ("Food - Edible Oil", ["oil", "ghee", "cooking"]),
+    ("Electronics", ["mobile", "phone", "laptop", "charger", "electronic"]),
+    ("Cosmetics", ["cream", "lotion", "shampoo", "soap", "cosmetic"]),
+    ("Beverages", ["juice", "drink", "water", "beverage"]),
+    ("Imported Goods", ["imported", "foreign"]),
+    ("Food - Packaged", ["food", "snack", "biscuit", "noodle"]),
+]
+
+# One scan for every inference keyword. The lookahead reports a match at each
+# offset (so overlapping keywords are all seen), and alternatives are listed in
+# rule order so the highest-priority keyword wins when several start together.
+_CATEGORY_KEYWORD_SCAN = re.compile("(?=(" + "|".join(
+    re.escape(word) for _, keywords in CATEGORY_INFERENCE_RULES for word in keywords
+) + "))")
+_CATEGORY_KEYWORD_RANK = {
+    word: rank
+    for rank, (_, keywords) in reversed(list(enumerate(CATEGORY_INFERENCE_RULES)))
+    for word in keywords
+}
+
+
+def infer_category(report: dict) -> str:
+    """Infer product category from report data"""
+    title = (report.get("scraped_data", {}).get("title") or 
+             report.get("product_name") or "").lower()
+    description = (report.get("scraped_data", {}).get("description") or "").lower()
+    
+    combined = f"{title} {description}"
+    
+    # Earliest rule with any keyword in the text, found in a single pass
+    best = len(CATEGORY_INFERENCE_RULES)
+    for match in _CATEGORY_KEYWORD_SCAN.finditer(combined):
+        best = min(best, _CATEGORY_KEYWORD_RANK[match.group(1)])
+        if best == 0:
+            break
+    return CATEGORY_INFERENCE_RULES[best][0] if best < len(CATEGORY_INFERENCE_RULES) else "Other"
+
+
+def tag_inferred_category(payload: dict) -> dict:
+    """Store the inferred category on a serialized report so analytics need not re-derive it"""
+    payload["inferred_category"] = infer_category(payload)
+    return payload
+
+
+def _report_score(report: dict) -> float:
+    return report.get("compliance_score", report.get("score", 0))
+
+
+# Report score with the same fallback the Python reductions use
+_SCORE_EXPR = {"$ifNull": ["$compliance_score", {"$ifNull": ["$score", 0]}]}
 
 
 class CategoryAnalyticsService:
@@ -251,85 +415,118 @@ class CategoryAnalyticsService:
     def __init__(self, db_client) -> None:
         self.db = db_client
 
+    @cached(ttl=60, key=lambda self: "analytics:category_stats")
     async def get_category_stats(self) -> dict:
         """Get compliance statistics grouped by category"""
+        rows = await self.db.aggregate_reports([
+            {"$project": {
+                "risk_level": 1,
+                "score": _SCORE_EXPR,
+                "category": self._category_expression(),
+            }},
+            {"$group": {
+                "_id": "$category",
+                "total": {"$sum": 1},
+                "compliant": {"$sum": {"$cond": [{"$eq": ["$risk_level", "Compliant"]}, 1, 0]}},
+                "moderate_risk": {"$sum": {"$cond": [{"$eq": ["$risk_level", "Moderate Risk"]}, 1, 0]}},
+                "avg_score": {"$avg": "$score"},
+            }},
+        ])
+        if rows is not None:
+            return {
+                row["_id"]: {
+                    "total": row["total"],
+                    "compliant": row["compliant"],
+                    "moderate_risk": row["moderate_risk"],
+                    "high_risk": row["total"] - row["compliant"] - row["moderate_risk"],
+                    "avg_score": round(row["avg_score"] or 0, 1),
+                    "compliance_rate": round(row["compliant"] / row["total"] * 100, 1),
+                }
+                for row in rows
+            }
+
         reports = await self.db.get_reports()
-        
-        category_stats: dict[str, dict] = {}
-        
-        for report in reports:
+        if not reports:
+            return {}
+
+        frame = pd.DataFrame({
             # Try to infer category from product title/description
-            category = self._infer_category(report)
-            
-            if category not in category_stats:
-                category_stats[category] = {
-                    "total": 0,
-                    "compliant": 0,
-                    "moderate_risk": 0,
-                    "high_risk": 0,
-                    "avg_score": 0,
-                    "scores": []
-                }
-            
-            stats = category_stats[category]
-            stats["total"] += 1
-            stats["scores"].append(report.get("compliance_score", report.get("score", 0)))
-            
-            risk_level = report.get("risk_level", "")
-            if risk_level == "Compliant":
-                stats["compliant"] += 1
-            elif risk_level == "Moderate Risk":
-                stats["moderate_risk"] += 1
-            else:
-                stats["high_risk"] += 1
-        
-        # Calculate averages
-        for category, stats in category_stats.items():
-            if stats["scores"]:
-                stats["avg_score"] = round(sum(stats["scores"]) / len(stats["scores"]), 1)
-            del stats["scores"]  # Remove raw scores from output
-            
-            # Calculate compliance rate
-            stats["compliance_rate"] = round(
-                (stats["compliant"] / stats["total"] * 100) if stats["total"] > 0 else 0, 1
-            )
-        
-        return category_stats
+            "category": [self._infer_category(report) for report in reports],
+            "risk_level": [report.get("risk_level", "") for report in reports],
+            "score": [_report_score(report) for report in reports],
+        })
+        frame["compliant"] = frame["risk_level"].eq("Compliant")
+        frame["moderate_risk"] = frame["risk_level"].eq("Moderate Risk")
+        grouped = frame.groupby("category", sort=False).agg(
+            total=("score", "size"),
+            compliant=("compliant", "sum"),
+            moderate_risk=("moderate_risk", "sum"),
+            avg_score=("score", "mean"),
+        )
+
+        # Cast back from numpy scalars so the response stays JSON-serialisable
+        return {
+            category: {
+                "total": int(row.total),
+                "compliant": int(row.compliant),
+                "moderate_risk": int(row.moderate_risk),
+                "high_risk": int(row.total - row.compliant - row.moderate_risk),
+                "avg_score": round(float(row.avg_score), 1),
+                "compliance_rate": round(float(row.compliant / row.total * 100), 1),
+            }
+            for category, row in zip(grouped.index, grouped.itertuples(index=False))
+        }
 
     def _infer_category(self, report: dict) -> str:
-        """Infer product category from report data"""
-        title = (report.get("scraped_data", {}).get("title") or 
-                 report.get("product_name") or "").lower()
-        description = (report.get("scraped_data", {}).get("description") or "").lower()
-        
-        combined = f"{title} {description}"
-        
-        # Category inference rules
-        if any(word in combined for word in ["oil", "ghee", "cooking"]):
-            return "Food - Edible Oil"
-        elif any(word in combined for word in ["mobile", "phone", "laptop", "charger", "electronic"]):
-            return "Electronics"
-        elif any(word in combined for word in ["cream", "lotion", "shampoo", "soap", "cosmetic"]):
-            return "Cosmetics"
-        elif any(word in combined for word in ["juice", "drink", "water", "beverage"]):
-            return "Beverages"
-        elif any(word in combined for word in ["imported", "foreign"]):
-            return "Imported Goods"
-        elif any(word in combined for word in ["food", "snack", "biscuit", "noodle"]):
-            return "Food - Packaged"
-        else:
-            return "Other"
+        """Category tagged at ingest, inferred on the fly for reports saved before tagging"""
+        return report.get("inferred_category") or infer_category(report)
+
+    @staticmethod
+    def _category_expression() -> dict:
+        """Aggregation equivalent of _infer_category"""
+        return {"$ifNull": ["$inferred_category", CategoryAnalyticsService._inferred_category_expression()]}
+
+    @staticmethod
+    def _inferred_category_expression() -> dict:
+        """Aggregation equivalent of infer_category"""
+        # Like Python's `title or product_name`: an empty title falls through too
+        title = {"$cond": [
+            {"$gt": [{"$strLenCP": {"$ifNull": ["$scraped_data.title", ""]}}, 0]},
+            "$scraped_data.title",
+            {"$ifNull": ["$product_name", ""]},
+        ]}
+        combined = {"$toLower": {"$concat": [
+            title,
+            " ",
+            {"$ifNull": ["$scraped_data.description", ""]},
+        ]}}
+        return {"$switch": {
+            "branches": [
+                {"case": {"$regexMatch": {"input": combined, "regex": "|".join(keywords)}}, "then": category}
+                for category, keywords in CATEGORY_INFERENCE_RULES
+            ],
+            "default": "Other",
+        }}
 
+    @cached(ttl=60, key=lambda self: "analytics:risk_distribution")
     async def get_risk_distribution(self) -> dict:
         """Get risk level distribution for charts"""
-        reports = await self.db.get_reports()
-        
         distribution = {
             "Compliant": 0,
             "Moderate Risk": 0,
             "High Risk": 0
         }
-        
+
+        rows = await self.db.aggregate_reports([
+            {"$group": {"_id": {"$ifNull": ["$risk_level", "High Risk"]}, "count": {"$sum": 1}}},
+        ])
+        if rows is not None:
+            for row in rows:
+                if row["_id"] in distribution:
+                    distribution[row["_id"]] = row["count"]
+            return distribution
+
+        reports = await self.db.get_reports()
         for report in reports:
             risk_level = report.get("risk_level", "High Risk")
             if risk_level in distribution:
@@ -337,77 +534,97 @@ class CategoryAnalyticsService:
         
         return distribution
 
+    @cached(ttl=60, key=lambda self: "analytics:violation_trends")
     async def get_violation_trends(self) -> list[dict]:
         """Get most common violations with counts"""
+        rows = await self.db.aggregate_reports([
+            {"$unwind": "$violations"},
+            {"$group": {
+                "_id": {"$concat": [
+                    {"$ifNull": ["$violations.field", "unknown"]},
+                    ": ",
+                    {"$ifNull": ["$violations.message", {"$ifNull": ["$violations.code", "Unknown"]}]},
+                ]},
+                "count": {"$sum": 1},
+            }},
+            {"$sort": {"count": -1}},
+            {"$limit": 10},
+        ])
+        if rows is not None:
+            return [{"violation": row["_id"], "count": row["count"]} for row in rows]
+
         reports = await self.db.get_reports()
-        
-        violation_counter: dict[str, int] = {}
-        
-        for report in reports:
-            for violation in report.get("violations", []):
-                field = violation.get("field", "unknown")
-                message = violation.get("message", violation.get("code", "Unknown"))
-                key = f"{field}: {message}"
-                violation_counter[key] = violation_counter.get(key, 0) + 1
-        
-        # Sort by count and return top 10
-        sorted_violations = sorted(
-            violation_counter.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
-        
+        violation_counter = Counter(
+            f"{violation.get('field', 'unknown')}: {violation.get('message', violation.get('code', 'Unknown'))}"
+            for report in reports
+            for violation in report.get("violations", [])
+        )
         return [
             {"violation": key, "count": count}
-            for key, count in sorted_violations
+            for key, count in violation_counter.most_common(10)
         ]
 
+    @cached(ttl=60, key=lambda self, days=30: f"analytics:timeline:{days}")
     async def get_compliance_timeline(self, days: int = 30) -> list[dict]:
         """Get compliance scores over time for trend charts"""
-        from datetime import datetime, timedelta
-        
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+
+        # created_at is stored as an ISO string, so the date key is its first 10 characters
+        rows = await self.db.aggregate_reports([
+            {"$match": {"$or": [
+                # Compare without an offset suffix so both "Z" and legacy naive strings match
+                {"created_at": {"$gte": cutoff_date.replace(tzinfo=None).isoformat()}},
+                {"created_at": {"$gte": cutoff_date}},
+            ]}},
+            {"$group": {
+                "_id": {"$cond": [
+                    {"$eq": [{"$type": "$created_at"}, "date"]},
+                    {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                    {"$substrCP": ["$created_at", 0, 10]},
+                ]},
+                "total": {"$sum": 1},
+                "compliant": {"$sum": {"$cond": [{"$eq": ["$risk_level", "Compliant"]}, 1, 0]}},
+                "avg_score": {"$avg": _SCORE_EXPR},
+            }},
+            {"$sort": {"_id": 1}},
+        ])
+        if rows is not None:
+            return [
+                {
+                    "date": row["_id"],
+                    "total_audited": row["total"],
+                    "compliant_count": row["compliant"],
+                    "avg_compliance_score": round(row["avg_score"] or 0, 1),
+                }
+                for row in rows
+            ]
+
         reports = await self.db.get_reports()
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        
-        # Group by date
-        daily_stats: dict[str, dict] = {}
-        
-        for report in reports:
-            created_at = report.get("created_at")
-            if isinstance(created_at, str):
-                try:
-                    created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                except ValueError:
-                    continue
-            
-            if created_at and created_at >= cutoff_date:
-                date_key = created_at.strftime("%Y-%m-%d")
-                
-                if date_key not in daily_stats:
-                    daily_stats[date_key] = {
-                        "date": date_key,
-                        "total": 0,
-                        "compliant": 0,
-                        "scores": []
-                    }
-                
-                daily_stats[date_key]["total"] += 1
-                daily_stats[date_key]["scores"].append(
-                    report.get("compliance_score", report.get("score", 0))
-                )
-                if report.get("risk_level") == "Compliant":
-                    daily_stats[date_key]["compliant"] += 1
-        
-        # Calculate averages and format output
-        result = []
-        for date_key in sorted(daily_stats.keys()):
-            stats = daily_stats[date_key]
-            avg_score = sum(stats["scores"]) / len(stats["scores"]) if stats["scores"] else 0
-            result.append({
+        if not reports:
+            return []
+
+        # Naive timestamps from before created_at became timezone-aware are UTC; unparseable ones drop out as NaT
+        frame = pd.DataFrame({
+            "created_at": pd.to_datetime(
+                pd.Series([report.get("created_at") for report in reports], dtype=object),
+                utc=True, errors="coerce", format="ISO8601",
+            ),
+            "compliant": [report.get("risk_level") == "Compliant" for report in reports],
+            "score": [_report_score(report) for report in reports],
+        })
+        frame = frame[frame["created_at"] >= cutoff_date]
+        daily = frame.groupby(frame["created_at"].dt.strftime("%Y-%m-%d")).agg(
+            total=("score", "size"),
+            compliant=("compliant", "sum"),
+            avg_score=("score", "mean"),
+        )
+
+        return [
+            {
                 "date": date_key,
-                "total_audited": stats["total"],
-                "compliant_count": stats["compliant"],
-                "avg_compliance_score": round(avg_score, 1)
-            })
-        
-        return result
+                "total_audited": int(row.total),
+                "compliant_count": int(row.compliant),
+                "avg_compliance_score": round(float(row.avg_score), 1),
+            }
+            for date_key, row in zip(daily.index, daily.itertuples(index=False))
+        ]
@@ -1,8 +1,10 @@
+import asyncio
 import uuid
+from concurrent.futures import Executor
 
 from backend.models import ComplianceResult, ProductInput, RiskLevel
 from backend.services.ingestion_service import IngestionService
-from backend.services.llm_service import LLMService
+from backend.services.llm_service import BatchingLLMClient, LLMService
 from backend.services.nlp_service import NLPService
 from backend.services.ocr_service import OCRService
 from backend.services.rag_service import RAGService
@@ -17,6 +19,7 @@ class ComplianceEngine:
         self.rule_engine = RuleEngine()
         self.rag_service = RAGService()
         self.llm_service = LLMService()
+        self.llm_batcher = BatchingLLMClient(self.llm_service)
 
     def classify_risk(self, score: int) -> RiskLevel:
         if score >= 85:
@@ -25,24 +28,36 @@ class ComplianceEngine:
             return RiskLevel.MODERATE
         return RiskLevel.HIGH
 
-    def run_scan(self, payload: ProductInput, image_bytes: bytes | None = None) -> ComplianceResult:
+    def _ingest(self, payload: ProductInput, image_bytes: bytes | None) -> dict:
         ocr_text = self.ocr_service.extract_text(image_bytes) if image_bytes else ""
-        normalized_input = self.ingestion_service.parse_single(payload, ocr_text)
+        return self.ingestion_service.parse_single(payload, ocr_text)
 
-        extracted = self.nlp_service.extract_and_normalize(normalized_input["source_text"])
-        base_score, violations = self.rule_engine.evaluate(extracted)
+    async def run_scan(
+        self,
+        payload: ProductInput,
+        image_bytes: bytes | None = None,
+        executor: Executor | None = None,
+    ) -> ComplianceResult:
+        """Run the scan pipeline with blocking stages on ``executor`` (the loop's default when None)."""
+        loop = asyncio.get_running_loop()
+        normalized_input = await loop.run_in_executor(executor, self._ingest, payload, image_bytes)
 
+        # NER and clause retrieval only need the normalized input, so overlap them
         query = f"{payload.product_name} {normalized_input['source_text']}"
-        clauses = self.rag_service.retrieve_clauses(query, top_k=3)
+        extracted, clauses = await asyncio.gather(
+            loop.run_in_executor(executor, self.nlp_service.extract_and_normalize, normalized_input["source_text"]),
+            loop.run_in_executor(executor, self.rag_service.retrieve_clauses, query, 3),
+        )
+        base_score, violations = self.rule_engine.evaluate(extracted)
 
-        llm_result = self.llm_service.explain_violations(
-            product_data={
+        llm_result = await self.llm_batcher.explain(
+            {
                 "product_name": payload.product_name,
                 "seller_id": payload.seller_id,
                 "extracted_fields": extracted.model_dump(),
             },
-            violations=[item.model_dump() for item in violations],
-            clauses=clauses,
+            [item.model_dump() for item in violations],
+            clauses,
         )
 
         risk_level = self.classify_risk(base_score)
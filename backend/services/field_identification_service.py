@@ -4,8 +4,161 @@ from typing import Optional
 
 from backend.models import MandatoryDeclarations
 
+try:
+    import re2
+except ImportError:  # optional linear-time regex engine for field capture
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# RE2's \s and \d are ASCII-only; these are the Unicode sets Python's re uses
+# for str patterns, spelled out so both engines capture the same text
+_RE2_CLASS_ESCAPES = {
+    "s": r"\t-\r\x1c-\x20\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}",
+    "d": r"\p{Nd}",
+}
+
+
+def _to_re2(pattern: str) -> str:
+    """Rewrite a case-insensitive Python pattern for RE2."""
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            escape = pattern[i + 1]
+            if escape in _RE2_CLASS_ESCAPES:
+                members = _RE2_CLASS_ESCAPES[escape]
+                out.append(members if in_class else f"[{members}]")
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        out.append(char)
+        i += 1
+    return "(?i)" + "".join(out)
+
+
+def _compile(pattern: str):
+    """
+    Compile a capture pattern case-insensitively, with RE2 when it is installed.
+
+    RE2 matches in linear time with the same leftmost-first submatch results
+    as re, and exposes the same search()/group() API. Patterns RE2 rejects
+    fall back to re.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(_to_re2(pattern))
+        except re2.error:
+            logger.warning(f"RE2 rejected field pattern, using re: {pattern}")
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Field patterns are compiled once at import instead of per call through the re cache
+# Fields common to every category
+_MANUFACTURER_RE = _compile(r"Manufacturer\s*[:\-]\s*([^\n|,]+)")
+_IMPORTER_OR_MARKETER_RE = _compile(r"(?:Importer|Marketed\s*by|Packed\s*by)\s*[:\-]\s*([^\n|,]+)")
+_BRAND_RE = _compile(r"Brand\s*[:\-]\s*([^\n|,]+)")
+_MANUFACTURER_ADDRESS_RE = _compile(r"(?:Manufacturer|Mfg\.?|Packed\s*by|Marketed\s*by)\s*[:\-]?\s*(?:[^,\n]+,)?\s*([A-Za-z0-9\s,\.\-]+(?:\d{6}|\d{3}\s*\d{3}))")
+_IMPORTER_ADDRESS_RE = _compile(r"(?:Importer|Imported\s*by)\s*[:\-]?\s*([^\n]+(?:\d{6}|\d{3}\s*\d{3})?)")
+_GENERIC_NAME_RE = _compile(r"(?:Product\s*(?:Type|Name)|Generic\s*Name|Type|Category)\s*[:\-]?\s*([A-Za-z\s]+)")
+_GENERIC_NAME_KEYWORD_RE = _compile(r"(Biscuits?|Shampoo|Oil|Rice|Tea|Coffee|Chips?|Chocolate|Cream|Lotion|Soap|Powder|Juice|Drink)")
+_NET_QUANTITY_RAW_RE = _compile(r"(?:Net\s*(?:Qty|Quantity|Wt|Weight|Content\s*Volume?)|Item\s*Weight|Weight)\s*[:\-]?\s*([^\n|]{5,50})")
+_NET_QUANTITY_RE = _compile(r"(?:Net\s*(?:Qty|Quantity|Wt|Weight|Content\s*Volume?)|Item\s*Weight|Weight)\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?\s*(?:kg|kilogram|g|gram|grams|ml|millilitre|milliliter|millilitres|milliliters|l|litre|litres|liter|liters|pcs|pieces|units?)[s]?)")
+_MRP_RE = _compile(r"(?:MRP|M\.R\.P\.?|Maximum\s*Retail\s*Price)\s*[:₹Rs\.\s]*([0-9,]+(?:\.[0-9]{1,2})?\s*(?:incl(?:usive)?\s*of\s*(?:all\s*)?taxes)?)")
+_CONSUMER_CARE_RE = _compile(r"(?:Consumer\s*(?:Care|Complaint|Support)|Customer\s*Care|Contact\s*(?:Us|Info)|Helpline|Toll\s*Free)\s*[:\-]?\s*([^\n|]+)")
+_MANUFACTURE_DATE_RE = _compile(r"(?:Date\s*(?:of\s*)?(?:Manufacture|Mfg|Import|Packing)|Mfg\.?\s*Date|Manufactured\s*on|Imported\s*on|Packed\s*on|Date\s*First\s*Available)\s*[:\-]?\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}|[0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{2,4}|[A-Za-z]{3,9}\s*[0-9]{1,2}[,]?\s*[0-9]{2,4})")
+_COUNTRY_OF_ORIGIN_RE = _compile(r"(?:Country\s*of\s*Origin|Made\s*in|Manufactured\s*in|Origin)\s*[:\-]?\s*([A-Za-z ]{2,30})")
+
+# Food
+_ENERGY_RE = _compile(r"Energy\s*\(?(?:kcal)?\)?\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?\s*(?:kcal|cal|Kilocalories|kJ)?)")
+_CALORIES_RE = _compile(r"Calories?\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?[^\n]*)")
+_FSSAI_RE = _compile(r"(?:FSSAI\s*(?:Lic(?:ense)?\.?\s*)?(?:No\.?)?|License\s*No\.?|Lic\.?\s*No\.?)\s*[:\-]?\s*([0-9]{10,14})")
+_FOOD_EXPIRY_RE = _compile(r"(?:Exp(?:iry)?\.?\s*Date|Best\s*Before|Use\s*By|BB|Shelf\s*Life)\s*[:\-]?\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}|[0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{2,4}|[A-Za-z]{3,9}\s*[0-9]{1,2}[,]?\s*[0-9]{2,4}|[0-9]+\s*(?:months?|days?|years?))")
+_FOOD_INGREDIENTS_RE = _compile(r"Ingredients?\s*[:\-]?\s*([^\n]+(?:oil|sugar|salt|water|flour|milk|spice|extract|acid|preservative|vitamin|mineral|refined|soya|rice)[^\n]*)")
+_FOOD_ALLERGEN_RE = _compile(r"(?:Allergen(?:s)?(?:\s*Info(?:rmation)?)?|May\s*Contain)\s*[:\-]?\s*([^\n]*(?:nuts?|milk|soy|wheat|gluten|egg|peanut|sesame|fish|shellfish|sulphite|mustard)[^\n]*)")
+_VEG_NONVEG_RE = _compile(r"(?:Ingredient\s*Type|Diet\s*Type)?[:\-]?\s*(Vegetarian|Non[\s\-]?Vegetarian|Veg(?:an)?|Non[\s\-]?Veg)")
+_FOOD_BATCH_RE = _compile(r"(?:Batch\s*(?:No\.?)?|Lot\s*(?:No\.?)?|B\.?\s*No\.?)\s*[:\-]?\s*([A-Z0-9\-]{4,})")
+_STORAGE_RE = _compile(r"(?:Storage|Store|Directions?)\s*[:\-]?\s*([^\n]*(?:cool|dry|refrigerat|freez|temperature|away\s*from|room\s*temp|dark|moisture)[^\n]*)")
+
+# Electronics
+_BIS_RE = _compile(r"(?:BIS|ISI|Bureau\s*of\s*Indian\s*Standards?)(?:\s*Cert(?:ification)?)?(?:\s*No\.?)?\s*[:\-]?\s*(R-[0-9]+|[A-Z]{2,3}[0-9]+)")
+_MODEL_NUMBER_RE = _compile(r"(?:Model\s*(?:No\.?|Number)?|Item\s*Model)\s*[:\-]?\s*([A-Z0-9\-]+)")
+_WARRANTY_RE = _compile(r"(?:Warranty|Guarantee)\s*[:\-]?\s*([0-9]+\s*(?:year|month|yr|mo)[s]?)")
+_POWER_RATING_RE = _compile(r"(?:Power|Wattage|Rating)\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?\s*(?:W|Watt|kW)[s]?)")
+_VOLTAGE_RE = _compile(r"(?:Voltage|Input|Operating)\s*[:\-]?\s*([0-9]+(?:\-[0-9]+)?\s*V(?:olt)?[s]?(?:\s*[/,]\s*[0-9]+\s*Hz)?)")
+_ENERGY_RATING_RE = _compile(r"(?:Energy\s*(?:Rating|Star)|Star\s*Rating|BEE)\s*[:\-]?\s*([0-9]\s*(?:Star)?s?)")
+_SERIAL_NUMBER_RE = _compile(r"(?:Serial\s*(?:No\.?|Number)?|S\/N)\s*[:\-]?\s*([A-Z0-9\-]{6,})")
+_SAFETY_RE = _compile(r"(?:Safety|Warning|Caution)\s*[:\-]?\s*([^\n]+(?:shock|fire|water|heat)[^\n]*)")
+
+# Cosmetics
+_COSMETICS_BATCH_RE = _compile(r"(?:Batch\s*(?:No\.?)?|Lot\s*(?:No\.?)?|B\.?\s*No\.?)\s*[:\-]?\s*([A-Z0-9\-]+)")
+_COSMETICS_EXPIRY_RE = _compile(r"(?:Exp(?:iry)?\.?\s*Date|Best\s*Before|Use\s*By|BB)\s*[:\-]?\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}|[A-Za-z]{3,9}\s*[0-9]{2,4})")
+_COSMETICS_INGREDIENTS_RE = _compile(r"(?:Ingredients?|Contains|Composition)\s*[:\-]\s*([^\n]+(?:\n[^\n]+)?)")
+_USAGE_RE = _compile(r"(?:Usage|How\s*to\s*Use|Directions?|Apply)\s*[:\-]?\s*([^\n]+)")
+_WARNINGS_RE = _compile(r"(?:Warning|Caution|Note)\s*[:\-]?\s*([^\n]+)")
+_CRUELTY_FREE_RE = _compile(r"(Cruelty[\s\-]?Free|Not\s*Tested\s*on\s*Animals?|Vegan)")
+_COSMETICS_ALLERGEN_RE = _compile(r"(?:Allergen(?:s)?|Contains|May\s*Contain)\s*[:\-]?\s*([^\n]+)")
+
+_VALID_UNIT_RE = re.compile(
+    r"\b(g|gram|grams|kg|kilogram|kilograms|ml|millilitre|millilitres|l|litre|litres|cm|centimetre|m|metre|metres|pcs|pieces|units?)\b",
+    re.IGNORECASE,
+)
+
+# Category field tables: (field, patterns), where a field takes the first pattern that captures
+_FOOD_FIELDS = (
+    ("fssai_license", (_FSSAI_RE,)),
+    ("expiry_date", (_FOOD_EXPIRY_RE,)),
+    ("ingredients_list", (_FOOD_INGREDIENTS_RE,)),
+    # Try comprehensive energy info before a bare calorie count
+    ("nutritional_info", (_ENERGY_RE, _CALORIES_RE)),
+    ("allergen_info", (_FOOD_ALLERGEN_RE,)),
+    ("veg_nonveg_symbol", (_VEG_NONVEG_RE,)),
+    ("batch_lot_number", (_FOOD_BATCH_RE,)),
+    ("storage_instructions", (_STORAGE_RE,)),
+)
+_ELECTRONICS_FIELDS = (
+    ("bis_certification", (_BIS_RE,)),
+    ("model_number", (_MODEL_NUMBER_RE,)),
+    ("warranty_period", (_WARRANTY_RE,)),
+    ("power_rating", (_POWER_RATING_RE,)),
+    ("voltage_frequency", (_VOLTAGE_RE,)),
+    ("energy_rating", (_ENERGY_RATING_RE,)),
+    ("serial_number", (_SERIAL_NUMBER_RE,)),
+    ("safety_instructions", (_SAFETY_RE,)),
+)
+_COSMETICS_FIELDS = (
+    ("batch_lot_number", (_COSMETICS_BATCH_RE,)),
+    ("expiry_date", (_COSMETICS_EXPIRY_RE,)),
+    ("ingredients_list", (_COSMETICS_INGREDIENTS_RE,)),
+    ("usage_instructions", (_USAGE_RE,)),
+    ("warnings", (_WARNINGS_RE,)),
+    ("cruelty_free", (_CRUELTY_FREE_RE,)),
+    ("allergen_info", (_COSMETICS_ALLERGEN_RE,)),
+)
+
+PROHIBITED_EXPRESSIONS = (
+    "approx", "approximately", "about", "minimum", "min",
+    "average", "avg", "not less than", "atleast", "at least",
+)
+
+# One pass finds every expression: the lookahead reports a match at each offset,
+# longest alternative first, and any shorter expression that is a prefix of the
+# longest match (e.g. "min" in "minimum") necessarily matched there too
+_PROHIBITED_SCAN = re.compile("(?=(" + "|".join(
+    re.escape(expr) for expr in sorted(PROHIBITED_EXPRESSIONS, key=len, reverse=True)
+) + "))")
+_PROHIBITED_PREFIXES = {
+    expr: {other for other in PROHIBITED_EXPRESSIONS if expr.startswith(other)}
+    for expr in PROHIBITED_EXPRESSIONS
+}
+
 
 class FieldIdentificationService:
     """
@@ -13,8 +166,8 @@ class FieldIdentificationService:
     Supports category-specific field extraction for Food, Electronics, Cosmetics.
     """
     
-    def _capture(self, pattern: str, text: str) -> str | None:
-        match = re.search(pattern, text, re.IGNORECASE)
+    def _capture(self, pattern: re.Pattern, text: str) -> str | None:
+        match = pattern.search(text)
         if not match:
             return None
         value = match.group(1).strip(" .,-")
@@ -22,75 +175,44 @@ class FieldIdentificationService:
 
     def _check_prohibited_expressions(self, text: str) -> list:
         """Check for prohibited expressions in net quantity"""
-        prohibited = ["approx", "approximately", "about", "minimum", "min", 
-                     "average", "avg", "not less than", "atleast", "at least"]
-        found = []
-        if text:
-            text_lower = text.lower()
-            for expr in prohibited:
-                if expr in text_lower:
-                    found.append(expr)
-        return found
+        if not text:
+            return []
+        hits: set[str] = set()
+        for match in _PROHIBITED_SCAN.finditer(text.lower()):
+            hits |= _PROHIBITED_PREFIXES[match.group(1)]
+        return [expr for expr in PROHIBITED_EXPRESSIONS if expr in hits]
     
     def _validate_net_quantity_unit(self, net_qty: str) -> bool:
         """Validate net quantity uses standard SI units"""
         if not net_qty:
             return False
-        valid_units = r"\b(g|gram|grams|kg|kilogram|kilograms|ml|millilitre|millilitres|l|litre|litres|cm|centimetre|m|metre|metres|pcs|pieces|units?)\b"
-        return bool(re.search(valid_units, net_qty, re.IGNORECASE))
+        return bool(_VALID_UNIT_RE.search(net_qty))
 
     def _extract_universal_fields(self, combined: str) -> dict:
         """Extract fields common to all product categories"""
         # Prioritize Manufacturer over Brand for manufacturer field
-        manufacturer = self._capture(
-            r"Manufacturer\s*[:\-]\s*([^\n|,]+)",
-            combined,
-        )
+        manufacturer = self._capture(_MANUFACTURER_RE, combined)
         if not manufacturer:
-            manufacturer = self._capture(
-                r"(?:Importer|Marketed\s*by|Packed\s*by)\s*[:\-]\s*([^\n|,]+)",
-                combined,
-            )
+            manufacturer = self._capture(_IMPORTER_OR_MARKETER_RE, combined)
         if not manufacturer:
-            manufacturer = self._capture(
-                r"Brand\s*[:\-]\s*([^\n|,]+)",
-                combined,
-            )
+            manufacturer = self._capture(_BRAND_RE, combined)
         
         # Extract manufacturer/importer complete address
-        manufacturer_address = self._capture(
-            r"(?:Manufacturer|Mfg\.?|Packed\s*by|Marketed\s*by)\s*[:\-]?\s*(?:[^,\n]+,)?\s*([A-Za-z0-9\s,\.\-]+(?:\d{6}|\d{3}\s*\d{3}))",
-            combined,
-        )
+        manufacturer_address = self._capture(_MANUFACTURER_ADDRESS_RE, combined)
         
-        importer_address = self._capture(
-            r"(?:Importer|Imported\s*by)\s*[:\-]?\s*([^\n]+(?:\d{6}|\d{3}\s*\d{3})?)",
-            combined,
-        )
+        importer_address = self._capture(_IMPORTER_ADDRESS_RE, combined)
         
         # Extract common/generic name (product type, not brand name)
-        common_generic_name = self._capture(
-            r"(?:Product\s*(?:Type|Name)|Generic\s*Name|Type|Category)\s*[:\-]?\s*([A-Za-z\s]+)",
-            combined,
-        )
+        common_generic_name = self._capture(_GENERIC_NAME_RE, combined)
         if not common_generic_name:
             # Try to infer from product title or description
-            common_generic_name = self._capture(
-                r"(?:Biscuits?|Shampoo|Oil|Rice|Tea|Coffee|Chips?|Chocolate|Cream|Lotion|Soap|Powder|Juice|Drink)",
-                combined,
-            )
+            common_generic_name = self._capture(_GENERIC_NAME_KEYWORD_RE, combined)
         
         # Extract raw net quantity for validation
-        net_quantity_raw = self._capture(
-            r"(?:Net\s*(?:Qty|Quantity|Wt|Weight|Content\s*Volume?)|Item\s*Weight|Weight)\s*[:\-]?\s*([^\n|]{5,50})",
-            combined,
-        )
+        net_quantity_raw = self._capture(_NET_QUANTITY_RAW_RE, combined)
         
         # Extract clean net quantity
-        net_quantity = self._capture(
-            r"(?:Net\s*(?:Qty|Quantity|Wt|Weight|Content\s*Volume?)|Item\s*Weight|Weight)\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?\s*(?:kg|kilogram|g|gram|grams|ml|millilitre|milliliter|millilitres|milliliters|l|litre|litres|liter|liters|pcs|pieces|units?)[s]?)",
-            combined,
-        )
+        net_quantity = self._capture(_NET_QUANTITY_RE, combined)
         
         # Check for prohibited expressions in net quantity
         prohibited_found = self._check_prohibited_expressions(net_quantity_raw) if net_quantity_raw else []
@@ -104,139 +226,34 @@ class FieldIdentificationService:
             "net_quantity": net_quantity,
             "net_quantity_prohibited_expressions": prohibited_found if prohibited_found else None,
             "net_quantity_unit_valid": unit_valid,
-            "mrp_inclusive_of_taxes": self._capture(
-                r"(?:MRP|M\.R\.P\.?|Maximum\s*Retail\s*Price)\s*[:₹Rs\.\s]*([0-9,]+(?:\.[0-9]{1,2})?\s*(?:incl(?:usive)?\s*of\s*(?:all\s*)?taxes)?)",
-                combined,
-            ),
-            "consumer_care_information": self._capture(
-                r"(?:Consumer\s*(?:Care|Complaint|Support)|Customer\s*Care|Contact\s*(?:Us|Info)|Helpline|Toll\s*Free)\s*[:\-]?\s*([^\n|]+)",
-                combined,
-            ),
-            "date_of_manufacture_or_import": self._capture(
-                r"(?:Date\s*(?:of\s*)?(?:Manufacture|Mfg|Import|Packing)|Mfg\.?\s*Date|Manufactured\s*on|Imported\s*on|Packed\s*on|Date\s*First\s*Available)\s*[:\-]?\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}|[0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{2,4}|[A-Za-z]{3,9}\s*[0-9]{1,2}[,]?\s*[0-9]{2,4})",
-                combined,
-            ),
-            "country_of_origin": self._capture(
-                r"(?:Country\s*of\s*Origin|Made\s*in|Manufactured\s*in|Origin)\s*[:\-]?\s*([A-Za-z ]{2,30})",
-                combined,
-            ),
+            "mrp_inclusive_of_taxes": self._capture(_MRP_RE, combined),
+            "consumer_care_information": self._capture(_CONSUMER_CARE_RE, combined),
+            "date_of_manufacture_or_import": self._capture(_MANUFACTURE_DATE_RE, combined),
+            "country_of_origin": self._capture(_COUNTRY_OF_ORIGIN_RE, combined),
         }
 
+    def _capture_fields(self, table: tuple, combined: str) -> dict:
+        """Capture every field of a category table; a field takes its first pattern that matches."""
+        return {name: self._capture_first(patterns, combined) for name, patterns in table}
+
+    def _capture_first(self, patterns: tuple, combined: str) -> str | None:
+        for pattern in patterns:
+            value = self._capture(pattern, combined)
+            if value:
+                return value
+        return None
+
     def _extract_food_fields(self, combined: str) -> dict:
         """Extract food-specific fields (FSSAI, expiry, ingredients, etc.)"""
-        
-        # Try to extract comprehensive nutritional info
-        nutritional_info = self._capture(
-            r"Energy\s*\(?(?:kcal)?\)?\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?\s*(?:kcal|cal|Kilocalories|kJ)?)",
-            combined,
-        )
-        if not nutritional_info:
-            nutritional_info = self._capture(
-                r"Calories?\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?[^\n]*)",
-                combined,
-            )
-        
-        return {
-            "fssai_license": self._capture(
-                r"(?:FSSAI\s*(?:Lic(?:ense)?\.?\s*)?(?:No\.?)?|License\s*No\.?|Lic\.?\s*No\.?)\s*[:\-]?\s*([0-9]{10,14})",
-                combined,
-            ),
-            "expiry_date": self._capture(
-                r"(?:Exp(?:iry)?\.?\s*Date|Best\s*Before|Use\s*By|BB|Shelf\s*Life)\s*[:\-]?\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}|[0-9]{1,2}\s*[A-Za-z]{3,9}\s*[0-9]{2,4}|[A-Za-z]{3,9}\s*[0-9]{1,2}[,]?\s*[0-9]{2,4}|[0-9]+\s*(?:months?|days?|years?))",
-                combined,
-            ),
-            "ingredients_list": self._capture(
-                r"Ingredients?\s*[:\-]?\s*([^\n]+(?:oil|sugar|salt|water|flour|milk|spice|extract|acid|preservative|vitamin|mineral|refined|soya|rice)[^\n]*)",
-                combined,
-            ),
-            "nutritional_info": nutritional_info,
-            "allergen_info": self._capture(
-                r"(?:Allergen(?:s)?(?:\s*Info(?:rmation)?)?|May\s*Contain)\s*[:\-]?\s*([^\n]*(?:nuts?|milk|soy|wheat|gluten|egg|peanut|sesame|fish|shellfish|sulphite|mustard)[^\n]*)",
-                combined,
-            ),
-            "veg_nonveg_symbol": self._capture(
-                r"(?:Ingredient\s*Type|Diet\s*Type)?[:\-]?\s*(Vegetarian|Non[\s\-]?Vegetarian|Veg(?:an)?|Non[\s\-]?Veg)",
-                combined,
-            ),
-            "batch_lot_number": self._capture(
-                r"(?:Batch\s*(?:No\.?)?|Lot\s*(?:No\.?)?|B\.?\s*No\.?)\s*[:\-]?\s*([A-Z0-9\-]{4,})",
-                combined,
-            ),
-            "storage_instructions": self._capture(
-                r"(?:Storage|Store|Directions?)\s*[:\-]?\s*([^\n]*(?:cool|dry|refrigerat|freez|temperature|away\s*from|room\s*temp|dark|moisture)[^\n]*)",
-                combined,
-            ),
-        }
+        return self._capture_fields(_FOOD_FIELDS, combined)
 
     def _extract_electronics_fields(self, combined: str) -> dict:
         """Extract electronics-specific fields (BIS, warranty, power, etc.)"""
-        return {
-            "bis_certification": self._capture(
-                r"(?:BIS|ISI|Bureau\s*of\s*Indian\s*Standards?)(?:\s*Cert(?:ification)?)?(?:\s*No\.?)?\s*[:\-]?\s*(R-[0-9]+|[A-Z]{2,3}[0-9]+)",
-                combined,
-            ),
-            "model_number": self._capture(
-                r"(?:Model\s*(?:No\.?|Number)?|Item\s*Model)\s*[:\-]?\s*([A-Z0-9\-]+)",
-                combined,
-            ),
-            "warranty_period": self._capture(
-                r"(?:Warranty|Guarantee)\s*[:\-]?\s*([0-9]+\s*(?:year|month|yr|mo)[s]?)",
-                combined,
-            ),
-            "power_rating": self._capture(
-                r"(?:Power|Wattage|Rating)\s*[:\-]?\s*([0-9]+(?:\.[0-9]+)?\s*(?:W|Watt|kW)[s]?)",
-                combined,
-            ),
-            "voltage_frequency": self._capture(
-                r"(?:Voltage|Input|Operating)\s*[:\-]?\s*([0-9]+(?:\-[0-9]+)?\s*V(?:olt)?[s]?(?:\s*[/,]\s*[0-9]+\s*Hz)?)",
-                combined,
-            ),
-            "energy_rating": self._capture(
-                r"(?:Energy\s*(?:Rating|Star)|Star\s*Rating|BEE)\s*[:\-]?\s*([0-9]\s*(?:Star)?s?)",
-                combined,
-            ),
-            "serial_number": self._capture(
-                r"(?:Serial\s*(?:No\.?|Number)?|S\/N)\s*[:\-]?\s*([A-Z0-9\-]{6,})",
-                combined,
-            ),
-            "safety_instructions": self._capture(
-                r"(?:Safety|Warning|Caution)\s*[:\-]?\s*([^\n]+(?:shock|fire|water|heat)[^\n]*)",
-                combined,
-            ),
-        }
+        return self._capture_fields(_ELECTRONICS_FIELDS, combined)
 
     def _extract_cosmetics_fields(self, combined: str) -> dict:
         """Extract cosmetics-specific fields (batch, usage, warnings, etc.)"""
-        return {
-            "batch_lot_number": self._capture(
-                r"(?:Batch\s*(?:No\.?)?|Lot\s*(?:No\.?)?|B\.?\s*No\.?)\s*[:\-]?\s*([A-Z0-9\-]+)",
-                combined,
-            ),
-            "expiry_date": self._capture(
-                r"(?:Exp(?:iry)?\.?\s*Date|Best\s*Before|Use\s*By|BB)\s*[:\-]?\s*([0-9]{1,2}[/-][0-9]{1,2}[/-][0-9]{2,4}|[A-Za-z]{3,9}\s*[0-9]{2,4})",
-                combined,
-            ),
-            "ingredients_list": self._capture(
-                r"(?:Ingredients?|Contains|Composition)\s*[:\-]\s*([^\n]+(?:\n[^\n]+)?)",
-                combined,
-            ),
-            "usage_instructions": self._capture(
-                r"(?:Usage|How\s*to\s*Use|Directions?|Apply)\s*[:\-]?\s*([^\n]+)",
-                combined,
-            ),
-            "warnings": self._capture(
-                r"(?:Warning|Caution|Note)\s*[:\-]?\s*([^\n]+)",
-                combined,
-            ),
-            "cruelty_free": self._capture(
-                r"(Cruelty[\s\-]?Free|Not\s*Tested\s*on\s*Animals?|Vegan)",
-                combined,
-            ),
-            "allergen_info": self._capture(
-                r"(?:Allergen(?:s)?|Contains|May\s*Contain)\s*[:\-]?\s*([^\n]+)",
-                combined,
-            ),
-        }
+        return self._capture_fields(_COSMETICS_FIELDS, combined)
 
     def extract_mandatory_fields(
         self, 
@@ -285,9 +302,13 @@ class FieldIdentificationService:
         else:
             # For generic/unknown, try to extract common fields from all categories
             # This helps when category is auto-detected later
-            for extract_func in [self._extract_food_fields, self._extract_electronics_fields, self._extract_cosmetics_fields]:
-                category_fields = extract_func(combined)
-                # Only add fields that aren't already present
-                fields.update({k: v for k, v in category_fields.items() if v and not fields.get(k)})
+            for table in (_FOOD_FIELDS, _ELECTRONICS_FIELDS, _COSMETICS_FIELDS):
+                for name, patterns in table:
+                    # Fields an earlier table already filled are never scanned for again
+                    if fields.get(name):
+                        continue
+                    value = self._capture_first(patterns, combined)
+                    if value:
+                        fields[name] = value
         
         return MandatoryDeclarations(**fields)
@@ -1,47 +1,56 @@
+import asyncio
 import logging
-import requests
-from requests import exceptions as request_exceptions
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
+import aiohttp
+
 from backend.services.ocr_service import OCRService
 
 logger = logging.getLogger(__name__)
 
+# Use same headers as scraper to avoid bot detection
+IMAGE_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
+    "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+    "Accept-Language": "en-IN,en-GB;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Referer": "https://www.amazon.in/",
+    "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"',
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+    "Sec-Fetch-Site": "cross-site",
+}
+IMAGE_FETCH_CONNECTIONS = 20
+IMAGE_FETCH_TIMEOUT = aiohttp.ClientTimeout(sock_connect=20, sock_read=20)
+# Concurrent OCR calls per extraction; downloads are awaited on the event loop
+IMAGE_OCR_WORKERS = 5
+
 
 class ImageOCRExtractionService:
     def __init__(self) -> None:
         self.ocr_service = OCRService()
-        self.session = requests.Session()
-        # Use same headers as scraper to avoid bot detection
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-                "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-                "Accept-Language": "en-IN,en-GB;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Referer": "https://www.amazon.in/",
-                "Sec-Ch-Ua": '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-                "Sec-Ch-Ua-Mobile": "?0",
-                "Sec-Ch-Ua-Platform": '"Windows"',
-                "Sec-Fetch-Dest": "image",
-                "Sec-Fetch-Mode": "no-cors",
-                "Sec-Fetch-Site": "cross-site",
-            }
-        )
 
-    def _process_single_image(self, image_url: str) -> Optional[str]:
+    async def _fetch_image(self, session: aiohttp.ClientSession, image_url: str) -> tuple[str, bytes]:
+        """Return the response Content-Type and body, retrying without certificate checks on SSL errors."""
+        try:
+            async with session.get(image_url) as response:
+                response.raise_for_status()
+                return response.headers.get("Content-Type", ""), await response.read()
+        except aiohttp.ClientSSLError:
+            async with session.get(image_url, ssl=False) as response:
+                response.raise_for_status()
+                return response.headers.get("Content-Type", ""), await response.read()
+
+    async def _process_single_image_async(
+        self, session: aiohttp.ClientSession, ocr_slots: asyncio.Semaphore, image_url: str
+    ) -> Optional[str]:
         """Download and OCR a single image. Returns extracted text or None."""
         try:
             logger.info(f"Downloading image: {image_url[:80]}...")
-            try:
-                response = self.session.get(image_url, timeout=20)
-            except request_exceptions.SSLError:
-                response = self.session.get(image_url, timeout=20, verify=False)
-            response.raise_for_status()
-            
-            content_type = response.headers.get("Content-Type", "")
-            content_length = len(response.content)
+            content_type, content = await self._fetch_image(session, image_url)
+            content_length = len(content)
             
             # Skip if not an image or too small (redirect pages)
             if "image" not in content_type.lower() and content_length < 1000:
@@ -54,7 +63,8 @@ class ImageOCRExtractionService:
                 return None
                 
             logger.info(f"Downloaded {content_length} bytes, extracting text...")
-            ocr_text = self.ocr_service.extract_text(response.content)
+            async with ocr_slots:
+                ocr_text = await asyncio.to_thread(self.ocr_service.extract_text, content)
             if ocr_text and len(ocr_text.strip()) > 5:  # Only keep meaningful text
                 logger.info(f"Extracted {len(ocr_text)} chars from image")
                 return ocr_text
@@ -64,7 +74,7 @@ class ImageOCRExtractionService:
             return None
 
     def extract_from_image_urls(self, image_urls: list[str], max_images: int = 20) -> str:
-        """Extract text from multiple image URLs using parallel processing.
+        """Extract text from multiple image URLs, downloading them concurrently.
         
         Args:
             image_urls: List of image URLs to process
@@ -88,26 +98,21 @@ class ImageOCRExtractionService:
         urls_to_process = unique_urls[:max_images]
         logger.info(f"Processing {len(urls_to_process)} images (from {len(image_urls)} total)")
         
-        texts: list[str] = []
-        
-        # Use ThreadPoolExecutor for parallel image processing
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit all tasks
-            future_to_url = {
-                executor.submit(self._process_single_image, url): url 
-                for url in urls_to_process
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    result = future.result()
-                    if result:
-                        texts.append(result)
-                except Exception as e:
-                    logger.warning(f"Image processing failed for {url[:50]}: {e}")
+        # Audits run on worker threads, so each call drives its own short-lived event loop
+        results = asyncio.run(self._process_images_async(urls_to_process))
+        texts = [text for text in results if text]
 
         combined = "\n".join(texts).strip()
         logger.info(f"Total OCR text extracted: {len(combined)} chars from {len(texts)} images")
         return combined
+
+    async def _process_images_async(self, image_urls: list[str]) -> list[Optional[str]]:
+        # Each call runs on its own event loop, so OCR is bounded per call like the old per-call pool
+        ocr_slots = asyncio.Semaphore(IMAGE_OCR_WORKERS)
+        connector = aiohttp.TCPConnector(limit=IMAGE_FETCH_CONNECTIONS, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            connector=connector, headers=IMAGE_REQUEST_HEADERS, timeout=IMAGE_FETCH_TIMEOUT
+        ) as session:
+            return await asyncio.gather(
+                *(self._process_single_image_async(session, ocr_slots, url) for url in image_urls)
+            )
@@ -1,9 +1,17 @@
-from io import StringIO
+import csv
+from io import BytesIO, TextIOWrapper
+from typing import BinaryIO, Iterable
 
-import pandas as pd
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional multi-threaded CSV reader for large batch uploads
+    pa = None
 
 from backend.models import ProductInput
 
+CSV_FIELDS = ("seller_id", "product_name", "description", "packaging_text")
+
 
 class IngestionService:
     def parse_single(self, payload: ProductInput, ocr_text: str | None) -> dict:
@@ -15,17 +23,43 @@ class IngestionService:
         }
 
     def parse_batch_csv(self, csv_bytes: bytes) -> list[ProductInput]:
-        dataframe = pd.read_csv(StringIO(csv_bytes.decode("utf-8")))
-        records: list[ProductInput] = []
-
-        for _, row in dataframe.iterrows():
-            records.append(
-                ProductInput(
-                    seller_id=str(row.get("seller_id", "unknown")),
-                    product_name=str(row.get("product_name", "Unnamed Product")),
-                    description=str(row.get("description", "")),
-                    packaging_text=str(row.get("packaging_text", "")),
-                )
+        return self.parse_batch_csv_stream(BytesIO(csv_bytes))
+
+    def parse_batch_csv_stream(self, stream: BinaryIO) -> list[ProductInput]:
+        """Parse a CSV from a binary file object without materialising the whole body as a string."""
+        if pa is not None:
+            rows = self._read_columns_arrow(stream)
+        else:
+            rows = self._read_rows_csv(stream)
+
+        # Missing or empty cells fall back to the defaults
+        return [
+            ProductInput(
+                seller_id=seller_id or "unknown",
+                product_name=product_name or "Unnamed Product",
+                description=description or "",
+                packaging_text=packaging_text or "",
             )
+            for seller_id, product_name, description, packaging_text in rows
+        ]
+
+    def _read_rows_csv(self, stream: BinaryIO) -> Iterable[tuple]:
+        text = TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        try:
+            return [tuple(row.get(field) for field in CSV_FIELDS) for row in csv.DictReader(text)]
+        finally:
+            # Leave the caller's stream open
+            text.detach()
 
-        return records
+    def _read_columns_arrow(self, stream: BinaryIO) -> Iterable[tuple]:
+        """Parse off the GIL with Arrow and read each wanted column as one list."""
+        table = pacsv.read_csv(
+            stream,
+            parse_options=pacsv.ParseOptions(newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                column_types={field: pa.string() for field in CSV_FIELDS},
+                include_columns=list(CSV_FIELDS),
+                include_missing_columns=True,
+            ),
+        )
+        return zip(*(table.column(field).to_pylist() for field in CSV_FIELDS))
@@ -1,6 +1,8 @@
+import asyncio
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
 
 from openai import OpenAI
@@ -25,6 +27,44 @@ PROMPT_TEMPLATE = dedent(
     """
 )
 
+BATCH_PROMPT_TEMPLATE = dedent(
+    """
+    You are a legal metrology compliance assistant for Indian packaged commodities.
+
+    Review each numbered product below independently.
+
+    {items}
+
+    Return a strict JSON array with exactly {count} objects, one per product in the
+    order given, each with keys:
+    explanation, suggested_correction, risk_summary
+    """
+)
+
+BATCH_ITEM_TEMPLATE = dedent(
+    """
+    ### Product {index}
+    Product Data:
+    {product_data}
+
+    Violations:
+    {violations}
+
+    Retrieved Clauses:
+    {clauses}
+    """
+)
+
+SYSTEM_PROMPT = "You are a legal metrology compliance assistant for Indian packaged commodities."
+
+# Markdown code fences around a model's JSON reply: an opening ```json and/or ```
+# fence, and a closing ``` fence
+_JSON_FENCE_RE = re.compile(r"^(?:```json\s*)?(?:```\s*)?|\s*```$", re.IGNORECASE)
+
+# Explanation requests that arrive within MAX_WAIT_MS of each other share one completion
+LLM_MAX_BATCH = 8
+LLM_MAX_WAIT_MS = 25
+
 
 class LLMSettings(BaseSettings):
     model_config = SettingsConfigDict(env_file=("backend/.env", ".env"), extra="ignore")
@@ -48,10 +88,7 @@ class LLMService:
         if not text:
             return None
 
-        cleaned = text.strip()
-        cleaned = re.sub(r"^```json\s*", "", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"^```\s*", "", cleaned)
-        cleaned = re.sub(r"\s*```$", "", cleaned)
+        cleaned = _JSON_FENCE_RE.sub("", text.strip())
 
         try:
             return json.loads(cleaned)
@@ -86,7 +123,22 @@ class LLMService:
             return "\n".join(lines) if lines else fallback
         return str(value)
 
-    def explain_violations(self, product_data: dict, violations: list[dict], clauses: list[str]) -> dict:
+    def _parse_json_array(self, text: str) -> list | None:
+        if not text:
+            return None
+
+        start = text.find("[")
+        end = text.rfind("]")
+        if start == -1 or end <= start:
+            return None
+        try:
+            parsed = json.loads(text[start : end + 1])
+        except Exception:
+            return None
+        return parsed if isinstance(parsed, list) else None
+
+    def _static_result(self, violations: list[dict]) -> dict | None:
+        """Result for requests that never reach the model, or None when a completion is needed"""
         if not violations:
             return {
                 "explanation": "No legal metrology violations detected.",
@@ -100,6 +152,53 @@ class LLMService:
                 "suggested_correction": "Set GROQ_API_KEY to enable AI-generated corrections; meanwhile, fix missing mandatory declarations.",
                 "risk_summary": "Potential compliance risk exists due to reported rule violations.",
             }
+        return None
+
+    def _unavailable_result(self) -> dict:
+        """Result when the completion request itself fails"""
+        return {
+            "explanation": "Automated explanation unavailable. Please verify missing legal declarations.",
+            "suggested_correction": "Add missing mandatory declarations per Packaged Commodities Rules.",
+            "risk_summary": "Risk exists due to unresolved compliance issues.",
+        }
+
+    def _complete(self, prompt: str) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            temperature=0.2,
+            messages=[
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT,
+                },
+                {
+                    "role": "user",
+                    "content": prompt,
+                },
+            ],
+        )
+        return response.choices[0].message.content if response.choices else ""
+
+    def _format_result(self, parsed: dict) -> dict:
+        return {
+            "explanation": self._format_section(
+                parsed.get("explanation"),
+                "Compliance issues detected. Please review mandatory declarations.",
+            ),
+            "suggested_correction": self._format_section(
+                parsed.get("suggested_correction"),
+                "Review output and update missing/invalid fields.",
+            ),
+            "risk_summary": self._format_section(
+                parsed.get("risk_summary"),
+                "Moderate to high risk based on listed violations.",
+            ),
+        }
+
+    def explain_violations(self, product_data: dict, violations: list[dict], clauses: list[str]) -> dict:
+        static = self._static_result(violations)
+        if static is not None:
+            return static
 
         prompt = PROMPT_TEMPLATE.format(
             product_data=product_data,
@@ -108,38 +207,11 @@ class LLMService:
         )
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                temperature=0.2,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a legal metrology compliance assistant for Indian packaged commodities.",
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    },
-                ],
-            )
-            text = response.choices[0].message.content if response.choices else ""
+            text = self._complete(prompt)
 
             parsed = self._parse_json_payload(text)
             if parsed:
-                return {
-                    "explanation": self._format_section(
-                        parsed.get("explanation"),
-                        "Compliance issues detected. Please review mandatory declarations.",
-                    ),
-                    "suggested_correction": self._format_section(
-                        parsed.get("suggested_correction"),
-                        "Review output and update missing/invalid fields.",
-                    ),
-                    "risk_summary": self._format_section(
-                        parsed.get("risk_summary"),
-                        "Moderate to high risk based on listed violations.",
-                    ),
-                }
+                return self._format_result(parsed)
 
             return {
                 "explanation": (text or "No model explanation returned.").replace("```json", "").replace("```", "").strip(),
@@ -147,8 +219,118 @@ class LLMService:
                 "risk_summary": "Moderate to high risk based on listed violations.",
             }
         except Exception:
-            return {
-                "explanation": "Automated explanation unavailable. Please verify missing legal declarations.",
-                "suggested_correction": "Add missing mandatory declarations per Packaged Commodities Rules.",
-                "risk_summary": "Risk exists due to unresolved compliance issues.",
-            }
+            return self._unavailable_result()
+
+    def explain_violations_batch(self, requests: list[tuple[dict, list[dict], list[str]]]) -> list[dict]:
+        """
+        Explain several products with a single completion.
+
+        Items the model drops or returns malformed are retried concurrently
+        through explain_violations, so every request gets a result. If the
+        batched request itself fails (e.g. rate limited), the pending items
+        get the unavailable result instead of N more requests.
+        """
+        results: list[dict | None] = [self._static_result(violations) for _, violations, _ in requests]
+        pending = [index for index, result in enumerate(results) if result is None]
+
+        if len(pending) > 1:
+            items = "\n".join(
+                BATCH_ITEM_TEMPLATE.format(
+                    index=position + 1,
+                    product_data=requests[index][0],
+                    violations=requests[index][1],
+                    clauses=requests[index][2],
+                )
+                for position, index in enumerate(pending)
+            )
+            try:
+                text = self._complete(BATCH_PROMPT_TEMPLATE.format(items=items, count=len(pending)))
+            except Exception:
+                for index in pending:
+                    results[index] = self._unavailable_result()
+                return results
+            parsed = self._parse_json_array(text)
+            if parsed is not None and len(parsed) == len(pending):
+                for index, item in zip(pending, parsed):
+                    if isinstance(item, dict) and item:
+                        results[index] = self._format_result(item)
+
+        retry = [index for index, result in enumerate(results) if result is None]
+        if len(retry) == 1:
+            results[retry[0]] = self.explain_violations(*requests[retry[0]])
+        elif retry:
+            with ThreadPoolExecutor(max_workers=len(retry)) as executor:
+                retried = executor.map(lambda index: self.explain_violations(*requests[index]), retry)
+                for index, result in zip(retry, retried):
+                    results[index] = result
+        return results
+
+
+class BatchingLLMClient:
+    """
+    Coalesces concurrent explain_violations calls into batched completions.
+
+    Requests are queued and flushed when LLM_MAX_BATCH have accumulated or
+    LLM_MAX_WAIT_MS has passed since the first one, whichever comes first.
+    """
+
+    def __init__(self, llm_service: LLMService, max_batch: int = LLM_MAX_BATCH, max_wait_ms: float = LLM_MAX_WAIT_MS) -> None:
+        self.llm_service = llm_service
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        # The queue and worker are bound to the loop they were created on
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._spawn(self._collect(self._queue))
+        return self._queue
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def explain(self, product_data: dict, violations: list[dict], clauses: list[str]) -> dict:
+        static = self.llm_service._static_result(violations)
+        if static is not None:
+            return static
+
+        future = asyncio.get_running_loop().create_future()
+        await self._ensure_worker().put(((product_data, violations, clauses), future))
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Dispatch without waiting so the next batch can fill while this one is in flight
+            self._spawn(self._dispatch(batch))
+
+    async def _dispatch(self, batch: list) -> None:
+        try:
+            results = await asyncio.to_thread(
+                self.llm_service.explain_violations_batch, [request for request, _ in batch]
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
@@ -2,32 +2,39 @@ import re
 
 from backend.models import ExtractedFields
 
+_MRP_RE = re.compile(r"(?:MRP|M\.R\.P\.)\s*[:₹Rs\. ]*\s*(\d+[\.,]?\d*)", re.IGNORECASE)
+_QTY_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(kg|g|gram|grams|ml|l|litre|litres)", re.IGNORECASE)
+_MFR_RE = re.compile(r"Manufacturer\s*[:\-]\s*([A-Za-z0-9 ,.&-]+)", re.IGNORECASE)
+_COUNTRY_RE = re.compile(r"(?:Country of Origin|Made in)\s*[:\-]?\s*([A-Za-z ]+)", re.IGNORECASE)
+
+# Quantity unit (as matched by _QTY_RE, lowercased) -> (multiplier, normalized unit)
+_QTY_UNITS = {
+    "kg": (1000, "grams"),
+    "g": (1, "grams"),
+    "gram": (1, "grams"),
+    "grams": (1, "grams"),
+    "l": (1000, "ml"),
+    "litre": (1000, "ml"),
+    "litres": (1000, "ml"),
+    "ml": (1, "ml"),
+}
+
 
 class NLPService:
     def extract_and_normalize(self, text: str) -> ExtractedFields:
         data = ExtractedFields()
 
-        mrp_match = re.search(r"(?:MRP|M\.R\.P\.)\s*[:₹Rs\. ]*\s*(\d+[\.,]?\d*)", text, re.IGNORECASE)
-        qty_match = re.search(r"(\d+(?:\.\d+)?)\s*(kg|g|gram|grams|ml|l|litre|litres)", text, re.IGNORECASE)
-        manufacturer_match = re.search(r"Manufacturer\s*[:\-]\s*([A-Za-z0-9 ,.&-]+)", text, re.IGNORECASE)
-        country_match = re.search(r"(?:Country of Origin|Made in)\s*[:\-]?\s*([A-Za-z ]+)", text, re.IGNORECASE)
+        mrp_match = _MRP_RE.search(text)
+        qty_match = _QTY_RE.search(text)
+        manufacturer_match = _MFR_RE.search(text)
+        country_match = _COUNTRY_RE.search(text)
 
         if mrp_match:
             data.mrp = f"INR {mrp_match.group(1).replace(',', '')}"
 
         if qty_match:
-            value = float(qty_match.group(1))
-            unit = qty_match.group(2).lower()
-            if unit in {"kg"}:
-                value *= 1000
-                normalized_unit = "grams"
-            elif unit in {"g", "gram", "grams"}:
-                normalized_unit = "grams"
-            elif unit in {"l", "litre", "litres"}:
-                value *= 1000
-                normalized_unit = "ml"
-            else:
-                normalized_unit = "ml"
+            factor, normalized_unit = _QTY_UNITS[qty_match.group(2).lower()]
+            value = float(qty_match.group(1)) * factor
             data.quantity = f"{int(value) if value.is_integer() else value} {normalized_unit}"
 
         if manufacturer_match:
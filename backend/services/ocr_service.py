@@ -1,4 +1,5 @@
 import re
+import functools
 import logging
 import os
 import shutil
@@ -11,6 +12,10 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Longest image side handed to Tesseract; larger product shots carry no extra
+# legible detail and only slow recognition down
+MAX_OCR_DIMENSION = 2000
+
 # Common Tesseract installation paths on Windows
 WINDOWS_TESSERACT_PATHS = [
     r"C:\Program Files\Tesseract-OCR\tesseract.exe",
@@ -20,8 +25,9 @@ WINDOWS_TESSERACT_PATHS = [
 ]
 
 
+@functools.cache
 def find_tesseract_path() -> Optional[str]:
-    """Auto-detect Tesseract installation path."""
+    """Auto-detect Tesseract installation path (probed once per process)."""
     # First check if it's in PATH
     tesseract_in_path = shutil.which("tesseract")
     if tesseract_in_path:
@@ -62,9 +68,11 @@ class OCRService:
     def _preprocess_image(self, image: Image.Image) -> Image.Image:
         """Preprocess image to improve OCR accuracy"""
         try:
-            # Convert to RGB if needed
-            if image.mode != "RGB":
+            # Convert to grayscale first so every later step touches one channel
+            if image.mode not in ("L", "RGB"):
                 image = image.convert("RGB")
+            if image.mode != "L":
+                image = ImageOps.grayscale(image)
             
             # Resize if too small (improves OCR accuracy)
             width, height = image.size
@@ -72,9 +80,8 @@ class OCRService:
                 scale_factor = max(300 / width, 300 / height)
                 new_size = (int(width * scale_factor), int(height * scale_factor))
                 image = image.resize(new_size, Image.Resampling.LANCZOS)
-            
-            # Convert to grayscale
-            image = ImageOps.grayscale(image)
+            elif max(width, height) > MAX_OCR_DIMENSION:
+                image.thumbnail((MAX_OCR_DIMENSION, MAX_OCR_DIMENSION), Image.Resampling.LANCZOS)
             
             # Enhance contrast
             enhancer = ImageEnhance.Contrast(image)
@@ -96,6 +103,15 @@ class OCRService:
     def extract_text(self, image_bytes: bytes) -> str:
         try:
             image = Image.open(BytesIO(image_bytes))
+            long_side = max(image.size)
+            if long_side > MAX_OCR_DIMENSION:
+                # JPEGs decode straight to luma at a reduced DCT scale (1/2..1/8) that
+                # keeps the long side at or above MAX_OCR_DIMENSION; other formats
+                # ignore the draft request
+                image.draft("L", (
+                    max(1, image.width * MAX_OCR_DIMENSION // long_side),
+                    max(1, image.height * MAX_OCR_DIMENSION // long_side),
+                ))
         except Exception as e:
             logger.error(f"Error opening image: {e}")
             return ""
@@ -1,54 +1,114 @@
 import csv
+import re
 from io import BytesIO, StringIO
+from typing import AsyncIterator
 
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 
+from backend.cache import cached
 from backend.database import db_client
-from backend.models import ComplianceResult
+from backend.models import ComplianceResult, URLAuditResult
+from backend.services.category_audit_service import tag_inferred_category
+
+CSV_EXPORT_FIELDS = ["product_id", "seller_id", "product_name", "score", "risk_level", "created_at"]
 
 
 class ReportingService:
     async def save_result(self, result: ComplianceResult) -> None:
-        await db_client.save_report(result.model_dump(mode="json"))
+        await db_client.save_report(tag_inferred_category(result.model_dump(mode="json")))
+
+    async def save_many(self, results: list[ComplianceResult | URLAuditResult]) -> None:
+        await db_client.save_many([tag_inferred_category(result.model_dump(mode="json")) for result in results])
 
     async def list_reports(self, risk_level: str | None = None) -> list[dict]:
-        reports = await db_client.get_reports()
+        reports = await db_client.get_reports_summary()
         if risk_level:
             reports = [item for item in reports if item.get("risk_level") == risk_level]
         return reports
 
-    async def get_product(self, product_id: str) -> dict | None:
-        return await db_client.get_product(product_id)
+    async def search(
+        self,
+        risk_level: str | None = None,
+        category: str | None = None,
+        min_score: int | None = None,
+        max_score: int | None = None,
+        seller_id: str | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[int, list[dict]]:
+        clauses: list[dict] = []
+        if risk_level:
+            clauses.append({"risk_level": risk_level})
+        if seller_id:
+            clauses.append({"seller_id": seller_id})
 
-    async def export_csv(self) -> str:
-        reports = await self.list_reports()
-        buffer = StringIO()
-        writer = csv.DictWriter(
-            buffer,
-            fieldnames=[
-                "product_id",
-                "seller_id",
-                "product_name",
-                "score",
-                "risk_level",
-                "created_at",
-            ],
-        )
-        writer.writeheader()
-        for report in reports:
-            writer.writerow(
+        # URL audits store compliance_score, product scans store score
+        score_range = {}
+        if min_score is not None:
+            score_range["$gte"] = min_score
+        if max_score is not None:
+            score_range["$lte"] = max_score
+        if score_range:
+            clauses.append(
                 {
-                    "product_id": report.get("product_id"),
-                    "seller_id": report.get("seller_id"),
-                    "product_name": report.get("product_name"),
-                    "score": report.get("score"),
-                    "risk_level": report.get("risk_level"),
-                    "created_at": report.get("created_at"),
+                    "$or": [
+                        {"compliance_score": score_range},
+                        {"compliance_score": {"$exists": False}, "score": score_range},
+                    ]
                 }
             )
-        return buffer.getvalue()
 
+        # created_at is stored as an ISO-8601 string, so range checks compare lexicographically
+        date_range = {}
+        if date_from:
+            date_range["$gte"] = date_from
+        if date_to:
+            date_range["$lte"] = date_to
+        if date_range:
+            clauses.append({"created_at": date_range})
+
+        if category:
+            pattern = {"$regex": re.escape(category), "$options": "i"}
+            no_title = {"$or": [{"scraped_data.title": None}, {"scraped_data.title": ""}]}
+            # Substring of the title, else of the product name when there is no title;
+            # the inferred category bucket (e.g. "cosmetics") also matches
+            clauses.append(
+                {
+                    "$or": [
+                        {"scraped_data.title": pattern},
+                        {**no_title, "product_name": pattern},
+                        {"inferred_category": pattern},
+                    ]
+                }
+            )
+
+        query = {"$and": clauses} if clauses else {}
+        return await db_client.search_reports(query, limit=limit, offset=offset)
+
+    async def get_product(self, product_id: str) -> dict | None:
+        return await db_client.get_product(product_id)
+
+    async def iter_csv_rows(self) -> AsyncIterator[str]:
+        """Yield the CSV export row by row straight from the database cursor."""
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+
+        def drain() -> str:
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return chunk
+
+        writer.writerow(CSV_EXPORT_FIELDS)
+        yield drain()
+        async for report in db_client.iter_reports(CSV_EXPORT_FIELDS):
+            writer.writerow([report.get(field) for field in CSV_EXPORT_FIELDS])
+            yield drain()
+
+    @cached(ttl=60, key=lambda self: "analytics:dashboard_stats")
     async def get_dashboard_stats(self) -> dict:
         reports = await self.list_reports()
         total_audited = len(reports)
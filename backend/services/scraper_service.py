@@ -2,18 +2,18 @@ from urllib.parse import urljoin
 import re
 import logging
 
-import requests
 from bs4 import BeautifulSoup
 from requests import exceptions as request_exceptions
 
 from backend.models import ScrapedProductData
+from backend.rate_limit import get_with_backoff, pooled_session
 
 logger = logging.getLogger(__name__)
 
 
 class ScraperService:
     def __init__(self) -> None:
-        self.session = requests.Session()
+        self.session = pooled_session()
         self.session.headers.update(
             {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -579,9 +579,9 @@ class ScraperService:
     def fetch_product_data(self, url: str) -> ScrapedProductData:
         """Fetch and extract product data from e-commerce URL."""
         try:
-            response = self.session.get(url, timeout=30)
+            response = get_with_backoff(self.session, url, timeout=30)
         except request_exceptions.SSLError:
-            response = self.session.get(url, timeout=30, verify=False)
+            response = get_with_backoff(self.session, url, timeout=30, verify=False)
         response.raise_for_status()
 
         # Log response status
@@ -29,33 +29,30 @@ class ImagePreprocessor:
     
     def load_image(self, image_bytes: bytes) -> np.ndarray:
         """Load image from bytes to OpenCV format."""
+        # Decode straight into an OpenCV array: grayscale stays single-channel,
+        # colour (including palette/alpha images) comes back as 8-bit BGR
+        nparr = np.frombuffer(image_bytes, np.uint8)
+        image = cv2.imdecode(nparr, cv2.IMREAD_ANYCOLOR)
+        if image is not None:
+            return image
+        
         try:
-            # First try with PIL for wider format support
+            # Fall back to PIL for formats OpenCV cannot decode
             pil_image = Image.open(io.BytesIO(image_bytes))
             
             # Convert to RGB if necessary
-            if pil_image.mode == "RGBA":
-                pil_image = pil_image.convert("RGB")
-            elif pil_image.mode == "P":
-                pil_image = pil_image.convert("RGB")
-            elif pil_image.mode == "L":
+            if pil_image.mode == "L":
                 # Already grayscale
                 return np.array(pil_image)
-            
-            # Convert to numpy array (RGB)
-            image = np.array(pil_image)
+            if pil_image.mode != "RGB":
+                pil_image = pil_image.convert("RGB")
             
             # Convert RGB to BGR for OpenCV
-            if len(image.shape) == 3:
-                image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-            
-            return image
+            return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
         
         except Exception as e:
             logger.error(f"Failed to load image: {e}")
-            # Fallback to OpenCV direct decode
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            return None
     
     def to_bytes(self, image: np.ndarray, format: str = "PNG") -> bytes:
         """Convert OpenCV image to bytes."""